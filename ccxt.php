@@ -142,6 +142,7 @@ require_once PATH_TO_WS_CCXT . 'Future.php';
 require_once PATH_TO_WS_CCXT . 'Client.php';
 require_once PATH_TO_WS_CCXT . 'OrderBook.php';
 require_once PATH_TO_WS_CCXT . 'OrderBookSide.php';
+require_once PATH_TO_WS_CCXT . 'OrderBookChecksum.php';
 require_once PATH_TO_WS_CCXT . 'BaseCache.php';
 require_once PATH_TO_WS_CCXT . 'ArrayCache.php';
 require_once PATH_TO_WS_CCXT . 'ArrayCacheByTimestamp.php';
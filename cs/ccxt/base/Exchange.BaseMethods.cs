@@ -1493,42 +1493,8 @@ public partial class Exchange
 
     public virtual object setMarkets(object markets, object currencies = null)
     {
-        object values = new List<object>() {};
-        this.markets_by_id = new Dictionary<string, object>() {};
-        // handle marketId conflicts
-        // we insert spot markets first
-        object marketValues = this.sortBy(this.toArray(markets), "spot", true, true);
-        for (object i = 0; isLessThan(i, getArrayLength(marketValues)); postFixIncrement(ref i))
-        {
-            object value = getValue(marketValues, i);
-            if (isTrue(inOp(this.markets_by_id, getValue(value, "id"))))
-            {
-                ((IList<object>)((object)getValue(this.markets_by_id, getValue(value, "id")))).Add(value);
-            } else
-            {
-                ((IDictionary<string,object>)this.markets_by_id)[(string)getValue(value, "id")] = ((object)new List<object>() {value});
-            }
-            object market = this.deepExtend(this.safeMarketStructure(), new Dictionary<string, object>() {
-                { "precision", this.precision },
-                { "limits", this.limits },
-            }, getValue(this.fees, "trading"), value);
-            if (isTrue(getValue(market, "linear")))
-            {
-                ((IDictionary<string,object>)market)["subType"] = "linear";
-            } else if (isTrue(getValue(market, "inverse")))
-            {
-                ((IDictionary<string,object>)market)["subType"] = "inverse";
-            } else
-            {
-                ((IDictionary<string,object>)market)["subType"] = null;
-            }
-            ((IList<object>)values).Add(market);
-        }
-        this.markets = ((object)this.indexBy(values, "symbol"));
-        object marketsSortedBySymbol = this.keysort(this.markets);
-        object marketsSortedById = this.keysort(this.markets_by_id);
-        this.symbols = new List<object>(((IDictionary<string,object>)marketsSortedBySymbol).Keys);
-        this.ids = new List<object>(((IDictionary<string,object>)marketsSortedById).Keys);
+        // the markets and the indexes of the markets are built by indexMarkets ()
+        object values = this.indexMarkets(markets);
         if (isTrue(!isEqual(currencies, null)))
         {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
@@ -1537,10 +1503,10 @@ public partial class Exchange
         {
             object baseCurrencies = new List<object>() {};
             object quoteCurrencies = new List<object>() {};
+            object defaultCurrencyPrecision = ((bool) isTrue((isEqual(this.precisionMode, DECIMAL_PLACES)))) ? 8 : this.parseNumber("1e-8");
             for (object i = 0; isLessThan(i, getArrayLength(values)); postFixIncrement(ref i))
             {
                 object market = getValue(values, i);
-                object defaultCurrencyPrecision = ((bool) isTrue((isEqual(this.precisionMode, DECIMAL_PLACES)))) ? 8 : this.parseNumber("1e-8");
                 object marketPrecision = this.safeDict(market, "precision", new Dictionary<string, object>() {});
                 if (isTrue(inOp(market, "base")))
                 {
@@ -3292,7 +3258,7 @@ public partial class Exchange
         if (isTrue(this.enableRateLimit))
         {
             object cost = this.calculateRateLimiterCost(api, method, path, parameters, config);
-            await this.throttle(cost);
+            await this.throttle(cost, this.rateLimitDebits(api, path, method, cost, config));
         }
         this.lastRestRequestTimestamp = this.milliseconds();
         object request = this.sign(path, api, method, parameters, headers, body);
@@ -3817,33 +3783,37 @@ public partial class Exchange
     public virtual object handleOptionAndParams(object parameters, object methodName, object optionName, object defaultValue = null)
     {
         // This method can be used to obtain method specific properties, i.e: this.handleOptionAndParams (params, 'fetchPosition', 'marginMode', 'isolated')
-        object defaultOptionName = add("default", this.capitalize(optionName)); // we also need to check the 'defaultXyzWhatever'
-        // check if params contain the key
-        object value = this.safeValue2(parameters, optionName, defaultOptionName);
-        if (isTrue(!isEqual(value, null)))
+        // the options are looked up by resolveOption (), we also need to check the 'defaultXyzWhatever'
+        object defaultOptionName = null;
+        object value = null;
+        var defaultOptionNamevalueVariable = this.resolveOption(methodName, optionName);
+        defaultOptionName = ((IList<object>)defaultOptionNamevalueVariable)[0];
+        value = ((IList<object>)defaultOptionNamevalueVariable)[1];
+        if (isTrue(this.isEmpty(parameters)))
         {
-            parameters = this.omit(parameters, new List<object>() {optionName, defaultOptionName});
+            parameters = new Dictionary<string, object>() {};
         } else
         {
-            // handle routed methods like "watchTrades > watchTradesForSymbols" (or "watchTicker > watchTickers")
-            var methodNameparametersVariable = this.handleParamString(parameters, "callerMethodName", methodName);
-            methodName = ((IList<object>)methodNameparametersVariable)[0];
-            parameters = ((IList<object>)methodNameparametersVariable)[1];
-            // check if exchange has properties for this method
-            object exchangeWideMethodOptions = this.safeValue(this.options, methodName);
-            if (isTrue(!isEqual(exchangeWideMethodOptions, null)))
-            {
-                // check if the option is defined inside this method's props
-                value = this.safeValue2(exchangeWideMethodOptions, optionName, defaultOptionName);
-            }
-            if (isTrue(isEqual(value, null)))
+            // check if params contain the key
+            object paramsValue = this.safeValue2(parameters, optionName, defaultOptionName);
+            if (isTrue(!isEqual(paramsValue, null)))
             {
-                // if it's still undefined, check if global exchange-wide option exists
-                value = this.safeValue2(this.options, optionName, defaultOptionName);
+                return new List<object>() {paramsValue, this.omit(parameters, new List<object>() {optionName, defaultOptionName})};
+            }
+            // handle routed methods like "watchTrades > watchTradesForSymbols" (or "watchTicker > watchTickers")
+            object callerMethodName = null;
+            var callerMethodNameparametersVariable = this.handleParamString(parameters, "callerMethodName", methodName);
+            callerMethodName = ((IList<object>)callerMethodNameparametersVariable)[0];
+            parameters = ((IList<object>)callerMethodNameparametersVariable)[1];
+            if (isTrue(!isEqual(callerMethodName, methodName)))
+            {
+                var defaultOptionNamevalueVariable1 = this.resolveOption(callerMethodName, optionName);
+                defaultOptionName = ((IList<object>)defaultOptionNamevalueVariable1)[0];
+                value = ((IList<object>)defaultOptionNamevalueVariable1)[1];
             }
-            // if it's still undefined, use the default value
-            value = ((bool) isTrue((!isEqual(value, null)))) ? value : defaultValue;
         }
+        // if it's still undefined, use the default value
+        value = ((bool) isTrue((!isEqual(value, null)))) ? value : defaultValue;
         return new List<object>() {value, parameters};
     }
 
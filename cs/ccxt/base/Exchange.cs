@@ -553,11 +553,17 @@ public partial class Exchange
         return amount * scale;
     }
 
-    public async Task throttle(object cost)
+    public async Task throttle(object cost, object debits = null)
     {
         await (await this.throttler.throttle(cost));
     }
 
+    public virtual object rateLimitDebits(object api, object path, object method, object cost, object config = null)
+    {
+        // what a request takes from the named rate limit buckets, null without them
+        return null;
+    }
+
     public void initRestLimiter()
     {
         if (this.id != null && this.rateLimit == -1)
@@ -911,6 +917,68 @@ public partial class Exchange
     {
         return new System.Collections.Concurrent.ConcurrentDictionary<string, object>();
     }
+
+    public virtual object resolveOption(object methodName, object optionName)
+    {
+        // [ defaultOptionName, value ] of an option, from the options of the method or the exchange-wide ones
+        object defaultOptionName = add("default", this.capitalize(optionName));
+        object value = null;
+        // check if exchange has properties for this method
+        object exchangeWideMethodOptions = this.safeValue(this.options, methodName);
+        if (exchangeWideMethodOptions != null)
+        {
+            // check if the option is defined inside this method's props
+            value = this.safeValue2(exchangeWideMethodOptions, optionName, defaultOptionName);
+        }
+        if (value == null)
+        {
+            // if it's still undefined, check if global exchange-wide option exists
+            value = this.safeValue2(this.options, optionName, defaultOptionName);
+        }
+        return new List<object>() {defaultOptionName, value};
+    }
+
+    public virtual object indexMarkets(object markets)
+    {
+        // sets markets, markets_by_id, symbols and ids, returns the market structures for setMarkets ()
+        object values = new List<object>() {};
+        this.markets_by_id = new Dictionary<string, object>() {};
+        // handle marketId conflicts
+        // we insert spot markets first
+        object marketValues = this.sortBy(this.toArray(markets), "spot", true, true);
+        for (object i = 0; isLessThan(i, getArrayLength(marketValues)); postFixIncrement(ref i))
+        {
+            object value = getValue(marketValues, i);
+            if (isTrue(inOp(this.markets_by_id, getValue(value, "id"))))
+            {
+                ((IList<object>)((object)getValue(this.markets_by_id, getValue(value, "id")))).Add(value);
+            } else
+            {
+                ((IDictionary<string,object>)this.markets_by_id)[(string)getValue(value, "id")] = ((object)new List<object>() {value});
+            }
+            object market = this.deepExtend(this.safeMarketStructure(), new Dictionary<string, object>() {
+                { "precision", this.precision },
+                { "limits", this.limits },
+            }, getValue(this.fees, "trading"), value);
+            if (isTrue(getValue(market, "linear")))
+            {
+                ((IDictionary<string,object>)market)["subType"] = "linear";
+            } else if (isTrue(getValue(market, "inverse")))
+            {
+                ((IDictionary<string,object>)market)["subType"] = "inverse";
+            } else
+            {
+                ((IDictionary<string,object>)market)["subType"] = null;
+            }
+            ((IList<object>)values).Add(market);
+        }
+        this.markets = ((object)this.indexBy(values, "symbol"));
+        object marketsSortedBySymbol = this.keysort(this.markets);
+        object marketsSortedById = this.keysort(this.markets_by_id);
+        this.symbols = new List<object>(((IDictionary<string,object>)marketsSortedBySymbol).Keys);
+        this.ids = new List<object>(((IDictionary<string,object>)marketsSortedById).Keys);
+        return values;
+    }
     public class DynamicInvoker
     {
         public static object InvokeMethod(object action, object[] parameters)
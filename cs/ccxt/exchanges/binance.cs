@@ -12,6 +12,81 @@ public partial class binance : Exchange
             { "name", "Binance" },
             { "countries", new List<object>() {"JP", "MT"} },
             { "rateLimit", 50 },
+            { "rateLimitBuckets", new Dictionary<string, object>() {
+                { "weight", new Dictionary<string, object>() {
+                    { "limit", 6000 },
+                    { "interval", 60000 },
+                    { "capacity", 100 },
+                    { "apis", new List<object>() {"public", "private"} },
+                    { "scale", 5 },
+                    { "header", "x-mbx-used-weight-1m" },
+                } },
+                { "sapi", new Dictionary<string, object>() {
+                    { "limit", 12000 },
+                    { "interval", 60000 },
+                    { "capacity", 200 },
+                    { "apis", new List<object>() {"sapi", "sapiV2", "sapiV3", "sapiV4"} },
+                    { "scale", 10 },
+                    { "header", "x-sapi-used-ip-weight-1m" },
+                } },
+                { "fapi", new Dictionary<string, object>() {
+                    { "limit", 2400 },
+                    { "interval", 60000 },
+                    { "capacity", 40 },
+                    { "apis", new List<object>() {"fapiPublic", "fapiPublicV2", "fapiPrivate", "fapiPrivateV2"} },
+                    { "header", "x-mbx-used-weight-1m" },
+                } },
+                { "dapi", new Dictionary<string, object>() {
+                    { "limit", 2400 },
+                    { "interval", 60000 },
+                    { "capacity", 40 },
+                    { "apis", new List<object>() {"dapiPublic", "dapiPrivate", "dapiPrivateV2"} },
+                    { "header", "x-mbx-used-weight-1m" },
+                } },
+                { "eapi", new Dictionary<string, object>() {
+                    { "limit", 1200 },
+                    { "interval", 60000 },
+                    { "capacity", 20 },
+                    { "apis", new List<object>() {"eapiPublic", "eapiPrivate"} },
+                    { "header", "x-mbx-used-weight-1m" },
+                } },
+                { "papi", new Dictionary<string, object>() {
+                    { "limit", 6000 },
+                    { "interval", 60000 },
+                    { "capacity", 100 },
+                    { "apis", new List<object>() {"papi"} },
+                    { "header", "x-mbx-used-weight-1m" },
+                } },
+                { "orders", new Dictionary<string, object>() {
+                    { "limit", 100 },
+                    { "interval", 10000 },
+                    { "capacity", 10 },
+                    { "apis", new List<object>() {"private"} },
+                    { "paths", new List<object>() {"order", "order/oco", "orderList/oco", "orderList/oto", "orderList/otoco", "sor/order", "order/cancelReplace"} },
+                    { "methods", new List<object>() {"POST"} },
+                    { "scale", 5 },
+                } },
+            } },
+                { "sapi", new Dictionary<string, object>() {
+                    { "limit", 12000 },
+                    { "interval", 60000 },
+                    { "apis", new List<object>() {"sapi", "sapiV2", "sapiV3", "sapiV4"} },
+                    { "scale", 10 },
+                } },
+                { "fapi", new Dictionary<string, object>() {
+                    { "limit", 2400 },
+                    { "interval", 60000 },
+                    { "apis", new List<object>() {"fapiPublic", "fapiPublicV2", "fapiPrivate", "fapiPrivateV2"} },
+                } },
+                { "orders", new Dictionary<string, object>() {
+                    { "limit", 100 },
+                    { "interval", 10000 },
+                    { "apis", new List<object>() {"private"} },
+                    { "paths", new List<object>() {"order", "order/oco", "orderList/oco", "orderList/oto", "orderList/otoco", "sor/order", "order/cancelReplace"} },
+                    { "methods", new List<object>() {"POST"} },
+                    { "scale", 5 },
+                } },
+            } },
             { "certified", true },
             { "pro", true },
             { "has", new Dictionary<string, object>() {
@@ -13,6 +13,7 @@ public partial class binanceus : binance
             { "countries", new List<object>() {"US"} },
             { "hostname", "binance.us" },
             { "rateLimit", 50 },
+            { "rateLimitBuckets", null },
             { "certified", false },
             { "pro", true },
             { "urls", new Dictionary<string, object>() {
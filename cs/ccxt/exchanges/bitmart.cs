@@ -3588,7 +3588,9 @@ public partial class bitmart : Exchange
             if (isTrue(!isEqual(network, null)))
             {
                 ((IDictionary<string,object>)request)["currency"] = add(((IDictionary<string,object>)request)["currency"], add("-", network)); // when network the currency need to be changed to currency + '-' + network https://developer-pro.bitmart.com/en/account/withdraw_apply.html on the end of page
-                ((IDictionary<string,object>)currency)["code"] = getValue(request, "currency"); // update currency code to filter
+                currency = this.extend(currency, new Dictionary<string, object>() {
+                    { "code", getValue(request, "currency") },
+                }); // update currency code to filter, on a copy of the shared currency
                 parameters = this.omit(parameters, "network");
             }
         }
@@ -517,7 +517,10 @@ public partial class coinbaseinternational : Exchange
         //        ....
         //    ]
         //
-        ((IDictionary<string,object>)currency)["networks"] = this.parseNetworks(rawNetworks);
+        // the currency is replaced, not changed in place, the currencies can be shared with other instances
+        ((IDictionary<string,object>)this.currencies)[(string)code] = this.extend(currency, new Dictionary<string, object>() {
+            { "networks", this.parseNetworks(rawNetworks) },
+        });
     }
 
     public virtual object parseNetworks(object networks, object parameters = null)
@@ -3438,7 +3438,14 @@ public partial class kucoin : Exchange
             object data = this.safeDict(response, "data", new Dictionary<string, object>() {});
             object precision = this.parseNumber(this.parsePrecision(this.safeString(data, "precision")));
             object code = getValue(currency, "code");
-            ((IDictionary<string,object>)getValue(getValue(getValue(this.currencies, code), "networks"), networkCode))["precision"] = precision;
+            // the currency is replaced, not changed in place, the currencies can be shared with other instances
+            object currencyNetworks = this.extend(getValue(getValue(this.currencies, code), "networks"), new Dictionary<string, object>() {});
+            ((IDictionary<string,object>)currencyNetworks)[(string)networkCode] = this.extend(getValue(currencyNetworks, networkCode), new Dictionary<string, object>() {
+                { "precision", precision },
+            });
+            ((IDictionary<string,object>)this.currencies)[(string)code] = this.extend(getValue(this.currencies, code), new Dictionary<string, object>() {
+                { "networks", currencyNetworks },
+            });
         }
     }
 
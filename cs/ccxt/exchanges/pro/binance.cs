@@ -843,10 +843,14 @@ public partial class binance : ccxt.binance
 
     public override void handleDeltas(object bookside, object deltas)
     {
+        // parse the whole side first and apply it in one batch
+        object bidAsks = new List<object>() {};
         for (object i = 0; isLessThan(i, getArrayLength(deltas)); postFixIncrement(ref i))
         {
-            this.handleDelta(bookside, getValue(deltas, i));
+            object delta = getValue(deltas, i);
+            ((IList<object>)bidAsks).Add(new List<object>() {this.safeFloat(delta, 0), this.safeFloat(delta, 1)});
         }
+        (bookside as IOrderBookSide).storeMany(bidAsks);
     }
 
     public virtual object handleOrderBookMessage(WebSocketClient client, object message, object orderbook)
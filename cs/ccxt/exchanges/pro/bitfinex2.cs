@@ -724,31 +724,52 @@ public partial class bitfinex2 : ccxt.bitfinex2
             return;
         }
         object depth = 25; // covers the first 25 bids and asks
-        object stringArray = new List<object>() {};
+        object checksumHelper = this.orderBookChecksum(book, depth);
+        if (!isTrue(callDynamically(checksumHelper, "due", new object[] {})))
+        {
+            return;
+        }
         object bids = getValue(book, "bids");
         object asks = getValue(book, "asks");
-        object prec = this.safeString(subscription, "prec", "P0");
-        object isRaw = (isEqual(prec, "R0"));
-        object idToCheck = ((bool) isTrue(isRaw)) ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
+        // the top levels did not change since the last verified message
+        object localChecksum = callDynamically(checksumHelper, "reuse", new object[] {bids, asks, true});
+        if (isTrue(isEqual(localChecksum, null)))
         {
-            object bid = this.safeValue(bids, i);
-            object ask = this.safeValue(asks, i);
-            if (isTrue(!isEqual(bid, null)))
+            object stringArray = new List<object>() {};
+            object prec = this.safeString(subscription, "prec", "P0");
+            object isRaw = (isEqual(prec, "R0"));
+            // the raw books are keyed by order id, there can be several orders at the same price
+            object idToCheck = ((bool) isTrue(isRaw)) ? 2 : 0;
+            // pepperoni pizza from bitfinex
+            for (object i = 0; isLessThan(i, depth); postFixIncrement(ref i))
             {
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), idToCheck)));
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(bids, i), 1)));
-            }
-            if (isTrue(!isEqual(ask, null)))
-            {
-                ((IList<object>)stringArray).Add(this.numberToString(getValue(getValue(asks, i), idToCheck)));
-                object aski1 = getValue(getValue(asks, i), 1);
-                ((IList<object>)stringArray).Add(this.numberToString(prefixUnaryNeg(ref aski1)));
+                object bid = this.safeValue(bids, i);
+                object ask = this.safeValue(asks, i);
+                if (isTrue(!isEqual(bid, null)))
+                {
+                    object bidStrings = callDynamically(checksumHelper, "cached", new object[] {"bids", getValue(bid, idToCheck), getValue(bid, 1)});
+                    if (isTrue(isEqual(bidStrings, null)))
+                    {
+                        bidStrings = callDynamically(checksumHelper, "store", new object[] {"bids", getValue(bid, idToCheck), getValue(bid, 1), this.numberToString(getValue(bid, idToCheck)), this.numberToString(getValue(bid, 1))});
+                    }
+                    ((IList<object>)stringArray).Add(getValue(bidStrings, 0));
+                    ((IList<object>)stringArray).Add(getValue(bidStrings, 1));
+                }
+                if (isTrue(!isEqual(ask, null)))
+                {
+                    object aski1 = getValue(ask, 1);
+                    object askStrings = callDynamically(checksumHelper, "cached", new object[] {"asks", getValue(ask, idToCheck), aski1});
+                    if (isTrue(isEqual(askStrings, null)))
+                    {
+                        askStrings = callDynamically(checksumHelper, "store", new object[] {"asks", getValue(ask, idToCheck), aski1, this.numberToString(getValue(ask, idToCheck)), this.numberToString(prefixUnaryNeg(ref aski1))});
+                    }
+                    ((IList<object>)stringArray).Add(getValue(askStrings, 0));
+                    ((IList<object>)stringArray).Add(getValue(askStrings, 1));
+                }
             }
+            object payload = String.Join(":", ((IList<object>)stringArray).ToArray());
+            localChecksum = callDynamically(checksumHelper, "crc32", new object[] {payload, true});
         }
-        object payload = String.Join(":", ((IList<object>)stringArray).ToArray());
-        object localChecksum = this.crc32(payload, true);
         object responseChecksum = this.safeInteger(message, 2);
         if (isTrue(!isEqual(responseChecksum, localChecksum)))
         {
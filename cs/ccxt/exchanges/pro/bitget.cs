@@ -582,28 +582,34 @@ public partial class bitget : ccxt.bitget
             ((IDictionary<string,object>)storedOrderBook)["datetime"] = this.iso8601(timestamp);
             object checksum = this.safeBool(this.options, "checksum", true);
             object isSnapshot = isEqual(this.safeString(message, "action"), "snapshot"); // snapshot does not have a checksum
-            if (isTrue(!isTrue(isSnapshot) && isTrue(checksum)))
+            object checksumHelper = this.orderBookChecksum(storedOrderBook, 25);
+            if (isTrue(isTrue(!isTrue(isSnapshot) && isTrue(checksum)) && isTrue(callDynamically(checksumHelper, "due", new object[] {}))))
             {
                 object storedAsks = getValue(storedOrderBook, "asks");
                 object storedBids = getValue(storedOrderBook, "bids");
-                object asksLength = getArrayLength(storedAsks);
-                object bidsLength = getArrayLength(storedBids);
-                object payloadArray = new List<object>() {};
-                for (object i = 0; isLessThan(i, 25); postFixIncrement(ref i))
+                // the top levels did not change since the last verified message
+                object calculatedChecksum = callDynamically(checksumHelper, "reuse", new object[] {storedBids, storedAsks, true});
+                if (isTrue(isEqual(calculatedChecksum, null)))
                 {
-                    if (isTrue(isLessThan(i, bidsLength)))
+                    object asksLength = getArrayLength(storedAsks);
+                    object bidsLength = getArrayLength(storedBids);
+                    object payloadArray = new List<object>() {};
+                    for (object i = 0; isLessThan(i, 25); postFixIncrement(ref i))
                     {
-                        ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedBids, i), 2), 0));
-                        ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedBids, i), 2), 1));
-                    }
-                    if (isTrue(isLessThan(i, asksLength)))
-                    {
-                        ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedAsks, i), 2), 0));
-                        ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedAsks, i), 2), 1));
+                        if (isTrue(isLessThan(i, bidsLength)))
+                        {
+                            ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedBids, i), 2), 0));
+                            ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedBids, i), 2), 1));
+                        }
+                        if (isTrue(isLessThan(i, asksLength)))
+                        {
+                            ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedAsks, i), 2), 0));
+                            ((IList<object>)payloadArray).Add(getValue(getValue(getValue(storedAsks, i), 2), 1));
+                        }
                     }
+                    object payload = String.Join(":", ((IList<object>)payloadArray).ToArray());
+                    calculatedChecksum = callDynamically(checksumHelper, "crc32", new object[] {payload, true});
                 }
-                object payload = String.Join(":", ((IList<object>)payloadArray).ToArray());
-                object calculatedChecksum = this.crc32(payload, true);
                 object responseChecksum = this.safeInteger(rawOrderBook, "checksum");
                 if (isTrue(!isEqual(calculatedChecksum, responseChecksum)))
                 {
@@ -216,28 +216,46 @@ public partial class independentreserve : ccxt.independentreserve
             ((IDictionary<string,object>)orderbook)["datetime"] = this.iso8601(timestamp);
         }
         object checksum = this.handleOption("watchOrderBook", "checksum", true);
-        if (isTrue(isTrue(checksum) && isTrue(receivedSnapshot)))
+        object checksumHelper = this.orderBookChecksum(orderbook, 10);
+        if (isTrue(isTrue(isTrue(checksum) && isTrue(receivedSnapshot)) && isTrue(callDynamically(checksumHelper, "due", new object[] {}))))
         {
             object storedAsks = getValue(orderbook, "asks");
             object storedBids = getValue(orderbook, "bids");
-            object asksLength = getArrayLength(storedAsks);
-            object bidsLength = getArrayLength(storedBids);
-            object payload = "";
-            for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
+            // the top levels did not change since the last verified message
+            object calculatedChecksum = callDynamically(checksumHelper, "reuse", new object[] {storedBids, storedAsks, true});
+            if (isTrue(isEqual(calculatedChecksum, null)))
             {
-                if (isTrue(isLessThan(i, bidsLength)))
+                object asksLength = getArrayLength(storedAsks);
+                object bidsLength = getArrayLength(storedBids);
+                object payload = "";
+                for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
                 {
-                    payload = add(add(payload, this.valueToChecksum(getValue(getValue(storedBids, i), 0))), this.valueToChecksum(getValue(getValue(storedBids, i), 1)));
+                    if (isTrue(isLessThan(i, bidsLength)))
+                    {
+                        object bid = getValue(storedBids, i);
+                        object bidStrings = callDynamically(checksumHelper, "cached", new object[] {"bids", getValue(bid, 0), getValue(bid, 1)});
+                        if (isTrue(isEqual(bidStrings, null)))
+                        {
+                            bidStrings = callDynamically(checksumHelper, "store", new object[] {"bids", getValue(bid, 0), getValue(bid, 1), this.valueToChecksum(getValue(bid, 0)), this.valueToChecksum(getValue(bid, 1))});
+                        }
+                        payload = add(add(payload, getValue(bidStrings, 0)), getValue(bidStrings, 1));
+                    }
                 }
-            }
-            for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
-            {
-                if (isTrue(isLessThan(i, asksLength)))
+                for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
                 {
-                    payload = add(add(payload, this.valueToChecksum(getValue(getValue(storedAsks, i), 0))), this.valueToChecksum(getValue(getValue(storedAsks, i), 1)));
+                    if (isTrue(isLessThan(i, asksLength)))
+                    {
+                        object ask = getValue(storedAsks, i);
+                        object askStrings = callDynamically(checksumHelper, "cached", new object[] {"asks", getValue(ask, 0), getValue(ask, 1)});
+                        if (isTrue(isEqual(askStrings, null)))
+                        {
+                            askStrings = callDynamically(checksumHelper, "store", new object[] {"asks", getValue(ask, 0), getValue(ask, 1), this.valueToChecksum(getValue(ask, 0)), this.valueToChecksum(getValue(ask, 1))});
+                        }
+                        payload = add(add(payload, getValue(askStrings, 0)), getValue(askStrings, 1));
+                    }
                 }
+                calculatedChecksum = callDynamically(checksumHelper, "crc32", new object[] {payload, true});
             }
-            object calculatedChecksum = this.crc32(payload, true);
             object responseChecksum = this.safeInteger(orderBook, "Crc32");
             if (isTrue(!isEqual(calculatedChecksum, responseChecksum)))
             {
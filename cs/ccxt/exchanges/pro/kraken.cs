@@ -826,7 +826,8 @@ public partial class kraken : ccxt.kraken
             // don't remove this line or I will poop on your face
             (orderbook as IOrderBook).limit();
             object checksum = this.handleOption("watchOrderBook", "checksum", true);
-            if (isTrue(checksum))
+            object checksumHelper = this.orderBookChecksum(orderbook, 10);
+            if (isTrue(isTrue(checksum) && isTrue(callDynamically(checksumHelper, "due", new object[] {}))))
             {
                 object priceString = this.safeString(example, 0);
                 object amountString = this.safeString(example, 1);
@@ -834,22 +835,39 @@ public partial class kraken : ccxt.kraken
                 object amountParts = ((string)amountString).Split(new [] {((string)".")}, StringSplitOptions.None).ToList<object>();
                 object priceLength = subtract(((string)getValue(priceParts, 1)).Length, 0);
                 object amountLength = subtract(((string)getValue(amountParts, 1)).Length, 0);
-                object payloadArray = new List<object>() {};
-                if (isTrue(!isEqual(c, null)))
+                // the formatted levels are cached until the number of decimals changes
+                callDynamically(checksumHelper, "track", new object[] {add(add(this.numberToString(priceLength), ":"), this.numberToString(amountLength))});
+                // the top levels did not change since the last verified message
+                object localChecksum = callDynamically(checksumHelper, "reuse", new object[] {storedBids, storedAsks, false});
+                if (isTrue(isEqual(localChecksum, null)))
                 {
-                    for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
+                    object payloadArray = new List<object>() {};
+                    if (isTrue(!isEqual(c, null)))
                     {
-                        object formatted = add(this.formatNumber(getValue(getValue(storedAsks, i), 0), priceLength), this.formatNumber(getValue(getValue(storedAsks, i), 1), amountLength));
-                        ((IList<object>)payloadArray).Add(formatted);
-                    }
-                    for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
-                    {
-                        object formatted = add(this.formatNumber(getValue(getValue(storedBids, i), 0), priceLength), this.formatNumber(getValue(getValue(storedBids, i), 1), amountLength));
-                        ((IList<object>)payloadArray).Add(formatted);
+                        for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
+                        {
+                            object ask = getValue(storedAsks, i);
+                            object askStrings = callDynamically(checksumHelper, "cached", new object[] {"asks", getValue(ask, 0), getValue(ask, 1)});
+                            if (isTrue(isEqual(askStrings, null)))
+                            {
+                                askStrings = callDynamically(checksumHelper, "store", new object[] {"asks", getValue(ask, 0), getValue(ask, 1), this.formatNumber(getValue(ask, 0), priceLength), this.formatNumber(getValue(ask, 1), amountLength)});
+                            }
+                            ((IList<object>)payloadArray).Add(add(getValue(askStrings, 0), getValue(askStrings, 1)));
+                        }
+                        for (object i = 0; isLessThan(i, 10); postFixIncrement(ref i))
+                        {
+                            object bid = getValue(storedBids, i);
+                            object bidStrings = callDynamically(checksumHelper, "cached", new object[] {"bids", getValue(bid, 0), getValue(bid, 1)});
+                            if (isTrue(isEqual(bidStrings, null)))
+                            {
+                                bidStrings = callDynamically(checksumHelper, "store", new object[] {"bids", getValue(bid, 0), getValue(bid, 1), this.formatNumber(getValue(bid, 0), priceLength), this.formatNumber(getValue(bid, 1), amountLength)});
+                            }
+                            ((IList<object>)payloadArray).Add(add(getValue(bidStrings, 0), getValue(bidStrings, 1)));
+                        }
                     }
+                    object payload = String.Join("", ((IList<object>)payloadArray).ToArray());
+                    localChecksum = callDynamically(checksumHelper, "crc32", new object[] {payload, false});
                 }
-                object payload = String.Join("", ((IList<object>)payloadArray).ToArray());
-                object localChecksum = this.crc32(payload, false);
                 if (isTrue(!isEqual(localChecksum, c)))
                 {
                     var error = new ChecksumError(add(add(this.id, " "), this.orderbookChecksumMessage(symbol)));
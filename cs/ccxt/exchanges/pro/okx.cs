@@ -1021,33 +1021,55 @@ public partial class okx : ccxt.okx
         {
             object prevSeqId = this.safeInteger(message, "prevSeqId");
             object nonce = getValue(orderbook, "nonce");
-            object asksLength = getArrayLength(storedAsks);
-            object bidsLength = getArrayLength(storedBids);
-            object payloadArray = new List<object>() {};
-            for (object i = 0; isLessThan(i, 25); postFixIncrement(ref i))
-            {
-                if (isTrue(isLessThan(i, bidsLength)))
-                {
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedBids, i), 0)));
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedBids, i), 1)));
-                }
-                if (isTrue(isLessThan(i, asksLength)))
-                {
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedAsks, i), 0)));
-                    ((IList<object>)payloadArray).Add(this.numberToString(getValue(getValue(storedAsks, i), 1)));
-                }
-            }
-            object payload = String.Join(":", ((IList<object>)payloadArray).ToArray());
-            object responseChecksum = this.safeInteger(message, "checksum");
-            object localChecksum = this.crc32(payload, true);
             object error = null;
             if (isTrue(isTrue(!isEqual(prevSeqId, -1)) && isTrue(!isEqual(nonce, prevSeqId))))
             {
                 error = new InvalidNonce(add(this.id, " watchOrderBook received invalid nonce"));
             }
-            if (isTrue(!isEqual(responseChecksum, localChecksum)))
+            object checksumHelper = this.orderBookChecksum(orderbook, 25);
+            if (isTrue(callDynamically(checksumHelper, "due", new object[] {})))
             {
-                error = new ChecksumError(add(add(this.id, " "), this.orderbookChecksumMessage(symbol)));
+                // the top levels did not change since the last verified message
+                object localChecksum = callDynamically(checksumHelper, "reuse", new object[] {storedBids, storedAsks, true});
+                if (isTrue(isEqual(localChecksum, null)))
+                {
+                    object asksLength = getArrayLength(storedAsks);
+                    object bidsLength = getArrayLength(storedBids);
+                    object payloadArray = new List<object>() {};
+                    for (object i = 0; isLessThan(i, 25); postFixIncrement(ref i))
+                    {
+                        if (isTrue(isLessThan(i, bidsLength)))
+                        {
+                            object bid = getValue(storedBids, i);
+                            // the levels are formatted once per amount
+                            object bidStrings = callDynamically(checksumHelper, "cached", new object[] {"bids", getValue(bid, 0), getValue(bid, 1)});
+                            if (isTrue(isEqual(bidStrings, null)))
+                            {
+                                bidStrings = callDynamically(checksumHelper, "store", new object[] {"bids", getValue(bid, 0), getValue(bid, 1), this.numberToString(getValue(bid, 0)), this.numberToString(getValue(bid, 1))});
+                            }
+                            ((IList<object>)payloadArray).Add(getValue(bidStrings, 0));
+                            ((IList<object>)payloadArray).Add(getValue(bidStrings, 1));
+                        }
+                        if (isTrue(isLessThan(i, asksLength)))
+                        {
+                            object ask = getValue(storedAsks, i);
+                            object askStrings = callDynamically(checksumHelper, "cached", new object[] {"asks", getValue(ask, 0), getValue(ask, 1)});
+                            if (isTrue(isEqual(askStrings, null)))
+                            {
+                                askStrings = callDynamically(checksumHelper, "store", new object[] {"asks", getValue(ask, 0), getValue(ask, 1), this.numberToString(getValue(ask, 0)), this.numberToString(getValue(ask, 1))});
+                            }
+                            ((IList<object>)payloadArray).Add(getValue(askStrings, 0));
+                            ((IList<object>)payloadArray).Add(getValue(askStrings, 1));
+                        }
+                    }
+                    object payload = String.Join(":", ((IList<object>)payloadArray).ToArray());
+                    localChecksum = callDynamically(checksumHelper, "crc32", new object[] {payload, true});
+                }
+                object responseChecksum = this.safeInteger(message, "checksum");
+                if (isTrue(!isEqual(responseChecksum, localChecksum)))
+                {
+                    error = new ChecksumError(add(add(this.id, " "), this.orderbookChecksumMessage(symbol)));
+                }
             }
             if (isTrue(!isEqual(error, null)))
             {
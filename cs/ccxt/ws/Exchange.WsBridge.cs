@@ -22,6 +22,19 @@ public partial class Exchange
         return new ccxt.pro.CountedOrderBook(snapshot, depth);
     }
 
+    public ccxt.pro.OrderBookChecksum orderBookChecksum(object orderbook, object depth = null)
+    {
+        // the checksum helper of a stored order book, verifying every message unless configured otherwise
+        var book = orderbook as ccxt.pro.IOrderBook;
+        if (book.checksum == null)
+        {
+            var every = this.handleOption("watchOrderBook", "checksumEvery", 1);
+            var interval = this.handleOption("watchOrderBook", "checksumInterval"); // milliseconds
+            book.checksum = new ccxt.pro.OrderBookChecksum(depth ?? 25, every, interval);
+        }
+        return book.checksum;
+    }
+
     public virtual void onClose(WebSocketClient client, object error = null)
     {
         // var client = (WebSocketClient)client2;
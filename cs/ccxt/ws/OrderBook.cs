@@ -15,6 +15,7 @@ public interface IOrderBook : IDictionary<string, object>
     IAsks asks { get; set; }
     IBids bids { get; set; }
     public IList<object> cache { get; set; }
+    public OrderBookChecksum checksum { get; set; }
 }
 
 public class OrderBook : CustomConcurrentDictionary<string, object>, IOrderBook
@@ -40,6 +41,26 @@ public class OrderBook : CustomConcurrentDictionary<string, object>, IOrderBook
         }
     }
 
+    private OrderBookChecksum _checksum = null; // see Exchange.orderBookChecksum()
+
+    public OrderBookChecksum checksum
+    {
+        get
+        {
+            lock (_syncRoot)
+            {
+                return _checksum;
+            }
+        }
+        set
+        {
+            lock (_syncRoot)
+            {
+                _checksum = value;
+            }
+        }
+    }
+
     private Asks _asks;
 
     public IAsks asks
@@ -178,6 +199,8 @@ public class OrderBook : CustomConcurrentDictionary<string, object>, IOrderBook
             this["timestamp"] = Exchange.SafeValue(snapshot as dict, "timestamp", this["timestamp"]);
             this["datetime"] = Exchange.Iso8601(this["timestamp"]);
             this["symbol"] = Exchange.SafeValue(snapshot as dict, "symbol", this["symbol"]);
+            // the strings of the previous levels
+            this.checksum?.clear();
         }
     }
 
@@ -292,6 +315,8 @@ public class CountedOrderBook : OrderBook, IOrderBook
             this["timestamp"] = Exchange.SafeValue(snapshot as dict, "timestamp", this["timestamp"]);
             this["datetime"] = Exchange.Iso8601(this["timestamp"]);
             this["symbol"] = Exchange.SafeValue(snapshot as dict, "symbol", this["symbol"]);
+            // the strings of the previous levels
+            this.checksum?.clear();
         }
     }
 
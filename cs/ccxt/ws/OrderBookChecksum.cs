@@ -0,0 +1,163 @@
+namespace ccxt.pro;
+
+using ccxt;
+
+// a checksum helper attached to a stored order book, it keeps the strings of the
+// top levels next to the amounts they were formatted from, so a level is only
+// formatted again when it changes, it returns the last checksum without building
+// the payload while no level of the sides was stored or dropped, see the dirty flag
+// of the order book sides, and it decides which messages get verified at all, see
+// Exchange.orderBookChecksum()
+//
+// the methods are called with callDynamically(), which passes a null argument
+// to the methods without arguments
+
+public class OrderBookChecksum
+{
+    public int depth; // number of levels per side covered by the checksum
+    public int every; // verify every nth message
+    public object interval; // or verify at most once per interval in milliseconds
+    public int counter = 0;
+    public object last = null;
+    public object context = null;
+    public object payload = null;
+    public Int64 value = 0;
+    public bool current = false; // whether the value was computed since the sides last changed
+    protected readonly object lockObject = new object();
+    public Dictionary<string, Dictionary<string, object>> levels = new Dictionary<string, Dictionary<string, object>>
+    {
+        // key -> [price string, amount string, key, amount]
+        { "bids", new Dictionary<string, object>() },
+        { "asks", new Dictionary<string, object>() },
+    };
+
+    public OrderBookChecksum(object depth = null, object every = null, object interval = null)
+    {
+        this.depth = (depth == null) ? 25 : Convert.ToInt32(depth);
+        this.every = (every == null) ? 1 : Math.Max(1, Convert.ToInt32(every));
+        this.interval = interval;
+    }
+
+    public object due(object unused = null)
+    {
+        // tells whether the current message should be verified
+        lock (this.lockObject)
+        {
+            if (this.interval != null)
+            {
+                var now = DateTimeOffset.UtcNow.ToUnixTimeMilliseconds();
+                if (this.last != null && now - Convert.ToInt64(this.last) < Convert.ToInt64(this.interval))
+                {
+                    return false;
+                }
+                this.last = now;
+                return true;
+            }
+            this.counter += 1;
+            if (this.counter >= this.every)
+            {
+                this.counter = 0;
+                return true;
+            }
+            return false;
+        }
+    }
+
+    public void clear(object unused = null)
+    {
+        lock (this.lockObject)
+        {
+            this.levels["bids"].Clear();
+            this.levels["asks"].Clear();
+            this.payload = null;
+            this.value = 0;
+            this.current = false;
+        }
+    }
+
+    public void track(object context)
+    {
+        // drops the cached strings when the formatting rules change, e.g. the number of decimals
+        if (!Exchange.isEqual(context, this.context))
+        {
+            this.clear();
+            this.context = context;
+        }
+    }
+
+    public object cached(object side, object key, object amount)
+    {
+        // the strings of a level, unless its amount changed since they were formatted
+        lock (this.lockObject)
+        {
+            object level;
+            if (this.levels[(string)side].TryGetValue(Convert.ToString(key, System.Globalization.CultureInfo.InvariantCulture), out level))
+            {
+                var values = (IList<object>)level;
+                if (Exchange.isEqual(values[2], key) && Exchange.isEqual(values[3], amount))
+                {
+                    return level;
+                }
+            }
+            return null;
+        }
+    }
+
+    public object store(object side, object key, object amount, object priceString, object amountString)
+    {
+        lock (this.lockObject)
+        {
+            var levels = this.levels[(string)side];
+            if (levels.Count >= 4 * this.depth)
+            {
+                // the levels that left the top are dropped all at once
+                levels.Clear();
+            }
+            var level = new List<object>() { priceString, amountString, key, amount };
+            levels[Convert.ToString(key, System.Globalization.CultureInfo.InvariantCulture)] = level;
+            return level;
+        }
+    }
+
+    public object reuse(object bids, object asks, object signed = null)
+    {
+        // the last checksum when the sides did not change since it was computed, null otherwise
+        lock (this.lockObject)
+        {
+            var bidsSide = (IOrderBookSide)bids;
+            var asksSide = (IOrderBookSide)asks;
+            if (this.current && !bidsSide.dirty && !asksSide.dirty)
+            {
+                return this.result(signed);
+            }
+            bidsSide.dirty = false;
+            asksSide.dirty = false;
+            // until crc32() is called with the payload of the sides as they are now
+            this.current = false;
+            return null;
+        }
+    }
+
+    public object crc32(object payload, object signed = null)
+    {
+        lock (this.lockObject)
+        {
+            if (!Exchange.isEqual(payload, this.payload))
+            {
+                this.payload = payload;
+                this.value = Exchange.Crc32(payload, false);
+            }
+            this.current = true;
+            return this.result(signed);
+        }
+    }
+
+    public object result(object signed)
+    {
+        if (signed != null && (bool)signed && this.value >= 0x80000000)
+        {
+            return this.value - 0x100000000;
+        }
+        return this.value;
+    }
+}
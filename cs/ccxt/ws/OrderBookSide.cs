@@ -21,8 +21,10 @@ public interface IOrderBookSide : IList<object>
 {
     void store(object price, object size);
     void storeArray(object delta);
+    void storeMany(object deltas);
     void limit();
     void store(object price, object size, object order_id);
+    bool dirty { get; set; }
     IOrderBookSide Copy();
 }
 
@@ -107,6 +109,27 @@ public class OrderBookSide : SlimConcurrentList<object>, IOrderBookSide
         }
     }
 
+    private bool __dirty = true;
+
+    // set when a level is stored or dropped, cleared by OrderBookChecksum.reuse()
+    public bool dirty
+    {
+        get
+        {
+            lock (_syncRoot)
+            {
+                return __dirty;
+            }
+        }
+        set
+        {
+            lock (_syncRoot)
+            {
+                __dirty = value;
+            }
+        }
+    }
+
     public OrderBookSide(object deltas2, object depth = null, bool side = false) : base()
     {
         lock (_syncRoot)
@@ -127,6 +150,7 @@ public class OrderBookSide : SlimConcurrentList<object>, IOrderBookSide
     {
         lock (_syncRoot)
         {
+            this.dirty = true;
             var delta = (IList<object>)delta2;
             var price = Convert.ToDecimal(delta[0]);
             var amount = Convert.ToDecimal(delta[1]);
@@ -203,11 +227,27 @@ public class OrderBookSide : SlimConcurrentList<object>, IOrderBookSide
         }
     }
 
+    public void storeMany(object deltas)
+    {
+        lock (_syncRoot)
+        {
+            // through the interface, so that the storeArray of the counted and indexed sides is used
+            foreach (var delta in (IList<object>)deltas)
+            {
+                ((IOrderBookSide)this).storeArray(delta);
+            }
+        }
+    }
+
     public void limit()
     {
         lock (_syncRoot)
         {
             var different = this.Count - this._depth;
+            if (different > 0)
+            {
+                this.dirty = true;
+            }
             for (var i = 0; i < different; i++)
             {
                 var length = this.Count;
@@ -307,6 +347,7 @@ public class CountedOrderBookSide : OrderBookSide, IOrderBookSide
     {
         lock (_syncRoot)
         {
+            this.dirty = true;
             var deltaArray = (IList<object>)deltaArra2;
             var price = deltaArray[0];
             var size = Convert.ToDecimal(deltaArray[1]);
@@ -389,6 +430,7 @@ public class IndexedOrderBookSide : OrderBookSide, IOrderBookSide
         lock (_syncRoot)
         {
 
+            this.dirty = true;
             var delta = (IList<object>)delta2;
             var price = Convert.ToDecimal(delta[0]);
             var size = Convert.ToDecimal(delta[1]);
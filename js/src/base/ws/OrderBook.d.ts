@@ -1,10 +1,13 @@
 import { IOrderBookSide } from './OrderBookSide.js';
+import { OrderBookChecksum } from './OrderBookChecksum.js';
 import { Int, Str } from '../types.js';
 interface CustomOrderBookProp {
     cache: any[];
+    checksum: OrderBookChecksum;
 }
 declare class OrderBook implements CustomOrderBookProp {
     cache: any[];
+    checksum: OrderBookChecksum;
     asks: IOrderBookSide<any>;
     bids: IOrderBookSide<any>;
     timestamp: Int;
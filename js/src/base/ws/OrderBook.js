@@ -12,12 +12,19 @@ import { Asks, Bids, CountedAsks, CountedBids, IndexedAsks, IndexedBids } from '
 class OrderBook {
     constructor(snapshot = {}, depth = undefined) {
         this.cache = []; // make prop visible so we use typed OrderBooks
+        this.checksum = undefined; // see Exchange.orderBookChecksum ()
         Object.defineProperty(this, 'cache', {
             __proto__: null,
             value: [],
             writable: true,
             enumerable: false,
         });
+        Object.defineProperty(this, 'checksum', {
+            __proto__: null,
+            value: undefined,
+            writable: true,
+            enumerable: false,
+        });
         depth = depth || Number.MAX_SAFE_INTEGER;
         const defaults = {
             'bids': [],
@@ -79,6 +86,10 @@ class OrderBook {
         this.timestamp = snapshot.timestamp;
         this.datetime = iso8601(this.timestamp);
         this.symbol = snapshot.symbol;
+        if (this.checksum !== undefined) {
+            // the strings of the previous levels
+            this.checksum.clear();
+        }
         return this;
     }
 }
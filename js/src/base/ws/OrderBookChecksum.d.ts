@@ -0,0 +1,22 @@
+declare class OrderBookChecksum {
+    depth: number;
+    every: number;
+    interval: number;
+    counter: number;
+    last: number;
+    context: any;
+    payload: string;
+    value: number;
+    current: boolean;
+    levels: any;
+    constructor(depth?: number, every?: number, interval?: any);
+    due(): boolean;
+    clear(): void;
+    track(context: any): void;
+    cached(side: any, key: any, amount: any): any;
+    store(side: any, key: any, amount: any, priceString: any, amountString: any): any[];
+    reuse(bids: any, asks: any, signed?: boolean): number;
+    crc32(payload: any, signed?: boolean): number;
+    result(signed: any): number;
+}
+export { OrderBookChecksum, };
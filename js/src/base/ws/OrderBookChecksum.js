@@ -0,0 +1,119 @@
+// ----------------------------------------------------------------------------
+
+// PLEASE DO NOT EDIT THIS FILE, IT IS GENERATED AND WILL BE OVERWRITTEN:
+// https://github.com/ccxt/ccxt/blob/master/CONTRIBUTING.md#how-to-contribute-code
+// EDIT THE CORRESPONDENT .ts FILE INSTEAD
+
+// @ts-nocheck
+import { milliseconds } from '../../base/functions/time.js';
+import { crc32 } from '../../base/functions/crypto.js';
+// ----------------------------------------------------------------------------
+// a checksum helper attached to a stored order book, it keeps the strings of the
+// top levels next to the amounts they were formatted from, so a level is only
+// formatted again when it changes, it returns the last checksum without building
+// the payload while no level of the sides was stored or dropped, see the dirty flag
+// of the order book sides, and it decides which messages get verified at all, see
+// Exchange.orderBookChecksum ()
+//
+//     let checksum = checksumHelper.reuse (bids, asks, true)
+//     if (checksum === undefined) {
+//         let level = checksumHelper.cached ('bids', price, amount)
+//         if (level === undefined) {
+//             level = checksumHelper.store ('bids', price, amount, priceString, amountString)
+//         }
+//         ...
+//         checksum = checksumHelper.crc32 (payload, true)
+//     }
+class OrderBookChecksum {
+    constructor(depth = 25, every = 1, interval = undefined) {
+        this.depth = depth;
+        this.every = every || 1;
+        this.interval = interval;
+        this.counter = 0;
+        this.last = undefined;
+        this.context = undefined;
+        this.payload = undefined;
+        this.value = undefined;
+        this.current = false; // whether the value was computed since the sides last changed
+        this.levels = {
+            'bids': new Map(),
+            'asks': new Map(),
+        };
+    }
+    due() {
+        // tells whether the current message should be verified
+        if (this.interval !== undefined) {
+            const now = milliseconds();
+            if ((this.last !== undefined) && (now - this.last < this.interval)) {
+                return false;
+            }
+            this.last = now;
+            return true;
+        }
+        this.counter += 1;
+        if (this.counter >= this.every) {
+            this.counter = 0;
+            return true;
+        }
+        return false;
+    }
+    clear() {
+        this.levels['bids'].clear();
+        this.levels['asks'].clear();
+        this.payload = undefined;
+        this.value = undefined;
+        this.current = false;
+    }
+    track(context) {
+        // drops the cached strings when the formatting rules change, e.g. the number of decimals
+        if (context !== this.context) {
+            this.clear();
+            this.context = context;
+        }
+    }
+    cached(side, key, amount) {
+        // the strings of a level, unless its amount changed since they were formatted
+        const level = this.levels[side].get(key);
+        if ((level !== undefined) && (level[2] === key) && (level[3] === amount)) {
+            return level;
+        }
+        return undefined;
+    }
+    store(side, key, amount, priceString, amountString) {
+        const levels = this.levels[side];
+        if (levels.size >= 4 * this.depth) {
+            // the levels that left the top are dropped all at once
+            levels.clear();
+        }
+        const level = [priceString, amountString, key, amount];
+        levels.set(key, level);
+        return level;
+    }
+    reuse(bids, asks, signed = false) {
+        // the last checksum when the sides did not change since it was computed, undefined otherwise
+        if (this.current && !bids.dirty && !asks.dirty) {
+            return this.result(signed);
+        }
+        bids.dirty = false;
+        asks.dirty = false;
+        // until crc32 () is called with the payload of the sides as they are now
+        this.current = false;
+        return undefined;
+    }
+    crc32(payload, signed = false) {
+        if (payload !== this.payload) {
+            this.payload = payload;
+            this.value = crc32(payload);
+        }
+        this.current = true;
+        return this.result(signed);
+    }
+    result(signed) {
+        if (signed && (this.value >= 0x80000000)) {
+            return this.value - 0x100000000;
+        }
+        return this.value;
+    }
+}
+// ----------------------------------------------------------------------------
+export { OrderBookChecksum, };
@@ -1,12 +1,14 @@
 interface IOrderBookSide<T> extends Array<T> {
     store(price: any, size: any): any;
     storeArray(array: any[]): any;
+    storeMany(deltas: any[]): any;
     limit(): any;
 }
 declare class OrderBookSide extends Array implements IOrderBookSide<any> {
     constructor(deltas?: any[], depth?: any);
     storeArray(delta: any): void;
     store(price: any, size: any): void;
+    storeMany(deltas: any): void;
     limit(): void;
 }
 declare class CountedOrderBookSide extends OrderBookSide {
@@ -17,6 +19,7 @@ declare class IndexedOrderBookSide extends Array implements IOrderBookSide<any>
     constructor(deltas?: any[], depth?: number);
     store(price: any, size: any): void;
     storeArray(delta: any): void;
+    storeMany(deltas: any): void;
     limit(): void;
 }
 declare class Asks extends OrderBookSide {
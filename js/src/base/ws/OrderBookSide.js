@@ -45,6 +45,12 @@ class OrderBookSide extends Array {
             value: depth || Number.MAX_SAFE_INTEGER,
             writable: true,
         });
+        // set when a level is stored or dropped, cleared by OrderBookChecksum.reuse ()
+        Object.defineProperty(this, 'dirty', {
+            __proto__: null,
+            value: true,
+            writable: true,
+        });
         // sort upon initiation
         this.length = 0;
         for (let i = 0; i < deltas.length; i++) {
@@ -52,6 +58,7 @@ class OrderBookSide extends Array {
         }
     }
     storeArray(delta) {
+        this.dirty = true;
         const price = delta[0];
         const size = delta[1];
         const index_price = this.side ? -price : price;
@@ -86,9 +93,16 @@ class OrderBookSide extends Array {
     store(price, size) {
         this.storeArray([price, size]);
     }
+    // apply a batch of deltas, e.g. the parsed levels of one message
+    storeMany(deltas) {
+        for (let i = 0; i < deltas.length; i++) {
+            this.storeArray(deltas[i]);
+        }
+    }
     // replace stored orders with new values
     limit() {
         if (this.length > this.depth) {
+            this.dirty = true;
             for (let i = this.depth; i < this.length; i++) {
                 this.index[i] = Number.MAX_VALUE;
             }
@@ -105,6 +119,7 @@ class CountedOrderBookSide extends OrderBookSide {
         throw new Error('CountedOrderBookSide.store() is not supported, use storeArray([price, size, count]) instead');
     }
     storeArray(delta) {
+        this.dirty = true;
         const price = delta[0];
         const size = delta[1];
         const count = delta[2];
@@ -160,6 +175,12 @@ class IndexedOrderBookSide extends Array {
             value: depth || Number.MAX_SAFE_INTEGER,
             writable: true,
         });
+        // set when a level is stored or dropped, cleared by OrderBookChecksum.reuse ()
+        Object.defineProperty(this, 'dirty', {
+            __proto__: null,
+            value: true,
+            writable: true,
+        });
         // sort upon initiation
         for (let i = 0; i < deltas.length; i++) {
             this.length = i;
@@ -170,6 +191,7 @@ class IndexedOrderBookSide extends Array {
         throw new Error('IndexedOrderBook.store() is not supported, use storeArray([price, size, id]) instead');
     }
     storeArray(delta) {
+        this.dirty = true;
         const price = delta[0];
         const size = delta[1];
         const id = delta[2];
@@ -244,9 +266,16 @@ class IndexedOrderBookSide extends Array {
             this.hashmap.delete(id);
         }
     }
+    // apply a batch of deltas, e.g. the parsed levels of one message
+    storeMany(deltas) {
+        for (let i = 0; i < deltas.length; i++) {
+            this.storeArray(deltas[i]);
+        }
+    }
     // replace stored orders with new values
     limit() {
         if (this.length > this.depth) {
+            this.dirty = true;
             for (let i = this.depth; i < this.length; i++) {
                 // diff
                 this.hashmap.delete(this.index[i]);
@@ -25,6 +25,17 @@ export default class binance extends Exchange {
             'name': 'Binance',
             'countries': ['JP', 'MT'],
             'rateLimit': 50,
+            // the named buckets of the request weight of each api and of the orders, the futures data endpoints are debited from the rateLimit
+            'rateLimitBuckets': {
+                // the capacity is a second of the limit, so a fresh instance does not send a minute of requests at once
+                'weight': { 'limit': 6000, 'interval': 60000, 'capacity': 100, 'apis': ['public', 'private'], 'scale': 5, 'header': 'x-mbx-used-weight-1m' },
+                'sapi': { 'limit': 12000, 'interval': 60000, 'capacity': 200, 'apis': ['sapi', 'sapiV2', 'sapiV3', 'sapiV4'], 'scale': 10, 'header': 'x-sapi-used-ip-weight-1m' },
+                'fapi': { 'limit': 2400, 'interval': 60000, 'capacity': 40, 'apis': ['fapiPublic', 'fapiPublicV2', 'fapiPrivate', 'fapiPrivateV2'], 'header': 'x-mbx-used-weight-1m' },
+                'dapi': { 'limit': 2400, 'interval': 60000, 'capacity': 40, 'apis': ['dapiPublic', 'dapiPrivate', 'dapiPrivateV2'], 'header': 'x-mbx-used-weight-1m' },
+                'eapi': { 'limit': 1200, 'interval': 60000, 'capacity': 20, 'apis': ['eapiPublic', 'eapiPrivate'], 'header': 'x-mbx-used-weight-1m' },
+                'papi': { 'limit': 6000, 'interval': 60000, 'capacity': 100, 'apis': ['papi'], 'header': 'x-mbx-used-weight-1m' },
+                'orders': { 'limit': 100, 'interval': 10000, 'capacity': 10, 'apis': ['private'], 'paths': ['order', 'order/oco', 'orderList/oco', 'orderList/oto', 'orderList/otoco', 'sor/order', 'order/cancelReplace'], 'methods': ['POST'], 'scale': 5 },
+            },
             'certified': true,
             'pro': true,
             // new metainfo2 interface
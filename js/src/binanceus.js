@@ -15,6 +15,8 @@ export default class binanceus extends binance {
             'countries': ['US'],
             'hostname': 'binance.us',
             'rateLimit': 50,
+            // the weights of binance.us differ from the ones of binance, its requests are debited from the rateLimit
+            'rateLimitBuckets': undefined,
             'certified': false,
             'pro': true,
             'urls': {
@@ -3432,7 +3432,10 @@ export default class kucoin extends Exchange {
             const data = this.safeDict(response, 'data', {});
             const precision = this.parseNumber(this.parsePrecision(this.safeString(data, 'precision')));
             const code = currency['code'];
-            this.currencies[code]['networks'][networkCode]['precision'] = precision;
+            // the currency is replaced, not changed in place, the currencies can be shared with other instances
+            const currencyNetworks = this.extend(this.currencies[code]['networks'], {});
+            currencyNetworks[networkCode] = this.extend(currencyNetworks[networkCode], { 'precision': precision });
+            this.currencies[code] = this.extend(this.currencies[code], { 'networks': currencyNetworks });
         }
     }
     parseTransactionStatus(status) {
@@ -1086,6 +1086,7 @@ export default class okx extends Exchange {
                 'createOrder': 'privatePostTradeBatchOrders',
                 'createMarketBuyOrderRequiresPrice': false,
                 'fetchMarkets': ['spot', 'future', 'swap', 'option'],
+                'marketsKeyOptions': ['defaultUnderlying'],
                 'defaultType': 'spot',
                 // 'fetchBalance': {
                 //     'type': 'spot', // 'funding', 'trading', 'spot'
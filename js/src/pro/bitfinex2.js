@@ -660,28 +660,45 @@ export default class bitfinex2 extends bitfinex2Rest {
             return;
         }
         const depth = 25; // covers the first 25 bids and asks
-        const stringArray = [];
+        const checksumHelper = this.orderBookChecksum(book, depth);
+        if (!checksumHelper.due()) {
+            return;
+        }
         const bids = book['bids'];
         const asks = book['asks'];
-        const prec = this.safeString(subscription, 'prec', 'P0');
-        const isRaw = (prec === 'R0');
-        const idToCheck = isRaw ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for (let i = 0; i < depth; i++) {
-            const bid = this.safeValue(bids, i);
-            const ask = this.safeValue(asks, i);
-            if (bid !== undefined) {
-                stringArray.push(this.numberToString(bids[i][idToCheck]));
-                stringArray.push(this.numberToString(bids[i][1]));
-            }
-            if (ask !== undefined) {
-                stringArray.push(this.numberToString(asks[i][idToCheck]));
-                const aski1 = asks[i][1];
-                stringArray.push(this.numberToString(-aski1));
+        // the top levels did not change since the last verified message
+        let localChecksum = checksumHelper.reuse(bids, asks, true);
+        if (localChecksum === undefined) {
+            const stringArray = [];
+            const prec = this.safeString(subscription, 'prec', 'P0');
+            const isRaw = (prec === 'R0');
+            // the raw books are keyed by order id, there can be several orders at the same price
+            const idToCheck = isRaw ? 2 : 0;
+            // pepperoni pizza from bitfinex
+            for (let i = 0; i < depth; i++) {
+                const bid = this.safeValue(bids, i);
+                const ask = this.safeValue(asks, i);
+                if (bid !== undefined) {
+                    let bidStrings = checksumHelper.cached('bids', bid[idToCheck], bid[1]);
+                    if (bidStrings === undefined) {
+                        bidStrings = checksumHelper.store('bids', bid[idToCheck], bid[1], this.numberToString(bid[idToCheck]), this.numberToString(bid[1]));
+                    }
+                    stringArray.push(bidStrings[0]);
+                    stringArray.push(bidStrings[1]);
+                }
+                if (ask !== undefined) {
+                    const aski1 = ask[1];
+                    let askStrings = checksumHelper.cached('asks', ask[idToCheck], aski1);
+                    if (askStrings === undefined) {
+                        askStrings = checksumHelper.store('asks', ask[idToCheck], aski1, this.numberToString(ask[idToCheck]), this.numberToString(-aski1));
+                    }
+                    stringArray.push(askStrings[0]);
+                    stringArray.push(askStrings[1]);
+                }
             }
+            const payload = stringArray.join(':');
+            localChecksum = checksumHelper.crc32(payload, true);
         }
-        const payload = stringArray.join(':');
-        const localChecksum = this.crc32(payload, true);
         const responseChecksum = this.safeInteger(message, 2);
         if (responseChecksum !== localChecksum) {
             delete client.subscriptions[messageHash];
@@ -545,24 +545,29 @@ export default class bitget extends bitgetRest {
             storedOrderBook['datetime'] = this.iso8601(timestamp);
             const checksum = this.safeBool(this.options, 'checksum', true);
             const isSnapshot = this.safeString(message, 'action') === 'snapshot'; // snapshot does not have a checksum
-            if (!isSnapshot && checksum) {
+            const checksumHelper = this.orderBookChecksum(storedOrderBook, 25);
+            if (!isSnapshot && checksum && checksumHelper.due()) {
                 const storedAsks = storedOrderBook['asks'];
                 const storedBids = storedOrderBook['bids'];
-                const asksLength = storedAsks.length;
-                const bidsLength = storedBids.length;
-                const payloadArray = [];
-                for (let i = 0; i < 25; i++) {
-                    if (i < bidsLength) {
-                        payloadArray.push(storedBids[i][2][0]);
-                        payloadArray.push(storedBids[i][2][1]);
-                    }
-                    if (i < asksLength) {
-                        payloadArray.push(storedAsks[i][2][0]);
-                        payloadArray.push(storedAsks[i][2][1]);
+                // the top levels did not change since the last verified message
+                let calculatedChecksum = checksumHelper.reuse(storedBids, storedAsks, true);
+                if (calculatedChecksum === undefined) {
+                    const asksLength = storedAsks.length;
+                    const bidsLength = storedBids.length;
+                    const payloadArray = [];
+                    for (let i = 0; i < 25; i++) {
+                        if (i < bidsLength) {
+                            payloadArray.push(storedBids[i][2][0]);
+                            payloadArray.push(storedBids[i][2][1]);
+                        }
+                        if (i < asksLength) {
+                            payloadArray.push(storedAsks[i][2][0]);
+                            payloadArray.push(storedAsks[i][2][1]);
+                        }
                     }
+                    const payload = payloadArray.join(':');
+                    calculatedChecksum = checksumHelper.crc32(payload, true);
                 }
-                const payload = payloadArray.join(':');
-                const calculatedChecksum = this.crc32(payload, true);
                 const responseChecksum = this.safeInteger(rawOrderBook, 'checksum');
                 if (calculatedChecksum !== responseChecksum) {
                     delete client.subscriptions[messageHash];
@@ -930,28 +930,46 @@ export default class okx extends okxRest {
         if (checksum) {
             const prevSeqId = this.safeInteger(message, 'prevSeqId');
             const nonce = orderbook['nonce'];
-            const asksLength = storedAsks.length;
-            const bidsLength = storedBids.length;
-            const payloadArray = [];
-            for (let i = 0; i < 25; i++) {
-                if (i < bidsLength) {
-                    payloadArray.push(this.numberToString(storedBids[i][0]));
-                    payloadArray.push(this.numberToString(storedBids[i][1]));
-                }
-                if (i < asksLength) {
-                    payloadArray.push(this.numberToString(storedAsks[i][0]));
-                    payloadArray.push(this.numberToString(storedAsks[i][1]));
-                }
-            }
-            const payload = payloadArray.join(':');
-            const responseChecksum = this.safeInteger(message, 'checksum');
-            const localChecksum = this.crc32(payload, true);
             let error = undefined;
             if (prevSeqId !== -1 && nonce !== prevSeqId) {
                 error = new InvalidNonce(this.id + ' watchOrderBook received invalid nonce');
             }
-            if (responseChecksum !== localChecksum) {
-                error = new ChecksumError(this.id + ' ' + this.orderbookChecksumMessage(symbol));
+            const checksumHelper = this.orderBookChecksum(orderbook, 25);
+            if (checksumHelper.due()) {
+                // the top levels did not change since the last verified message
+                let localChecksum = checksumHelper.reuse(storedBids, storedAsks, true);
+                if (localChecksum === undefined) {
+                    const asksLength = storedAsks.length;
+                    const bidsLength = storedBids.length;
+                    const payloadArray = [];
+                    for (let i = 0; i < 25; i++) {
+                        if (i < bidsLength) {
+                            const bid = storedBids[i];
+                            // the levels are formatted once per amount
+                            let bidStrings = checksumHelper.cached('bids', bid[0], bid[1]);
+                            if (bidStrings === undefined) {
+                                bidStrings = checksumHelper.store('bids', bid[0], bid[1], this.numberToString(bid[0]), this.numberToString(bid[1]));
+                            }
+                            payloadArray.push(bidStrings[0]);
+                            payloadArray.push(bidStrings[1]);
+                        }
+                        if (i < asksLength) {
+                            const ask = storedAsks[i];
+                            let askStrings = checksumHelper.cached('asks', ask[0], ask[1]);
+                            if (askStrings === undefined) {
+                                askStrings = checksumHelper.store('asks', ask[0], ask[1], this.numberToString(ask[0]), this.numberToString(ask[1]));
+                            }
+                            payloadArray.push(askStrings[0]);
+                            payloadArray.push(askStrings[1]);
+                        }
+                    }
+                    const payload = payloadArray.join(':');
+                    localChecksum = checksumHelper.crc32(payload, true);
+                }
+                const responseChecksum = this.safeInteger(message, 'checksum');
+                if (responseChecksum !== localChecksum) {
+                    error = new ChecksumError(this.id + ' ' + this.orderbookChecksumMessage(symbol));
+                }
             }
             if (error !== undefined) {
                 delete client.subscriptions[messageHash];
@@ -1337,7 +1337,12 @@ class Exchange {
         return MessagePack::pack($data);
     }
 
-    public function throttle($cost = null) {
+    public function rate_limit_debits($api, $path, $method, $cost, $config = array()) {
+        // what a request takes from the named rate limit buckets, null without them
+        return null;
+    }
+
+    public function throttle($cost = null, $debits = null) {
         // TODO: use a token bucket here
         $now = $this->milliseconds();
         $elapsed = $now - $this->lastRestRequestTimestamp;
@@ -2177,6 +2182,58 @@ class Exchange {
         return array();
     }
 
+    public function resolve_option($methodName, $optionName) {
+        // [defaultOptionName, value] of an option, from the options of the method or the exchange-wide ones
+        $defaultOptionName = 'default' . $this->capitalize($optionName);
+        $value = null;
+        // check if exchange has properties for this method
+        $exchangeWideMethodOptions = $this->safe_value($this->options, $methodName);
+        if ($exchangeWideMethodOptions !== null) {
+            // check if the option is defined inside this method's props
+            $value = $this->safe_value_2($exchangeWideMethodOptions, $optionName, $defaultOptionName);
+        }
+        if ($value === null) {
+            // if it's still null, check if global exchange-wide option exists
+            $value = $this->safe_value_2($this->options, $optionName, $defaultOptionName);
+        }
+        return array( $defaultOptionName, $value );
+    }
+
+    public function index_markets($markets) {
+        // sets markets, markets_by_id, symbols and ids, returns the market structures for set_markets()
+        $values = array();
+        $this->markets_by_id = array();
+        // handle marketId conflicts
+        // we insert spot $markets first
+        $marketValues = $this->sort_by($this->to_array($markets), 'spot', true, true);
+        for ($i = 0; $i < count($marketValues); $i++) {
+            $value = $marketValues[$i];
+            if (is_array($this->markets_by_id) && array_key_exists($value['id'], $this->markets_by_id)) {
+                ($this->markets_by_id[$value['id']])[] = $value;
+            } else {
+                $this->markets_by_id[$value['id']] = array( $value );
+            }
+            $market = $this->deep_extend($this->safe_market_structure(), array(
+                'precision' => $this->precision,
+                'limits' => $this->limits,
+            ), $this->fees['trading'], $value);
+            if ($market['linear']) {
+                $market['subType'] = 'linear';
+            } elseif ($market['inverse']) {
+                $market['subType'] = 'inverse';
+            } else {
+                $market['subType'] = null;
+            }
+            $values[] = $market;
+        }
+        $this->markets = $this->index_by($values, 'symbol');
+        $marketsSortedBySymbol = $this->keysort($this->markets);
+        $marketsSortedById = $this->keysort($this->markets_by_id);
+        $this->symbols = is_array($marketsSortedBySymbol) ? array_keys($marketsSortedBySymbol) : array();
+        $this->ids = is_array($marketsSortedById) ? array_keys($marketsSortedById) : array();
+        return $values;
+    }
+
     // ########################################################################
     // ########################################################################
     // ########################################################################
@@ -3438,45 +3495,17 @@ class Exchange {
     }
 
     public function set_markets($markets, $currencies = null) {
-        $values = array();
-        $this->markets_by_id = array();
-        // handle marketId conflicts
-        // we insert spot $markets first
-        $marketValues = $this->sort_by($this->to_array($markets), 'spot', true, true);
-        for ($i = 0; $i < count($marketValues); $i++) {
-            $value = $marketValues[$i];
-            if (is_array($this->markets_by_id) && array_key_exists($value['id'], $this->markets_by_id)) {
-                ($this->markets_by_id[$value['id']])[] = $value;
-            } else {
-                $this->markets_by_id[$value['id']] = array( $value );
-            }
-            $market = $this->deep_extend($this->safe_market_structure(), array(
-                'precision' => $this->precision,
-                'limits' => $this->limits,
-            ), $this->fees['trading'], $value);
-            if ($market['linear']) {
-                $market['subType'] = 'linear';
-            } elseif ($market['inverse']) {
-                $market['subType'] = 'inverse';
-            } else {
-                $market['subType'] = null;
-            }
-            $values[] = $market;
-        }
-        $this->markets = $this->index_by($values, 'symbol');
-        $marketsSortedBySymbol = $this->keysort($this->markets);
-        $marketsSortedById = $this->keysort($this->markets_by_id);
-        $this->symbols = is_array($marketsSortedBySymbol) ? array_keys($marketsSortedBySymbol) : array();
-        $this->ids = is_array($marketsSortedById) ? array_keys($marketsSortedById) : array();
+        // the $markets and the indexes of the $markets are built by indexMarkets ()
+        $values = $this->index_markets($markets);
         if ($currencies !== null) {
             // $currencies is always null when called in constructor but not when called from loadMarkets
             $this->currencies = $this->deep_extend($this->currencies, $currencies);
         } else {
             $baseCurrencies = array();
             $quoteCurrencies = array();
+            $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
             for ($i = 0; $i < count($values); $i++) {
                 $market = $values[$i];
-                $defaultCurrencyPrecision = ($this->precisionMode === DECIMAL_PLACES) ? 8 : $this->parse_number('1e-8');
                 $marketPrecision = $this->safe_dict($market, 'precision', array());
                 if (is_array($market) && array_key_exists('base', $market)) {
                     $currency = $this->safe_currency_structure(array(
@@ -4892,7 +4921,7 @@ class Exchange {
     public function fetch2($path, mixed $api = 'public', $method = 'GET', $params = array (), mixed $headers = null, mixed $body = null, $config = array ()) {
         if ($this->enableRateLimit) {
             $cost = $this->calculate_rate_limiter_cost($api, $method, $path, $params, $config);
-            $this->throttle($cost);
+            $this->throttle($cost, $this->rate_limit_debits($api, $path, $method, $cost, $config));
         }
         $this->lastRestRequestTimestamp = $this->milliseconds();
         $request = $this->sign($path, $api, $method, $params, $headers, $body);
@@ -5290,27 +5319,27 @@ class Exchange {
 
     public function handle_option_and_params(array $params, string $methodName, string $optionName, $defaultValue = null) {
         // This method can be used to obtain method specific properties, i.e => $this->handle_option_and_params($params, 'fetchPosition', 'marginMode', 'isolated')
-        $defaultOptionName = 'default' . $this->capitalize($optionName); // we also need to check the 'defaultXyzWhatever'
-        // check if $params contain the key
-        $value = $this->safe_value_2($params, $optionName, $defaultOptionName);
-        if ($value !== null) {
-            $params = $this->omit($params, array( $optionName, $defaultOptionName ));
+        // the options are looked up by resolveOption (), we also need to check the 'defaultXyzWhatever'
+        $defaultOptionName = null;
+        $value = null;
+        list($defaultOptionName, $value) = $this->resolve_option($methodName, $optionName);
+        if ($this->is_empty($params)) {
+            $params = array();
         } else {
-            // handle routed methods like "watchTrades > watchTradesForSymbols" (or "watchTicker > watchTickers")
-            list($methodName, $params) = $this->handle_param_string($params, 'callerMethodName', $methodName);
-            // check if exchange has properties for this method
-            $exchangeWideMethodOptions = $this->safe_value($this->options, $methodName);
-            if ($exchangeWideMethodOptions !== null) {
-                // check if the option is defined inside this method's props
-                $value = $this->safe_value_2($exchangeWideMethodOptions, $optionName, $defaultOptionName);
+            // check if $params contain the key
+            $paramsValue = $this->safe_value_2($params, $optionName, $defaultOptionName);
+            if ($paramsValue !== null) {
+                return array( $paramsValue, $this->omit($params, array( $optionName, $defaultOptionName )) );
             }
-            if ($value === null) {
-                // if it's still null, check if global exchange-wide option exists
-                $value = $this->safe_value_2($this->options, $optionName, $defaultOptionName);
+            // handle routed methods like "watchTrades > watchTradesForSymbols" (or "watchTicker > watchTickers")
+            $callerMethodName = null;
+            list($callerMethodName, $params) = $this->handle_param_string($params, 'callerMethodName', $methodName);
+            if ($callerMethodName !== $methodName) {
+                list($defaultOptionName, $value) = $this->resolve_option($callerMethodName, $optionName);
             }
-            // if it's still null, use the default $value
-            $value = ($value !== null) ? $value : $defaultValue;
         }
+        // if it's still null, use the default $value
+        $value = ($value !== null) ? $value : $defaultValue;
         return array( $value, $params );
     }
 
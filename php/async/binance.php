@@ -29,6 +29,17 @@ class binance extends Exchange {
             'name' => 'Binance',
             'countries' => array( 'JP', 'MT' ), // Japan, Malta
             'rateLimit' => 50,
+            // the named buckets of the request weight of each api and of the orders, the futures data endpoints are debited from the rateLimit
+            'rateLimitBuckets' => array(
+                // the capacity is a second of the limit, so a fresh instance does not send a minute of requests at once
+                'weight' => array( 'limit' => 6000, 'interval' => 60000, 'capacity' => 100, 'apis' => array( 'public', 'private' ), 'scale' => 5, 'header' => 'x-mbx-used-weight-1m' ), // 1 IP (api) => cost = 0.2
+                'sapi' => array( 'limit' => 12000, 'interval' => 60000, 'capacity' => 200, 'apis' => array( 'sapi', 'sapiV2', 'sapiV3', 'sapiV4' ), 'scale' => 10, 'header' => 'x-sapi-used-ip-weight-1m' ), // 1 IP (sapi) => cost = 0.1
+                'fapi' => array( 'limit' => 2400, 'interval' => 60000, 'capacity' => 40, 'apis' => array( 'fapiPublic', 'fapiPublicV2', 'fapiPrivate', 'fapiPrivateV2' ), 'header' => 'x-mbx-used-weight-1m' ), // 1 IP (fapi) => cost = 1
+                'dapi' => array( 'limit' => 2400, 'interval' => 60000, 'capacity' => 40, 'apis' => array( 'dapiPublic', 'dapiPrivate', 'dapiPrivateV2' ), 'header' => 'x-mbx-used-weight-1m' ), // 1 IP (dapi) => cost = 1
+                'eapi' => array( 'limit' => 1200, 'interval' => 60000, 'capacity' => 20, 'apis' => array( 'eapiPublic', 'eapiPrivate' ), 'header' => 'x-mbx-used-weight-1m' ), // 1 IP (eapi) => cost = 1
+                'papi' => array( 'limit' => 6000, 'interval' => 60000, 'capacity' => 100, 'apis' => array( 'papi' ), 'header' => 'x-mbx-used-weight-1m' ), // 1 IP (papi) => cost = 1
+                'orders' => array( 'limit' => 100, 'interval' => 10000, 'capacity' => 10, 'apis' => array( 'private' ), 'paths' => array( 'order', 'order/oco', 'orderList/oco', 'orderList/oto', 'orderList/otoco', 'sor/order', 'order/cancelReplace' ), 'methods' => array( 'POST' ), 'scale' => 5 ), // 1 order => cost = 0.2
+            ),
             'certified' => true,
             'pro' => true,
             // new metainfo2 interface
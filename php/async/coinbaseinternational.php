@@ -532,7 +532,7 @@ class coinbaseinternational extends Exchange {
             //
             //    [
             //        {
-            //            "asset_id" = $this->parse_networks($rawNetworks);
+            //            "asset_id" = $this->extend($currency, array( 'networks' => $this->parse_networks($rawNetworks) ));
         }) ();
     }
 
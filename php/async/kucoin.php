@@ -3436,7 +3436,10 @@ class kucoin extends Exchange {
                 $data = $this->safe_dict($response, 'data', array());
                 $precision = $this->parse_number($this->parse_precision($this->safe_string($data, 'precision')));
                 $code = $currency['code'];
-                $this->currencies[$code]['networks'][$networkCode]['precision'] = $precision;
+                // the $currency is replaced, not changed in place, the currencies can be shared with other instances
+                $currencyNetworks = $this->extend($this->currencies[$code]['networks'], array());
+                $currencyNetworks[$networkCode] = $this->extend($currencyNetworks[$networkCode], array( 'precision' => $precision ));
+                $this->currencies[$code] = $this->extend($this->currencies[$code], array( 'networks' => $currencyNetworks ));
             }
         }) ();
     }
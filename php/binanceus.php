@@ -17,6 +17,8 @@ class binanceus extends binance {
             'countries' => array( 'US' ), // US
             'hostname' => 'binance.us',
             'rateLimit' => 50, // 1200 req per min
+            // the weights of binance.us differ from the ones of binance, its requests are debited from the rateLimit
+            'rateLimitBuckets' => null,
             'certified' => false,
             'pro' => true,
             'urls' => array(
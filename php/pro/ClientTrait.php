@@ -48,6 +48,16 @@ trait ClientTrait {
         return new CountedOrderBook($snapshot, $depth);
     }
 
+    public function order_book_checksum($orderbook, $depth = 25) {
+        // the checksum helper of a stored order book, verifying every message unless configured otherwise
+        if ($orderbook->checksum === null) {
+            $every = $this->handle_option('watchOrderBook', 'checksumEvery', 1);
+            $interval = $this->handle_option('watchOrderBook', 'checksumInterval'); // milliseconds
+            $orderbook->checksum = new OrderBookChecksum($depth, $every, $interval);
+        }
+        return $orderbook->checksum;
+    }
+
     public function client($url) : Client {
         if (!array_key_exists($url, $this->clients)) {
             $on_message = array($this, 'handle_message');
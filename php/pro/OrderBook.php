@@ -4,6 +4,7 @@ namespace ccxt\pro;
 
 class OrderBook extends \ArrayObject implements \JsonSerializable {
     public $cache;
+    public $checksum = null; // see Exchange::order_book_checksum()
 
     public function __construct($snapshot = array(), $depth = null) {
         $this->cache = array();
@@ -57,6 +58,10 @@ class OrderBook extends \ArrayObject implements \JsonSerializable {
         @$this['nonce'] = $snapshot['nonce'];
         @$this['timestamp'] = $snapshot['timestamp'];
         $this['datetime'] = \ccxt\Exchange::iso8601($this['timestamp']);
+        if ($this->checksum !== null) {
+            // the strings of the previous levels
+            $this->checksum->clear();
+        }
     }
 
     public function update($snapshot) {
@@ -0,0 +1,125 @@
+<?php
+
+namespace ccxt\pro;
+
+// ----------------------------------------------------------------------------
+// a checksum helper attached to a stored order book, it keeps the strings of the
+// top levels next to the amounts they were formatted from, so a level is only
+// formatted again when it changes, it returns the last checksum without building
+// the payload while no level of the sides was stored or dropped, see the dirty flag
+// of the order book sides, and it decides which messages get verified at all, see
+// Exchange::order_book_checksum()
+//
+//     $checksum = $checksumHelper->reuse($bids, $asks, true);
+//     if ($checksum === null) {
+//         $level = $checksumHelper->cached('bids', $price, $amount);
+//         if ($level === null) {
+//             $level = $checksumHelper->store('bids', $price, $amount, $priceString, $amountString);
+//         }
+//         ...
+//         $checksum = $checksumHelper->crc32($payload, true);
+//     }
+
+class OrderBookChecksum {
+    public $depth; // number of levels per side covered by the checksum
+    public $every; // verify every nth message
+    public $interval; // or verify at most once per interval in milliseconds
+    public $counter = 0;
+    public $last = null;
+    public $context = null;
+    public $payload = null;
+    public $value = null;
+    public $current = false; // whether the value was computed since the sides last changed
+    public $levels = array(
+        'bids' => array(), // key -> [price string, amount string, key, amount]
+        'asks' => array(),
+    );
+
+    public function __construct($depth = 25, $every = 1, $interval = null) {
+        $this->depth = $depth;
+        $this->every = $every ? $every : 1;
+        $this->interval = $interval;
+    }
+
+    public function due() {
+        // tells whether the current message should be verified
+        if ($this->interval !== null) {
+            $now = \ccxt\Exchange::milliseconds();
+            if (($this->last !== null) && ($now - $this->last < $this->interval)) {
+                return false;
+            }
+            $this->last = $now;
+            return true;
+        }
+        $this->counter += 1;
+        if ($this->counter >= $this->every) {
+            $this->counter = 0;
+            return true;
+        }
+        return false;
+    }
+
+    public function clear() {
+        $this->levels['bids'] = array();
+        $this->levels['asks'] = array();
+        $this->payload = null;
+        $this->value = null;
+        $this->current = false;
+    }
+
+    public function track($context) {
+        // drops the cached strings when the formatting rules change, e.g. the number of decimals
+        if ($context !== $this->context) {
+            $this->clear();
+            $this->context = $context;
+        }
+    }
+
+    public function cached($side, $key, $amount) {
+        // the strings of a level, unless its amount changed since they were formatted
+        // the keys of php arrays are strings or integers, the key is compared as well
+        $level = @$this->levels[$side][strval($key)];
+        if (($level !== null) && ($level[2] === $key) && ($level[3] === $amount)) {
+            return $level;
+        }
+        return null;
+    }
+
+    public function store($side, $key, $amount, $priceString, $amountString) {
+        if (count($this->levels[$side]) >= 4 * $this->depth) {
+            // the levels that left the top are dropped all at once
+            $this->levels[$side] = array();
+        }
+        $level = array($priceString, $amountString, $key, $amount);
+        $this->levels[$side][strval($key)] = $level;
+        return $level;
+    }
+
+    public function reuse($bids, $asks, $signed = false) {
+        // the last checksum when the sides did not change since it was computed, null otherwise
+        if ($this->current && !$bids->dirty && !$asks->dirty) {
+            return $this->result($signed);
+        }
+        $bids->dirty = false;
+        $asks->dirty = false;
+        // until crc32() is called with the payload of the sides as they are now
+        $this->current = false;
+        return null;
+    }
+
+    public function crc32($payload, $signed = false) {
+        if ($payload !== $this->payload) {
+            $this->payload = $payload;
+            $this->value = \ccxt\Exchange::crc32($payload);
+        }
+        $this->current = true;
+        return $this->result($signed);
+    }
+
+    public function result($signed) {
+        if ($signed && ($this->value >= 0x80000000)) {
+            return $this->value - 0x100000000;
+        }
+        return $this->value;
+    }
+}
@@ -19,6 +19,7 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
     public $index;
     public $depth;
     public $n;
+    public $dirty = true; // set when a level is stored or dropped, cleared by OrderBookChecksum::reuse()
 
     public function __construct($deltas = array(), $depth = null) {
         parent::__construct();
@@ -36,6 +37,7 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
     }
 
     public function storeArray($delta) {
+        $this->dirty = true;
         $price = $delta[0];
         $size = $delta[1];
         $index_price = static::$side ? -$price : $price;
@@ -60,6 +62,16 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
         }
     }
 
+    public function store_many($deltas) {
+        return $this->storeMany($deltas);
+    }
+
+    public function storeMany($deltas) {
+        foreach ($deltas as $delta) {
+            $this->storeArray($delta);
+        }
+    }
+
     public function store($price, $size, $id = null) {
         $this->storeArray(array($price, $size));
     }
@@ -67,6 +79,7 @@ class OrderBookSide extends \ArrayObject implements \JsonSerializable {
     public function limit() {
         $difference = count($this) - $this->depth;
         if ($difference > 0) {
+            $this->dirty = true;
             array_splice($this->index, -$difference);
             $tmp = $this->exchangeArray(tmp);
             array_splice($tmp, -$difference);
@@ -123,6 +136,7 @@ class CountedOrderBookSide extends OrderBookSide {
     }
 
     public function storeArray($delta) {
+        $this->dirty = true;
         $price = $delta[0];
         $size = $delta[1];
         $count = $delta[2];
@@ -166,6 +180,7 @@ class IndexedOrderBookSide extends OrderBookSide {
     }
 
     public function storeArray($delta) {
+        $this->dirty = true;
         $price = $delta[0];
         $size = $delta[1];
         $id = $delta[2];
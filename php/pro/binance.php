@@ -784,9 +784,13 @@ class binance extends \ccxt\async\binance {
     }
 
     public function handle_deltas($bookside, $deltas) {
+        // parse the whole side first and apply it in one batch
+        $bidAsks = array();
         for ($i = 0; $i < count($deltas); $i++) {
-            $this->handle_delta($bookside, $deltas[$i]);
+            $delta = $deltas[$i];
+            $bidAsks[] = array( $this->safe_float($delta, 0), $this->safe_float($delta, 1) );
         }
+        $bookside->storeMany ($bidAsks);
     }
 
     public function handle_order_book_message(Client $client, $message, $orderbook) {
@@ -675,28 +675,45 @@ class bitfinex2 extends \ccxt\async\bitfinex2 {
             return;
         }
         $depth = 25; // covers the first 25 $bids and $asks
-        $stringArray = array();
+        $checksumHelper = $this->order_book_checksum($book, $depth);
+        if (!$checksumHelper->due ()) {
+            return;
+        }
         $bids = $book['bids'];
         $asks = $book['asks'];
-        $prec = $this->safe_string($subscription, 'prec', 'P0');
-        $isRaw = ($prec === 'R0');
-        $idToCheck = $isRaw ? 2 : 0;
-        // pepperoni pizza from bitfinex
-        for ($i = 0; $i < $depth; $i++) {
-            $bid = $this->safe_value($bids, $i);
-            $ask = $this->safe_value($asks, $i);
-            if ($bid !== null) {
-                $stringArray[] = $this->number_to_string($bids[$i][$idToCheck]);
-                $stringArray[] = $this->number_to_string($bids[$i][1]);
-            }
-            if ($ask !== null) {
-                $stringArray[] = $this->number_to_string($asks[$i][$idToCheck]);
-                $aski1 = $asks[$i][1];
-                $stringArray[] = $this->number_to_string(-$aski1);
+        // the top levels did not change since the last verified $message
+        $localChecksum = $checksumHelper->reuse ($bids, $asks, true);
+        if ($localChecksum === null) {
+            $stringArray = array();
+            $prec = $this->safe_string($subscription, 'prec', 'P0');
+            $isRaw = ($prec === 'R0');
+            // the raw books are keyed by order id, there can be several orders at the same price
+            $idToCheck = $isRaw ? 2 : 0;
+            // pepperoni pizza from bitfinex
+            for ($i = 0; $i < $depth; $i++) {
+                $bid = $this->safe_value($bids, $i);
+                $ask = $this->safe_value($asks, $i);
+                if ($bid !== null) {
+                    $bidStrings = $checksumHelper->cached ('bids', $bid[$idToCheck], $bid[1]);
+                    if ($bidStrings === null) {
+                        $bidStrings = $checksumHelper->store ('bids', $bid[$idToCheck], $bid[1], $this->number_to_string($bid[$idToCheck]), $this->number_to_string($bid[1]));
+                    }
+                    $stringArray[] = $bidStrings[0];
+                    $stringArray[] = $bidStrings[1];
+                }
+                if ($ask !== null) {
+                    $aski1 = $ask[1];
+                    $askStrings = $checksumHelper->cached ('asks', $ask[$idToCheck], $aski1);
+                    if ($askStrings === null) {
+                        $askStrings = $checksumHelper->store ('asks', $ask[$idToCheck], $aski1, $this->number_to_string($ask[$idToCheck]), $this->number_to_string(-$aski1));
+                    }
+                    $stringArray[] = $askStrings[0];
+                    $stringArray[] = $askStrings[1];
+                }
             }
+            $payload = implode(':', $stringArray);
+            $localChecksum = $checksumHelper->crc32 ($payload, true);
         }
-        $payload = implode(':', $stringArray);
-        $localChecksum = $this->crc32($payload, true);
         $responseChecksum = $this->safe_integer($message, 2);
         if ($responseChecksum !== $localChecksum) {
             unset($client->subscriptions[$messageHash]);
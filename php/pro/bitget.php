@@ -552,24 +552,29 @@ class bitget extends \ccxt\async\bitget {
             $storedOrderBook['datetime'] = $this->iso8601($timestamp);
             $checksum = $this->safe_bool($this->options, 'checksum', true);
             $isSnapshot = $this->safe_string($message, 'action') === 'snapshot'; // snapshot does not have a $checksum
-            if (!$isSnapshot && $checksum) {
+            $checksumHelper = $this->order_book_checksum($storedOrderBook, 25);
+            if (!$isSnapshot && $checksum && $checksumHelper->due ()) {
                 $storedAsks = $storedOrderBook['asks'];
                 $storedBids = $storedOrderBook['bids'];
-                $asksLength = count($storedAsks);
-                $bidsLength = count($storedBids);
-                $payloadArray = array();
-                for ($i = 0; $i < 25; $i++) {
-                    if ($i < $bidsLength) {
-                        $payloadArray[] = $storedBids[$i][2][0];
-                        $payloadArray[] = $storedBids[$i][2][1];
-                    }
-                    if ($i < $asksLength) {
-                        $payloadArray[] = $storedAsks[$i][2][0];
-                        $payloadArray[] = $storedAsks[$i][2][1];
+                // the top levels did not change since the last verified $message
+                $calculatedChecksum = $checksumHelper->reuse ($storedBids, $storedAsks, true);
+                if ($calculatedChecksum === null) {
+                    $asksLength = count($storedAsks);
+                    $bidsLength = count($storedBids);
+                    $payloadArray = array();
+                    for ($i = 0; $i < 25; $i++) {
+                        if ($i < $bidsLength) {
+                            $payloadArray[] = $storedBids[$i][2][0];
+                            $payloadArray[] = $storedBids[$i][2][1];
+                        }
+                        if ($i < $asksLength) {
+                            $payloadArray[] = $storedAsks[$i][2][0];
+                            $payloadArray[] = $storedAsks[$i][2][1];
+                        }
                     }
+                    $payload = implode(':', $payloadArray);
+                    $calculatedChecksum = $checksumHelper->crc32 ($payload, true);
                 }
-                $payload = implode(':', $payloadArray);
-                $calculatedChecksum = $this->crc32($payload, true);
                 $responseChecksum = $this->safe_integer($rawOrderBook, 'checksum');
                 if ($calculatedChecksum !== $responseChecksum) {
                     unset($client->subscriptions[$messageHash]);
@@ -211,23 +211,38 @@ class independentreserve extends \ccxt\async\independentreserve {
             $orderbook['datetime'] = $this->iso8601($timestamp);
         }
         $checksum = $this->handle_option('watchOrderBook', 'checksum', true);
-        if ($checksum && $receivedSnapshot) {
+        $checksumHelper = $this->order_book_checksum($orderbook, 10);
+        if ($checksum && $receivedSnapshot && $checksumHelper->due ()) {
             $storedAsks = $orderbook['asks'];
             $storedBids = $orderbook['bids'];
-            $asksLength = count($storedAsks);
-            $bidsLength = count($storedBids);
-            $payload = '';
-            for ($i = 0; $i < 10; $i++) {
-                if ($i < $bidsLength) {
-                    $payload = $payload . $this->value_to_checksum($storedBids[$i][0]) . $this->value_to_checksum($storedBids[$i][1]);
+            // the top levels did not change since the last verified $message
+            $calculatedChecksum = $checksumHelper->reuse ($storedBids, $storedAsks, true);
+            if ($calculatedChecksum === null) {
+                $asksLength = count($storedAsks);
+                $bidsLength = count($storedBids);
+                $payload = '';
+                for ($i = 0; $i < 10; $i++) {
+                    if ($i < $bidsLength) {
+                        $bid = $storedBids[$i];
+                        $bidStrings = $checksumHelper->cached ('bids', $bid[0], $bid[1]);
+                        if ($bidStrings === null) {
+                            $bidStrings = $checksumHelper->store ('bids', $bid[0], $bid[1], $this->value_to_checksum($bid[0]), $this->value_to_checksum($bid[1]));
+                        }
+                        $payload = $payload . $bidStrings[0] . $bidStrings[1];
+                    }
                 }
-            }
-            for ($i = 0; $i < 10; $i++) {
-                if ($i < $asksLength) {
-                    $payload = $payload . $this->value_to_checksum($storedAsks[$i][0]) . $this->value_to_checksum($storedAsks[$i][1]);
+                for ($i = 0; $i < 10; $i++) {
+                    if ($i < $asksLength) {
+                        $ask = $storedAsks[$i];
+                        $askStrings = $checksumHelper->cached ('asks', $ask[0], $ask[1]);
+                        if ($askStrings === null) {
+                            $askStrings = $checksumHelper->store ('asks', $ask[0], $ask[1], $this->value_to_checksum($ask[0]), $this->value_to_checksum($ask[1]));
+                        }
+                        $payload = $payload . $askStrings[0] . $askStrings[1];
+                    }
                 }
+                $calculatedChecksum = $checksumHelper->crc32 ($payload, true);
             }
-            $calculatedChecksum = $this->crc32($payload, true);
             $responseChecksum = $this->safe_integer($orderBook, 'Crc32');
             if ($calculatedChecksum !== $responseChecksum) {
                 $error = new ChecksumError ($this->id . ' ' . $this->orderbook_checksum_message($symbol));
@@ -782,26 +782,41 @@ class kraken extends \ccxt\async\kraken {
             // don't remove this line or I will poop on your face
             $orderbook->limit ();
             $checksum = $this->handle_option('watchOrderBook', 'checksum', true);
-            if ($checksum) {
+            $checksumHelper = $this->order_book_checksum($orderbook, 10);
+            if ($checksum && $checksumHelper->due ()) {
                 $priceString = $this->safe_string($example, 0);
                 $amountString = $this->safe_string($example, 1);
                 $priceParts = explode('.', $priceString);
                 $amountParts = explode('.', $amountString);
                 $priceLength = strlen($priceParts[1]) - 0;
                 $amountLength = strlen($amountParts[1]) - 0;
-                $payloadArray = array();
-                if ($c !== null) {
-                    for ($i = 0; $i < 10; $i++) {
-                        $formatted = $this->format_number($storedAsks[$i][0], $priceLength) . $this->format_number($storedAsks[$i][1], $amountLength);
-                        $payloadArray[] = $formatted;
-                    }
-                    for ($i = 0; $i < 10; $i++) {
-                        $formatted = $this->format_number($storedBids[$i][0], $priceLength) . $this->format_number($storedBids[$i][1], $amountLength);
-                        $payloadArray[] = $formatted;
+                // the formatted levels are cached until the number of decimals changes
+                $checksumHelper->track ($this->number_to_string($priceLength) . ':' . $this->number_to_string($amountLength));
+                // the top levels did not change since the last verified $message
+                $localChecksum = $checksumHelper->reuse ($storedBids, $storedAsks, false);
+                if ($localChecksum === null) {
+                    $payloadArray = array();
+                    if ($c !== null) {
+                        for ($i = 0; $i < 10; $i++) {
+                            $ask = $storedAsks[$i];
+                            $askStrings = $checksumHelper->cached ('asks', $ask[0], $ask[1]);
+                            if ($askStrings === null) {
+                                $askStrings = $checksumHelper->store ('asks', $ask[0], $ask[1], $this->format_number($ask[0], $priceLength), $this->format_number($ask[1], $amountLength));
+                            }
+                            $payloadArray[] = $askStrings[0] . $askStrings[1];
+                        }
+                        for ($i = 0; $i < 10; $i++) {
+                            $bid = $storedBids[$i];
+                            $bidStrings = $checksumHelper->cached ('bids', $bid[0], $bid[1]);
+                            if ($bidStrings === null) {
+                                $bidStrings = $checksumHelper->store ('bids', $bid[0], $bid[1], $this->format_number($bid[0], $priceLength), $this->format_number($bid[1], $amountLength));
+                            }
+                            $payloadArray[] = $bidStrings[0] . $bidStrings[1];
+                        }
                     }
+                    $payload = implode('', $payloadArray);
+                    $localChecksum = $checksumHelper->crc32 ($payload, false);
                 }
-                $payload = implode('', $payloadArray);
-                $localChecksum = $this->crc32($payload, false);
                 if ($localChecksum !== $c) {
                     $error = new ChecksumError ($this->id . ' ' . $this->orderbook_checksum_message($symbol));
                     unset($client->subscriptions[$messageHash]);
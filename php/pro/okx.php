@@ -961,28 +961,46 @@ class okx extends \ccxt\async\okx {
         if ($checksum) {
             $prevSeqId = $this->safe_integer($message, 'prevSeqId');
             $nonce = $orderbook['nonce'];
-            $asksLength = count($storedAsks);
-            $bidsLength = count($storedBids);
-            $payloadArray = array();
-            for ($i = 0; $i < 25; $i++) {
-                if ($i < $bidsLength) {
-                    $payloadArray[] = $this->number_to_string($storedBids[$i][0]);
-                    $payloadArray[] = $this->number_to_string($storedBids[$i][1]);
-                }
-                if ($i < $asksLength) {
-                    $payloadArray[] = $this->number_to_string($storedAsks[$i][0]);
-                    $payloadArray[] = $this->number_to_string($storedAsks[$i][1]);
-                }
-            }
-            $payload = implode(':', $payloadArray);
-            $responseChecksum = $this->safe_integer($message, 'checksum');
-            $localChecksum = $this->crc32($payload, true);
             $error = null;
             if ($prevSeqId !== -1 && $nonce !== $prevSeqId) {
                 $error = new InvalidNonce ($this->id . ' watchOrderBook received invalid nonce');
             }
-            if ($responseChecksum !== $localChecksum) {
-                $error = new ChecksumError ($this->id . ' ' . $this->orderbook_checksum_message($symbol));
+            $checksumHelper = $this->order_book_checksum($orderbook, 25);
+            if ($checksumHelper->due ()) {
+                // the top levels did not change since the last verified $message
+                $localChecksum = $checksumHelper->reuse ($storedBids, $storedAsks, true);
+                if ($localChecksum === null) {
+                    $asksLength = count($storedAsks);
+                    $bidsLength = count($storedBids);
+                    $payloadArray = array();
+                    for ($i = 0; $i < 25; $i++) {
+                        if ($i < $bidsLength) {
+                            $bid = $storedBids[$i];
+                            // the levels are formatted once per amount
+                            $bidStrings = $checksumHelper->cached ('bids', $bid[0], $bid[1]);
+                            if ($bidStrings === null) {
+                                $bidStrings = $checksumHelper->store ('bids', $bid[0], $bid[1], $this->number_to_string($bid[0]), $this->number_to_string($bid[1]));
+                            }
+                            $payloadArray[] = $bidStrings[0];
+                            $payloadArray[] = $bidStrings[1];
+                        }
+                        if ($i < $asksLength) {
+                            $ask = $storedAsks[$i];
+                            $askStrings = $checksumHelper->cached ('asks', $ask[0], $ask[1]);
+                            if ($askStrings === null) {
+                                $askStrings = $checksumHelper->store ('asks', $ask[0], $ask[1], $this->number_to_string($ask[0]), $this->number_to_string($ask[1]));
+                            }
+                            $payloadArray[] = $askStrings[0];
+                            $payloadArray[] = $askStrings[1];
+                        }
+                    }
+                    $payload = implode(':', $payloadArray);
+                    $localChecksum = $checksumHelper->crc32 ($payload, true);
+                }
+                $responseChecksum = $this->safe_integer($message, 'checksum');
+                if ($responseChecksum !== $localChecksum) {
+                    $error = new ChecksumError ($this->id . ' ' . $this->orderbook_checksum_message($symbol));
+                }
             }
             if ($error !== null) {
                 unset($client->subscriptions[$messageHash]);
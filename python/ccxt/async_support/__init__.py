@@ -61,114 +61,9 @@ from ccxt.base.errors import CancelPending                            # noqa: F4
 from ccxt.base.errors import error_hierarchy                          # noqa: F401
 
 
-from ccxt.async_support.ace import ace                                          # noqa: F401
-from ccxt.async_support.alpaca import alpaca                                    # noqa: F401
-from ccxt.async_support.ascendex import ascendex                                # noqa: F401
-from ccxt.async_support.bequant import bequant                                  # noqa: F401
-from ccxt.async_support.bigone import bigone                                    # noqa: F401
-from ccxt.async_support.binance import binance                                  # noqa: F401
-from ccxt.async_support.binancecoinm import binancecoinm                        # noqa: F401
-from ccxt.async_support.binanceus import binanceus                              # noqa: F401
-from ccxt.async_support.binanceusdm import binanceusdm                          # noqa: F401
-from ccxt.async_support.bingx import bingx                                      # noqa: F401
-from ccxt.async_support.bit2c import bit2c                                      # noqa: F401
-from ccxt.async_support.bitbank import bitbank                                  # noqa: F401
-from ccxt.async_support.bitbay import bitbay                                    # noqa: F401
-from ccxt.async_support.bitbns import bitbns                                    # noqa: F401
-from ccxt.async_support.bitcoincom import bitcoincom                            # noqa: F401
-from ccxt.async_support.bitfinex import bitfinex                                # noqa: F401
-from ccxt.async_support.bitfinex2 import bitfinex2                              # noqa: F401
-from ccxt.async_support.bitflyer import bitflyer                                # noqa: F401
-from ccxt.async_support.bitget import bitget                                    # noqa: F401
-from ccxt.async_support.bithumb import bithumb                                  # noqa: F401
-from ccxt.async_support.bitmart import bitmart                                  # noqa: F401
-from ccxt.async_support.bitmex import bitmex                                    # noqa: F401
-from ccxt.async_support.bitopro import bitopro                                  # noqa: F401
-from ccxt.async_support.bitpanda import bitpanda                                # noqa: F401
-from ccxt.async_support.bitrue import bitrue                                    # noqa: F401
-from ccxt.async_support.bitso import bitso                                      # noqa: F401
-from ccxt.async_support.bitstamp import bitstamp                                # noqa: F401
-from ccxt.async_support.bitteam import bitteam                                  # noqa: F401
-from ccxt.async_support.bitvavo import bitvavo                                  # noqa: F401
-from ccxt.async_support.bl3p import bl3p                                        # noqa: F401
-from ccxt.async_support.blockchaincom import blockchaincom                      # noqa: F401
-from ccxt.async_support.blofin import blofin                                    # noqa: F401
-from ccxt.async_support.btcalpha import btcalpha                                # noqa: F401
-from ccxt.async_support.btcbox import btcbox                                    # noqa: F401
-from ccxt.async_support.btcmarkets import btcmarkets                            # noqa: F401
-from ccxt.async_support.btcturk import btcturk                                  # noqa: F401
-from ccxt.async_support.bybit import bybit                                      # noqa: F401
-from ccxt.async_support.cex import cex                                          # noqa: F401
-from ccxt.async_support.coinbase import coinbase                                # noqa: F401
-from ccxt.async_support.coinbaseadvanced import coinbaseadvanced                # noqa: F401
-from ccxt.async_support.coinbaseexchange import coinbaseexchange                # noqa: F401
-from ccxt.async_support.coinbaseinternational import coinbaseinternational      # noqa: F401
-from ccxt.async_support.coincheck import coincheck                              # noqa: F401
-from ccxt.async_support.coinex import coinex                                    # noqa: F401
-from ccxt.async_support.coinlist import coinlist                                # noqa: F401
-from ccxt.async_support.coinmate import coinmate                                # noqa: F401
-from ccxt.async_support.coinmetro import coinmetro                              # noqa: F401
-from ccxt.async_support.coinone import coinone                                  # noqa: F401
-from ccxt.async_support.coinsph import coinsph                                  # noqa: F401
-from ccxt.async_support.coinspot import coinspot                                # noqa: F401
-from ccxt.async_support.cryptocom import cryptocom                              # noqa: F401
-from ccxt.async_support.currencycom import currencycom                          # noqa: F401
-from ccxt.async_support.delta import delta                                      # noqa: F401
-from ccxt.async_support.deribit import deribit                                  # noqa: F401
-from ccxt.async_support.digifinex import digifinex                              # noqa: F401
-from ccxt.async_support.exmo import exmo                                        # noqa: F401
-from ccxt.async_support.fmfwio import fmfwio                                    # noqa: F401
-from ccxt.async_support.gate import gate                                        # noqa: F401
-from ccxt.async_support.gateio import gateio                                    # noqa: F401
-from ccxt.async_support.gemini import gemini                                    # noqa: F401
-from ccxt.async_support.hitbtc import hitbtc                                    # noqa: F401
-from ccxt.async_support.hitbtc3 import hitbtc3                                  # noqa: F401
-from ccxt.async_support.hollaex import hollaex                                  # noqa: F401
-from ccxt.async_support.htx import htx                                          # noqa: F401
-from ccxt.async_support.huobi import huobi                                      # noqa: F401
-from ccxt.async_support.huobijp import huobijp                                  # noqa: F401
-from ccxt.async_support.hyperliquid import hyperliquid                          # noqa: F401
-from ccxt.async_support.idex import idex                                        # noqa: F401
-from ccxt.async_support.independentreserve import independentreserve            # noqa: F401
-from ccxt.async_support.indodax import indodax                                  # noqa: F401
-from ccxt.async_support.kraken import kraken                                    # noqa: F401
-from ccxt.async_support.krakenfutures import krakenfutures                      # noqa: F401
-from ccxt.async_support.kucoin import kucoin                                    # noqa: F401
-from ccxt.async_support.kucoinfutures import kucoinfutures                      # noqa: F401
-from ccxt.async_support.kuna import kuna                                        # noqa: F401
-from ccxt.async_support.latoken import latoken                                  # noqa: F401
-from ccxt.async_support.lbank import lbank                                      # noqa: F401
-from ccxt.async_support.luno import luno                                        # noqa: F401
-from ccxt.async_support.lykke import lykke                                      # noqa: F401
-from ccxt.async_support.mercado import mercado                                  # noqa: F401
-from ccxt.async_support.mexc import mexc                                        # noqa: F401
-from ccxt.async_support.ndax import ndax                                        # noqa: F401
-from ccxt.async_support.novadax import novadax                                  # noqa: F401
-from ccxt.async_support.oceanex import oceanex                                  # noqa: F401
-from ccxt.async_support.okcoin import okcoin                                    # noqa: F401
-from ccxt.async_support.okx import okx                                          # noqa: F401
-from ccxt.async_support.onetrading import onetrading                            # noqa: F401
-from ccxt.async_support.oxfun import oxfun                                      # noqa: F401
-from ccxt.async_support.p2b import p2b                                          # noqa: F401
-from ccxt.async_support.paymium import paymium                                  # noqa: F401
-from ccxt.async_support.phemex import phemex                                    # noqa: F401
-from ccxt.async_support.poloniex import poloniex                                # noqa: F401
-from ccxt.async_support.poloniexfutures import poloniexfutures                  # noqa: F401
-from ccxt.async_support.probit import probit                                    # noqa: F401
-from ccxt.async_support.timex import timex                                      # noqa: F401
-from ccxt.async_support.tokocrypto import tokocrypto                            # noqa: F401
-from ccxt.async_support.tradeogre import tradeogre                              # noqa: F401
-from ccxt.async_support.upbit import upbit                                      # noqa: F401
-from ccxt.async_support.vertex import vertex                                    # noqa: F401
-from ccxt.async_support.wavesexchange import wavesexchange                      # noqa: F401
-from ccxt.async_support.wazirx import wazirx                                    # noqa: F401
-from ccxt.async_support.whitebit import whitebit                                # noqa: F401
-from ccxt.async_support.woo import woo                                          # noqa: F401
-from ccxt.async_support.woofipro import woofipro                                # noqa: F401
-from ccxt.async_support.xt import xt                                            # noqa: F401
-from ccxt.async_support.yobit import yobit                                      # noqa: F401
-from ccxt.async_support.zaif import zaif                                        # noqa: F401
-from ccxt.async_support.zonda import zonda                                      # noqa: F401
+# exchange classes are imported on first access, e.g. ccxt.binance or from ccxt import binance
+import sys  # noqa: E402
+from ccxt.base.lazy_exchanges import ExchangesPackage, load_exchange  # noqa: E402
 
 exchanges = [
     'ace',
@@ -288,3 +183,14 @@ base = [
 ]
 
 __all__ = base + errors.__all__ + exchanges
+
+
+def __getattr__(name):
+    return load_exchange(__name__, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(exchanges))
+
+
+sys.modules[__name__].__class__ = ExchangesPackage
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import collections
+import hashlib
+import json
+import os
+import tempfile
+
+from ccxt.base.errors import ArgumentsRequired
+from ccxt.base.errors import NetworkError
+
+# -----------------------------------------------------------------------------
+# downloads a long history of candles or trades as time windows fetched concurrently,
+# as many at a time as the rate limit allows, and streams them in timestamp order
+#
+#     checkpoint = BackfillCheckpoint('~/.ccxt/backfill')
+#     async for candles in exchange.backfill('fetchOHLCV', 'BTC/USDT', since, until, '1m', checkpoint=checkpoint):
+#         store(candles)  # one window at a time, the next ones are fetched meanwhile
+#
+# a window of candles is one request of maxEntriesPerRequest candles, a window of trades is an hour
+# by default, a window is paginated forward until it is complete, the rows repeated at the page
+# boundaries are dropped with a rolling set of the recently seen keys
+#
+# the checkpoint keeps the end of the windows the caller has consumed, after a failure the same
+# backfill continues from there instead of since, the network errors of a request are retried with
+# a backoff first, up to the maxRetries option of the method (3 by default)
+
+OHLCV_METHODS = ['fetchOHLCV', 'fetchMarkOHLCV', 'fetchIndexOHLCV', 'fetchPremiumIndexOHLCV']
+
+
+class BackfillCheckpoint(object):
+    def __init__(self, path='~/.ccxt/backfill'):
+        self.path = os.path.expanduser(path)
+
+    def filename(self, key):
+        data = json.dumps(key, sort_keys=True, default=str)
+        return os.path.join(self.path, str(key['id']) + '-' + hashlib.sha1(data.encode()).hexdigest()[0:16] + '.json')
+
+    def load(self, key):
+        # the timestamp the backfill of the key has reached or None
+        try:
+            with open(self.filename(key)) as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != json.loads(json.dumps(key, default=str)):
+            return None
+        return entry.get('timestamp')
+
+    def save(self, key, timestamp):
+        data = json.dumps({'key': key, 'timestamp': timestamp}, default=str)
+        os.makedirs(self.path, exist_ok=True)
+        # written aside and renamed, a crash never leaves a partial file
+        descriptor, temporary = tempfile.mkstemp(dir=self.path, prefix='.' + str(key['id']) + '-')
+        try:
+            with os.fdopen(descriptor, 'w') as file:
+                file.write(data)
+            os.replace(temporary, self.filename(key))
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    def clear(self, key):
+        try:
+            os.remove(self.filename(key))
+        except OSError:
+            pass
+
+
+class RollingDedup(object):
+    # remembers the last size keys only
+
+    def __init__(self, size):
+        self.size = size
+        self.keys = set()
+        self.order = collections.deque()
+
+    def seen(self, key):
+        if key in self.keys:
+            return True
+        self.keys.add(key)
+        self.order.append(key)
+        if len(self.order) > self.size:
+            self.keys.discard(self.order.popleft())
+        return False
+
+
+class Backfill(object):
+    def __init__(self, exchange, method, symbol, since, until=None, timeframe=None, params={}, checkpoint=None, concurrency=None, window=None):
+        if since is None:
+            raise ArgumentsRequired(exchange.id + ' backfill() requires a since argument')
+        self.exchange = exchange
+        self.method = method
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.ohlcv = method in OHLCV_METHODS
+        self.maxRetries, params = exchange.handle_option_and_params(params, method, 'maxRetries', 3)
+        self.limit, params = exchange.handle_max_entries_per_request_and_params(method, None, params)
+        self.params = params
+        self.until = exchange.milliseconds() if until is None else until
+        self.duration = exchange.parse_timeframe(timeframe) * 1000 if self.ohlcv else None  # of a candle
+        if window is None:
+            window = self.duration * self.limit if self.ohlcv else 3600000
+        self.window = window
+        self.concurrency = self.budget() if concurrency is None else concurrency
+        self.checkpoint = checkpoint
+        self.key = {
+            'id': exchange.id,
+            'method': method,
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'since': since,
+            'until': until,
+        }
+        self.since = since
+        if checkpoint is not None:
+            reached = checkpoint.load(self.key)
+            if reached is not None:
+                self.since = max(since, reached)
+        self.position = self.since  # the end of the windows consumed so far
+        self.retryDelay = 1000  # milliseconds, doubled with every retry
+
+    def budget(self):
+        # the requests per second of the rate limit, the throttler spaces them out
+        refillRate = self.exchange.tokenBucket['refillRate']
+        if not self.exchange.enableRateLimit or refillRate == float('inf'):
+            return 50
+        return max(1, min(50, int(refillRate * 1000)))
+
+    def windows(self):
+        start = self.since
+        while start < self.until:
+            end = min(start + self.window, self.until)
+            yield start, end
+            start = end
+
+    def timestamp(self, row):
+        return row[0] if self.ohlcv else row.get('timestamp')
+
+    def identity(self, row):
+        if self.ohlcv:
+            return row[0]
+        id = row.get('id')
+        if id is not None:
+            return id
+        return (row.get('timestamp'), row.get('price'), row.get('amount'), row.get('side'))
+
+    async def call(self, since):
+        errors = 0
+        while True:
+            try:
+                fetch = getattr(self.exchange, self.method)
+                if self.timeframe and self.method != 'fetchFundingRateHistory':
+                    return await fetch(self.symbol, self.timeframe, since, self.limit, dict(self.params))
+                return await fetch(self.symbol, since, self.limit, dict(self.params))
+            except NetworkError:
+                errors += 1
+                if errors > self.maxRetries:
+                    raise
+                await self.exchange.sleep(self.retryDelay * 2 ** (errors - 1))
+
+    async def fetch(self, start, end):
+        # the rows of a window, [start, end)
+        result = []
+        dedup = RollingDedup(self.limit * 2)
+        cursor = start
+        while cursor < end:
+            response = await self.call(cursor)
+            if not response:
+                break
+            for row in response:
+                timestamp = self.timestamp(row)
+                if timestamp is not None and start <= timestamp < end and not dedup.seen(self.identity(row)):
+                    result.append(row)
+            last = self.timestamp(response[-1])
+            if last is None or last < cursor:
+                # the exchange ignores since
+                break
+            if self.ohlcv:
+                cursor = last + self.duration
+            else:
+                # the trades of the same millisecond can span two pages, the repeated ones are dropped
+                cursor = last if last > cursor else last + 1
+        return result
+
+    async def chunks(self):
+        # the rows of each window in order, the windows with no rows are skipped
+        windows = self.windows()
+        pending = collections.deque()
+
+        def schedule():
+            for start, end in windows:
+                pending.append((end, asyncio.ensure_future(self.fetch(start, end))))
+                return
+
+        try:
+            for i in range(0, self.concurrency):
+                schedule()
+            while pending:
+                end, task = pending[0]
+                rows = await task
+                pending.popleft()
+                schedule()
+                if rows:
+                    yield rows
+                # the caller asked for the next rows, it is done with these
+                self.position = end
+                if self.checkpoint is not None:
+                    self.checkpoint.save(self.key, end)
+        finally:
+            tasks = [task for end, task in pending]
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
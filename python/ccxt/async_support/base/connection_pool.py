@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import ssl
+
+import aiohttp
+
+# -----------------------------------------------------------------------------
+# one aiohttp session per event loop and tls settings, shared by every exchange
+# instance created with {'connectionPool': pool}, so the instances reuse the same
+# keep-alive connections and dns cache instead of opening their own
+#
+#     pool = ConnectionPool({'limitPerHost': 20, 'keepAliveTimeout': 60})
+#     binance = ccxt.async_support.binance({'connectionPool': pool})
+#     bybit = ccxt.async_support.bybit({'connectionPool': pool})
+#     ...
+#     await pool.close()  # the exchanges do not close the shared sessions
+#
+# aiohttp speaks HTTP/1.1 only, the connections are reused with keep-alive
+
+
+class ConnectionPool(object):
+    def __init__(self, config={}):
+        self.config = {
+            'limit': 100,  # connections in total
+            'limitPerHost': 0,  # connections per host, 0 for no limit
+            'keepAliveTimeout': 30,  # seconds an idle connection is kept open
+            'dnsCacheTtl': 300,  # seconds, None caches forever
+            'enableCleanupClosed': True,
+        }
+        self.config.update(config)
+        self.sessions = {}
+        self.ssl_contexts = {}
+        self.statistics = {
+            'sessions': 0,
+            'connectionsCreated': 0,
+            'connectionsReused': 0,
+            'dnsCacheHits': 0,
+            'dnsCacheMisses': 0,
+            'requests': 0,
+        }
+
+    def ssl_context(self, verify, cafile):
+        # loading the certificates is slow, the context is shared as well
+        if not verify:
+            return verify
+        key = cafile
+        if key not in self.ssl_contexts:
+            self.ssl_contexts[key] = ssl.create_default_context(cafile=cafile)
+        return self.ssl_contexts[key]
+
+    def session(self, loop, ssl_context, trust_env=False):
+        key = (loop, id(ssl_context) if ssl_context else ssl_context, trust_env)
+        session = self.sessions.get(key)
+        if session is None or session.closed:
+            # the sessions of finished event loops cannot be used anymore
+            self.sessions = dict((k, v) for k, v in self.sessions.items() if not k[0].is_closed())
+            connector = aiohttp.TCPConnector(
+                ssl=ssl_context,
+                limit=self.config['limit'],
+                limit_per_host=self.config['limitPerHost'],
+                keepalive_timeout=self.config['keepAliveTimeout'],
+                ttl_dns_cache=self.config['dnsCacheTtl'],
+                enable_cleanup_closed=self.config['enableCleanupClosed'],
+            )
+            # the cookies of one exchange must not be sent to another one
+            session = aiohttp.ClientSession(connector=connector, trust_env=trust_env, cookie_jar=aiohttp.DummyCookieJar(), trace_configs=[self.trace_config()])
+            self.sessions[key] = session
+            self.statistics['sessions'] += 1
+        return session
+
+    def trace_config(self):
+        statistics = self.statistics
+
+        async def on_request_start(session, context, params):
+            statistics['requests'] += 1
+
+        async def on_connection_create_end(session, context, params):
+            statistics['connectionsCreated'] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            statistics['connectionsReused'] += 1
+
+        async def on_dns_cache_hit(session, context, params):
+            statistics['dnsCacheHits'] += 1
+
+        async def on_dns_cache_miss(session, context, params):
+            statistics['dnsCacheMisses'] += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def stats(self):
+        result = dict(self.statistics)
+        connections = result['connectionsCreated'] + result['connectionsReused']
+        result['hitRate'] = result['connectionsReused'] / connections if connections else 0.0
+        return result
+
+    async def close(self):
+        sessions = list(self.sessions.values())
+        self.sessions = {}
+        await asyncio.gather(*[session.close() for session in sessions if not session.closed])
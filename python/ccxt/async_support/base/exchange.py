@@ -20,12 +20,16 @@ from ccxt.base.types import Int, Str, Num, Strings
 
 # -----------------------------------------------------------------------------
 
-from ccxt.async_support.base.throttler import Throttler
+from ccxt.async_support.base.throttler import Throttler, TokenBucketThrottler
+from ccxt.async_support.base.backfill import Backfill
 
 # -----------------------------------------------------------------------------
 
 from ccxt.base.errors import BaseError, NetworkError, BadSymbol, BadRequest, BadResponse, ExchangeError, ExchangeNotAvailable, RequestTimeout, NotSupported, NullResponse, InvalidAddress, RateLimitExceeded
 from ccxt.base.types import OrderType, OrderSide, OrderRequest, CancellationRequest
+from ccxt.base.order_template import OrderTemplate
+from ccxt.base import ohlcv_array
+from ccxt.base.profiler import active_request
 
 # -----------------------------------------------------------------------------
 
@@ -37,6 +41,8 @@ from ccxt.async_support.base.ws.functions import inflate, inflate64, gunzip
 from ccxt.async_support.base.ws.fast_client import FastClient
 from ccxt.async_support.base.ws.future import Future
 from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook
+from ccxt.async_support.base.ws.order_book import SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook
+from ccxt.async_support.base.ws.order_book_checksum import OrderBookChecksum
 
 
 # -----------------------------------------------------------------------------
@@ -78,9 +84,17 @@ class Exchange(BaseExchange):
         self.init_rest_rate_limiter()
         self.markets_loading = None
         self.reloading_markets = False
+        self.markets_refreshing = None
 
     def init_rest_rate_limiter(self):
-        self.throttle = Throttler(self.tokenBucket, self.asyncio_loop)
+        self.throttle = self.create_throttler(self.rateLimiter)
+
+    def create_throttler(self, limiter=None):
+        # tokenBucket['scheduler']: 'looper' polls the bucket every delay, 'timer' sleeps exactly until the tokens are there
+        # the named rate limit buckets and the shared backends always use the timer
+        if limiter is not None or self.tokenBucket.get('scheduler') == 'timer':
+            return TokenBucketThrottler(self.tokenBucket, self.asyncio_loop, limiter)
+        return Throttler(self.tokenBucket, self.asyncio_loop)
 
     def get_event_loop(self):
         return self.asyncio_loop
@@ -109,18 +123,27 @@ class Exchange(BaseExchange):
             self.throttle.loop = self.asyncio_loop
 
         if self.ssl_context is None:
-            # Create our SSL context object with our CA cert file
-            self.ssl_context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
+            if self.connectionPool is not None:
+                self.ssl_context = self.connectionPool.ssl_context(self.verify, self.cafile)
+            else:
+                # Create our SSL context object with our CA cert file
+                self.ssl_context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
 
-        if self.own_session and self.session is None:
+        if self.own_session and self.session is None and self.connectionPool is not None:
+            # shared with the other instances of the pool
+            self.session = self.connectionPool.session(self.asyncio_loop, self.ssl_context, self.aiohttp_trust_env)
+        elif self.own_session and self.session is None:
             # Pass this SSL context to aiohttp and create a TCPConnector
             connector = aiohttp.TCPConnector(ssl=self.ssl_context, loop=self.asyncio_loop, enable_cleanup_closed=True)
             self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
 
     async def close(self):
+        if self.markets_refreshing is not None:
+            self.markets_refreshing.cancel()
+            self.markets_refreshing = None
         await self.ws_close()
         if self.session is not None:
-            if self.own_session:
+            if self.own_session and self.connectionPool is None:
                 await self.session.close()
             self.session = None
         await self.close_proxy_sessions()
@@ -187,6 +210,9 @@ class Exchange(BaseExchange):
 
         request_body = body
         encoded_body = body.encode() if body else None
+        profiled = None if self.profiler is None else active_request.get()
+        if profiled is not None:
+            profiled.bytes_out = len(encoded_body) if encoded_body else 0
         self.open()
         final_session = proxy_session if proxy_session is not None else self.session
         session_method = getattr(final_session, method.lower())
@@ -213,11 +239,18 @@ class Exchange(BaseExchange):
                 http_status_code = response.status
                 http_status_text = response.reason
                 http_response = self.on_rest_response(http_status_code, http_status_text, url, method, headers, http_response, request_headers, request_body)
+                if profiled is not None:
+                    profiled.lap('network')
+                    profiled.bytes_in = len(await response.read())  # the body read by text(), in bytes
                 json_response = self.parse_json(http_response)
+                if profiled is not None:
+                    profiled.lap('json')
                 if self.enableLastHttpResponse:
                     self.last_http_response = http_response
                 if self.enableLastResponseHeaders:
                     self.last_response_headers = headers
+                if self.rateLimiter is not None:
+                    self.rateLimiter.update(headers)
                 if self.enableLastJsonResponse:
                     self.last_json_response = json_response
                 if self.verbose:
@@ -242,6 +275,8 @@ class Exchange(BaseExchange):
 
         self.handle_errors(http_status_code, http_status_text, url, method, headers, http_response, json_response, request_headers, request_body)
         self.handle_http_status_code(http_status_code, http_status_text, url, method, http_response)
+        if profiled is not None:
+            profiled.lap('errors')
         if json_response is not None:
             return json_response
         if self.is_text_response(headers):
@@ -256,11 +291,39 @@ class Exchange(BaseExchange):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            if self.attach_shared_markets(params):
+                return self.markets
+            loading = self.marketRegistry.loading(self, asyncio.get_running_loop()) if self.marketRegistry is not None and not params else None
+            if loading is not None:
+                # another instance is fetching the same markets, fetched again here if it fails
+                try:
+                    await asyncio.shield(loading)
+                except Exception:
+                    pass
+                if self.attach_shared_markets(params):
+                    return self.markets
+            cached = self.load_cached_markets(params)
+            if cached is not None:
+                if not self.marketsCache.expired(cached):
+                    return self.set_cached_markets(cached)
+                if self.marketsCache.background:
+                    # the expired markets are used until the fresh ones arrive
+                    self.markets_refreshing = asyncio.ensure_future(self.refresh_markets(params))
+                    self.markets_refreshing.add_done_callback(lambda future: future.cancelled() or future.exception())
+                    return self.set_cached_markets(cached)
+            if self.marketRegistry is not None and not params:
+                self.marketRegistry.set_loading(self, asyncio.current_task())
+        return await self.refresh_markets(params)
+
+    async def refresh_markets(self, params={}):
+        options = self.deep_extend({}, self.options)  # a copy of the nested dicts too, some are changed in place
         currencies = None
         if self.has['fetchCurrencies'] is True:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
-        return self.set_markets(markets, currencies)
+        self.set_markets(markets, currencies)
+        self.save_cached_markets(markets, currencies, self.changed_options(options), params)
+        return self.markets  # the read-only ones once published to the market registry
 
     async def load_markets(self, reload=False, params={}):
         if (reload and not self.reloading_markets) or not self.markets_loading:
@@ -301,6 +364,38 @@ class Exchange(BaseExchange):
     async def fetchOHLCVC(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         return await self.fetch_ohlcvc(symbol, timeframe, since, limit, params)
 
+    async def fetch_ohlcv_array(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.check_ohlcv_array()
+        with ohlcv_array.Columns(self) as columns:
+            ohlcvs = await self.fetch_ohlcv(symbol, timeframe, since, limit, params)
+        return ohlcv_array.filter_by_since_limit(columns.array(ohlcvs), since, limit)
+
+    async def order_template(self, symbol, type, side, params={}):
+        await self.load_markets()
+        template = OrderTemplate(self, symbol, type, side, params)
+        for amount, price in template.samples():
+            with template.capture(amount, price, True) as capture:
+                await capture.exchange.create_order(symbol, type, side, amount, price, self.extend(params))
+        return template.prepare()
+
+    async def create_order_from_template(self, template, amount, price=None, params={}):
+        request = template.request
+        params = template.fill(amount, price, params)
+        with self.profiled_request(request['path'], request['api'], request['method']):
+            if self.enableRateLimit:
+                await self.throttle(template.cost, self.rate_limit_debits(request['api'], request['path'], request['method'], template.cost, request['config']))
+            self.lastRestRequestTimestamp = self.milliseconds()
+            headers = request['headers']
+            signed = self.sign(request['path'], request['api'], request['method'], params, dict(headers) if headers else headers, request['body'])
+            self.last_request_headers = signed['headers']
+            self.last_request_body = signed['body']
+            self.last_request_url = signed['url']
+            return await self.fetch(signed['url'], signed['method'], signed['headers'], signed['body'])
+
+    def backfill(self, method, symbol, since, until=None, timeframe=None, params={}, checkpoint=None, concurrency=None, window=None):
+        """Returns an async generator of the candles or trades between since and until, a list per time window, see ccxt/async_support/base/backfill.py"""
+        return Backfill(self, method, symbol, since, until, timeframe, params, checkpoint, concurrency, window).chunks()
+
     async def fetch_full_tickers(self, symbols=None, params={}):
         return await self.fetch_tickers(symbols, params)
 
@@ -341,14 +436,36 @@ class Exchange(BaseExchange):
     def gunzip(data):
         return gunzip(data)
 
+    def is_sorted_order_book_storage(self):
+        # 'list' (default) or 'sorted', the latter is faster for deep books with frequent deltas
+        return self.handle_option('watchOrderBook', 'orderBookStorage', 'list') == 'sorted'
+
+    def is_order_book_truncated(self):
+        # with storeFullOrderBook the levels beyond the depth are kept and only hidden from the user
+        return not self.handle_option('watchOrderBook', 'storeFullOrderBook', False)
+
     def order_book(self, snapshot={}, depth=None):
-        return OrderBook(snapshot, depth)
+        if self.is_sorted_order_book_storage():
+            return SortedOrderBook(snapshot, depth, self.is_order_book_truncated())
+        return OrderBook(snapshot, depth, self.is_order_book_truncated())
 
     def indexed_order_book(self, snapshot={}, depth=None):
-        return IndexedOrderBook(snapshot, depth)
+        if self.is_sorted_order_book_storage():
+            return SortedIndexedOrderBook(snapshot, depth, self.is_order_book_truncated())
+        return IndexedOrderBook(snapshot, depth, self.is_order_book_truncated())
 
     def counted_order_book(self, snapshot={}, depth=None):
-        return CountedOrderBook(snapshot, depth)
+        if self.is_sorted_order_book_storage():
+            return SortedCountedOrderBook(snapshot, depth, self.is_order_book_truncated())
+        return CountedOrderBook(snapshot, depth, self.is_order_book_truncated())
+
+    def order_book_checksum(self, orderbook, depth=25):
+        # the checksum helper of a stored order book, verifying every message unless configured otherwise
+        if orderbook.checksum is None:
+            every = self.handle_option('watchOrderBook', 'checksumEvery', 1)
+            interval = self.handle_option('watchOrderBook', 'checksumInterval')  # milliseconds
+            orderbook.checksum = OrderBookChecksum(depth, every, interval)
+        return orderbook.checksum
 
     def client(self, url):
         self.clients = self.clients or {}
@@ -363,8 +480,9 @@ class Exchange(BaseExchange):
                 'log': getattr(self, 'log'),
                 'ping': getattr(self, 'ping', None),
                 'verbose': self.verbose,
-                'throttle': Throttler(self.tokenBucket, self.asyncio_loop),
+                'throttle': self.create_throttler(),
                 'asyncio_loop': self.asyncio_loop,
+                'json_decoder': self.json_decoder,
             }, ws_options)
             self.clients[url] = FastClient(url, on_message, on_error, on_close, on_connected, options)
             self.clients[url].proxy = self.get_ws_proxy()
@@ -820,7 +938,7 @@ class Exchange(BaseExchange):
     async def fetch2(self, path, api: Any = 'public', method='GET', params={}, headers: Any = None, body: Any = None, config={}):
         if self.enableRateLimit:
             cost = self.calculate_rate_limiter_cost(api, method, path, params, config)
-            await self.throttle(cost)
+            await self.throttle(cost, self.rate_limit_debits(api, path, method, cost, config))
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         self.last_request_headers = request['headers']
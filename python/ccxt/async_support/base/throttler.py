@@ -39,7 +39,8 @@ class Throttler:
                 last_timestamp = now
                 self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
 
-    def __call__(self, cost=None):
+    def __call__(self, cost=None, debits=None):
+        # debits of named rate limit buckets are only handled by the TokenBucketThrottler
         future = asyncio.Future()
         if len(self.queue) > self.config['maxCapacity']:
             raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
@@ -48,3 +49,105 @@ class Throttler:
             self.running = True
             asyncio.ensure_future(self.looper(), loop=self.loop)
         return future
+
+
+class TokenBucketThrottler(Throttler):
+    # same token bucket as the looper, but instead of polling every delay it computes
+    # how long the request at the head of the queue has to wait for its tokens
+    # and schedules a single wakeup at that moment with loop.call_at()
+
+    def __init__(self, config, loop=None, limiter=None):
+        super(TokenBucketThrottler, self).__init__(config, loop)
+        self.limiter = limiter  # a RateLimiter with named buckets, used by requests that come with debits
+        self.timer = None
+        self.last_timestamp = None
+        self.statistics = {
+            'granted': 0,
+            'cancelled': 0,
+            'wakeups': 0,
+            'maxQueued': 0,
+            'totalWait': 0.0,
+            'maxWait': 0.0,
+        }
+
+    def get_loop(self):
+        if self.loop is None:
+            self.loop = asyncio.get_event_loop()
+        return self.loop
+
+    def refill(self, now):
+        # tokens accrue with the wall clock, also while the queue is empty
+        if self.last_timestamp is not None:
+            elapsed = now - self.last_timestamp
+            if elapsed > 0:
+                self.config['tokens'] = min(self.config['tokens'] + elapsed * self.config['refillRate'], self.config['capacity'])
+        self.last_timestamp = now
+
+    def release(self):
+        self.timer = None
+        loop = self.get_loop()
+        now = loop.time() * 1000
+        self.refill(now)
+        statistics = self.statistics
+        delay = 0
+        while self.queue:
+            future, cost, timestamp, debits = self.queue[0]
+            if future.done():
+                # cancelled while waiting, it does not consume tokens
+                self.queue.popleft()
+                statistics['cancelled'] += 1
+                continue
+            if debits is None:
+                if self.config['tokens'] < 0:
+                    # exact time until the balance is back to zero
+                    delay = -self.config['tokens'] / self.config['refillRate']
+                    break
+                self.config['tokens'] -= self.config['cost'] if cost is None else cost
+            else:
+                # the named buckets of the request replace the default one
+                delay = self.limiter.acquire(debits)
+                if delay > 0:
+                    break
+            self.queue.popleft()
+            future.set_result(None)
+            wait = now - timestamp
+            statistics['granted'] += 1
+            statistics['totalWait'] += wait
+            if wait > statistics['maxWait']:
+                statistics['maxWait'] = wait
+        self.running = len(self.queue) > 0
+        if self.running:
+            self.timer = loop.call_at(loop.time() + delay / 1000, self.wakeup)
+
+    def wakeup(self):
+        self.statistics['wakeups'] += 1
+        self.release()
+
+    def __call__(self, cost=None, debits=None):
+        if len(self.queue) > self.config['maxCapacity']:
+            raise RuntimeError('throttle queue is over maxCapacity (' + str(int(self.config['maxCapacity'])) + '), see https://github.com/ccxt/ccxt/issues/11645#issuecomment-1195695526')
+        loop = self.get_loop()
+        future = loop.create_future()
+        self.queue.append((future, cost, loop.time() * 1000, debits))
+        if len(self.queue) > self.statistics['maxQueued']:
+            self.statistics['maxQueued'] = len(self.queue)
+        if self.timer is None:
+            self.release()
+        return future
+
+    def stats(self):
+        # queue depth and waiting times in milliseconds
+        granted = self.statistics['granted']
+        result = {
+            'queued': len(self.queue),
+            'maxQueued': self.statistics['maxQueued'],
+            'granted': granted,
+            'cancelled': self.statistics['cancelled'],
+            'wakeups': self.statistics['wakeups'],
+            'tokens': self.config['tokens'],
+            'averageWait': self.statistics['totalWait'] / granted if granted else 0.0,
+            'maxWait': self.statistics['maxWait'],
+        }
+        if self.limiter is not None:
+            result['buckets'] = self.limiter.stats()
+        return result
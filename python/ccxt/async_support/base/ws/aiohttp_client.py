@@ -7,11 +7,13 @@ from .functions import milliseconds, iso8601, is_json_encoded_object
 from ccxt.async_support.base.ws.client import Client
 from ccxt.async_support.base.ws.functions import gunzip, inflate
 from ccxt import NetworkError, RequestTimeout, ExchangeClosedByUser
+from ccxt.base.exchange import Exchange
 
 
 class AiohttpClient(Client):
 
     proxy = None
+    json_decoder = None  # the exchange's json_decoder, if any
 
     def closed(self):
         return (self.connection is None) or self.connection.closed
@@ -24,10 +26,19 @@ class AiohttpClient(Client):
         if self.verbose:
             self.log(iso8601(milliseconds()), 'message', data)
         if isinstance(data, bytes):
+            # json is decoded straight from bytes, other payloads are passed on as text
+            if len(data) >= 2 and data[:1] in (b'{', b'['):
+                self.on_message_callback(self, self.decode_json(data))
+                return
             data = data.decode()
-        decoded = json.loads(data) if is_json_encoded_object(data) else data
+        decoded = self.decode_json(data) if is_json_encoded_object(data) else data
         self.on_message_callback(self, decoded)
 
+    def decode_json(self, data):
+        if self.json_decoder is not None:
+            return self.json_decoder(data)
+        return Exchange.json_loads(data)
+
     def handle_message(self, message):
         # self.log(iso8601(milliseconds()), message)
         if message.type == WSMsgType.TEXT:
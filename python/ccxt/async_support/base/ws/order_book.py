@@ -6,8 +6,9 @@ import sys
 
 
 class OrderBook(dict):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, truncate=True):
         self.cache = []
+        self.checksum = None
         depth = depth or sys.maxsize
         defaults = {
             'bids': [],
@@ -20,9 +21,9 @@ class OrderBook(dict):
         # do not mutate snapshot
         defaults.update(snapshot)
         if not isinstance(defaults['asks'], order_book_side.OrderBookSide):
-            defaults['asks'] = order_book_side.Asks(defaults['asks'], depth)
+            defaults['asks'] = order_book_side.Asks(defaults['asks'], depth, truncate)
         if not isinstance(defaults['bids'], order_book_side.OrderBookSide):
-            defaults['bids'] = order_book_side.Bids(defaults['bids'], depth)
+            defaults['bids'] = order_book_side.Bids(defaults['bids'], depth, truncate)
         defaults['datetime'] = Exchange.iso8601(defaults.get('timestamp'))
         # merge to self
         super(OrderBook, self).__init__(defaults)
@@ -32,19 +33,37 @@ class OrderBook(dict):
         self['bids'].limit()
         return self
 
+    def top(self, n=None):
+        # a shallow view of the top n levels of both sides, without the rest of the book
+        return {
+            'bids': self['bids'].top(n),
+            'asks': self['asks'].top(n),
+            'timestamp': self['timestamp'],
+            'datetime': self['datetime'],
+            'nonce': self['nonce'],
+            'symbol': self['symbol'],
+        }
+
+    def best_bid(self):
+        return self['bids'].best()
+
+    def best_ask(self):
+        return self['asks'].best()
+
     def reset(self, snapshot={}):
         self['asks']._index.clear()
         self['asks'].clear()
-        for ask in snapshot.get('asks', []):
-            self['asks'].storeArray(ask)
+        self['asks'].storeMany(snapshot.get('asks', []))
         self['bids']._index.clear()
         self['bids'].clear()
-        for bid in snapshot.get('bids', []):
-            self['bids'].storeArray(bid)
+        self['bids'].storeMany(snapshot.get('bids', []))
         self['nonce'] = snapshot.get('nonce')
         self['timestamp'] = snapshot.get('timestamp')
         self['datetime'] = Exchange.iso8601(self['timestamp'])
         self['symbol'] = snapshot.get('symbol')
+        if self.checksum is not None:
+            # the strings of the previous levels
+            self.checksum.clear()
 
     def update(self, snapshot):
         nonce = snapshot.get('nonce')
@@ -58,21 +77,51 @@ class OrderBook(dict):
 
 
 class CountedOrderBook(OrderBook):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, truncate=True):
         copy = Exchange.extend(snapshot, {
-            'asks': order_book_side.CountedAsks(snapshot.get('asks', []), depth),
-            'bids': order_book_side.CountedBids(snapshot.get('bids', []), depth),
+            'asks': order_book_side.CountedAsks(snapshot.get('asks', []), depth, truncate),
+            'bids': order_book_side.CountedBids(snapshot.get('bids', []), depth, truncate),
         })
-        super(CountedOrderBook, self).__init__(copy, depth)
+        super(CountedOrderBook, self).__init__(copy, depth, truncate)
 
 # -----------------------------------------------------------------------------
 # indexed by order ids (3rd value in a bidask delta)
 
 
 class IndexedOrderBook(OrderBook):
-    def __init__(self, snapshot={}, depth=None):
+    def __init__(self, snapshot={}, depth=None, truncate=True):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.IndexedAsks(snapshot.get('asks', []), depth, truncate),
+            'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth, truncate),
+        })
+        super(IndexedOrderBook, self).__init__(copy, depth, truncate)
+
+# -----------------------------------------------------------------------------
+# same as above, backed by the chunked sorted sides, see SortedOrderBookSide
+
+
+class SortedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None, truncate=True):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedAsks(snapshot.get('asks', []), depth, truncate),
+            'bids': order_book_side.SortedBids(snapshot.get('bids', []), depth, truncate),
+        })
+        super(SortedOrderBook, self).__init__(copy, depth, truncate)
+
+
+class SortedCountedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None, truncate=True):
+        copy = Exchange.extend(snapshot, {
+            'asks': order_book_side.SortedCountedAsks(snapshot.get('asks', []), depth, truncate),
+            'bids': order_book_side.SortedCountedBids(snapshot.get('bids', []), depth, truncate),
+        })
+        super(SortedCountedOrderBook, self).__init__(copy, depth, truncate)
+
+
+class SortedIndexedOrderBook(OrderBook):
+    def __init__(self, snapshot={}, depth=None, truncate=True):
         copy = Exchange.extend(snapshot, {
-            'asks': order_book_side.IndexedAsks(snapshot.get('asks', []), depth),
-            'bids': order_book_side.IndexedBids(snapshot.get('bids', []), depth),
+            'asks': order_book_side.SortedIndexedAsks(snapshot.get('asks', []), depth, truncate),
+            'bids': order_book_side.SortedIndexedBids(snapshot.get('bids', []), depth, truncate),
         })
-        super(IndexedOrderBook, self).__init__(copy, depth)
+        super(SortedIndexedOrderBook, self).__init__(copy, depth, truncate)
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import time
+from binascii import crc32
+
+# -----------------------------------------------------------------------------
+# a checksum helper attached to a stored order book, it keeps the strings of the
+# top levels next to the amounts they were formatted from, so a level is only
+# formatted again when it changes, it returns the last checksum without building
+# the payload while no level of the sides was stored or dropped, see the dirty flag
+# of the order book sides, and it decides which messages get verified at all, see
+# Exchange.order_book_checksum()
+#
+#     checksum = checksumHelper.reuse(bids, asks, True)
+#     if checksum is None:
+#         level = checksumHelper.cached('bids', price, amount)
+#         if level is None:
+#             level = checksumHelper.store('bids', price, amount, priceString, amountString)
+#         ...
+#         checksum = checksumHelper.crc32(payload, True)
+
+
+class OrderBookChecksum(object):
+    def __init__(self, depth=25, every=1, interval=None):
+        self.depth = depth  # number of levels per side covered by the checksum
+        self.every = every or 1  # verify every nth message
+        self.interval = interval  # or verify at most once per interval in milliseconds
+        self.counter = 0
+        self.last = None
+        self.context = None
+        self.payload = None
+        self.value = None
+        self.current = False  # whether the value was computed since the sides last changed
+        self.levels = {
+            'bids': {},  # key -> [price string, amount string, key, amount]
+            'asks': {},
+        }
+
+    def due(self):
+        # tells whether the current message should be verified
+        if self.interval is not None:
+            now = time.time() * 1000
+            if self.last is not None and now - self.last < self.interval:
+                return False
+            self.last = now
+            return True
+        self.counter += 1
+        if self.counter >= self.every:
+            self.counter = 0
+            return True
+        return False
+
+    def clear(self):
+        self.levels['bids'].clear()
+        self.levels['asks'].clear()
+        self.payload = None
+        self.value = None
+        self.current = False
+
+    def track(self, context):
+        # drops the cached strings when the formatting rules change, e.g. the number of decimals
+        if context != self.context:
+            self.clear()
+            self.context = context
+
+    def cached(self, side, key, amount):
+        # the strings of a level, unless its amount changed since they were formatted
+        level = self.levels[side].get(key)
+        if level is not None and level[3] == amount:
+            return level
+        return None
+
+    def store(self, side, key, amount, priceString, amountString):
+        levels = self.levels[side]
+        if len(levels) >= 4 * self.depth:
+            # the levels that left the top are dropped all at once
+            levels.clear()
+        level = [priceString, amountString, key, amount]
+        levels[key] = level
+        return level
+
+    def reuse(self, bids, asks, signed=False):
+        # the last checksum when the sides did not change since it was computed, None otherwise
+        if self.current and not bids.dirty and not asks.dirty:
+            return self.result(signed)
+        bids.dirty = False
+        asks.dirty = False
+        # until crc32() is called with the payload of the sides as they are now
+        self.current = False
+        return None
+
+    def crc32(self, payload, signed=False):
+        if payload != self.payload:
+            self.payload = payload
+            self.value = crc32(payload.encode('utf8'))
+        self.current = True
+        return self.result(signed)
+
+    def result(self, signed):
+        if signed and (self.value >= 0x80000000):
+            return self.value - 0x100000000
+        return self.value
@@ -2,6 +2,7 @@
 
 import sys
 import bisect
+from itertools import chain, islice
 
 """Author: Carlo Revelli"""
 """Fast bisect bindings"""
@@ -12,19 +13,55 @@ import bisect
 class OrderBookSide(list):
     side = None  # set to True for bids and False for asks
 
-    def __init__(self, deltas=[], depth=None):
+    def __init__(self, deltas=[], depth=None, truncate=True):
         super(OrderBookSide, self).__init__()
         self._depth = depth or sys.maxsize
-        self._n = sys.maxsize
+        # when truncate is False the levels beyond depth are kept in storage and
+        # only the top depth levels are visible through len(), iteration and slices
+        self._truncate = truncate
+        self._n = sys.maxsize if truncate else self._depth
+        # set when a level is stored or dropped, cleared by OrderBookChecksum.reuse()
+        self.dirty = True
         # parallel to self
         self._index = []
-        for delta in deltas:
-            self.storeArray(list(delta))
+        if deltas:
+            self.storeMany([list(delta) for delta in deltas])
 
     def store_array(self, delta):
         return self.storeArray(delta)
 
+    def store_many(self, deltas):
+        return self.storeMany(deltas)
+
+    def storeMany(self, deltas):
+        # small batches are cheaper to insert one by one, large batches and
+        # snapshots are merged with the existing levels and sorted at once
+        if len(deltas) * 4 < len(self._index):
+            for delta in deltas:
+                self.storeArray(delta)
+            return
+        levels = dict(zip(self._index, list.__iter__(self)))
+        side = self.side
+        for delta in deltas:
+            price = delta[0]
+            index_price = -price if side else price
+            if delta[1]:
+                level = levels.get(index_price)
+                if level is not None:
+                    level[1] = delta[1]
+                else:
+                    levels[index_price] = delta
+            elif index_price in levels:
+                del levels[index_price]
+        self._replace(levels)
+
+    def _replace(self, levels):
+        self.dirty = True
+        self._index[:] = sorted(levels)
+        list.__setitem__(self, slice(None), [levels[index_price] for index_price in self._index])
+
     def storeArray(self, delta):
+        self.dirty = True
         price = delta[0]
         size = delta[1]
         index_price = -price if self.side else price
@@ -43,24 +80,81 @@ class OrderBookSide(list):
         self.storeArray([price, size])
 
     def limit(self):
-        difference = len(self) - self._depth
-        for _ in range(difference):
-            self.remove_index(self.pop())
-            self._index.pop()
+        if not self._truncate or list.__len__(self) <= self._depth:
+            return
+        self.dirty = True
+        for order in list.__getitem__(self, slice(self._depth, None)):
+            self.remove_index(order)
+        del self._index[self._depth:]
+        list.__delitem__(self, slice(self._depth, None))
 
     def remove_index(self, order):
         pass
 
+    # read-only views over the stored levels, best first, the levels are not copied
+
+    def _iter_all(self):
+        return list.__iter__(self)
+
+    def best(self):
+        return next(self._iter_all(), None)
+
+    def top(self, n=None):
+        return list(islice(self._iter_all(), self._n if n is None else n))
+
+    def cumulative_size(self, price):
+        # the total size available at the given price or better
+        total = 0
+        for level in self._iter_all():
+            if (level[0] < price) if self.side else (level[0] > price):
+                break
+            total += level[1]
+        return total
+
+    def price_for_size(self, size):
+        # the worst price reached when taking the given size, None if the side is not deep enough
+        remaining = size
+        for level in self._iter_all():
+            remaining -= level[1]
+            if remaining <= 0:
+                return level[0]
+        return None
+
+    def vwap(self, size):
+        # the average price of taking the given size, None if the side is not deep enough
+        if not size or size < 0:
+            return None
+        remaining = size
+        cost = 0
+        for level in self._iter_all():
+            taken = min(level[1], remaining)
+            cost += taken * level[0]
+            remaining -= taken
+            if remaining <= 0:
+                return cost / size
+        return None
+
     def __len__(self):
         length = super(OrderBookSide, self).__len__()
         return min(length, self._n)
 
+    def __iter__(self):
+        if self._n < list.__len__(self):
+            return islice(list.__iter__(self), self._n)
+        return list.__iter__(self)
+
     def __getitem__(self, item):
         if isinstance(item, slice):
             start, stop, step = item.indices(len(self))
-            return [self[i] for i in range(start, stop, step)]
-        else:
-            return super(OrderBookSide, self).__getitem__(item)
+            if step == 1:
+                return list.__getitem__(self, slice(start, stop))
+            return [list.__getitem__(self, i) for i in range(start, stop, step)]
+        if item < 0 and self._n < list.__len__(self):
+            # only the top levels are visible, the negative indices count from the last of them
+            item += self._n
+            if item < 0:
+                raise IndexError('list index out of range')
+        return list.__getitem__(self, item)
 
     def __eq__(self, other):
         if isinstance(other, list):
@@ -77,10 +171,11 @@ class OrderBookSide(list):
 
 
 class CountedOrderBookSide(OrderBookSide):
-    def __init__(self, deltas=[], depth=None):
-        super(CountedOrderBookSide, self).__init__(deltas, depth)
+    def __init__(self, deltas=[], depth=None, truncate=True):
+        super(CountedOrderBookSide, self).__init__(deltas, depth, truncate)
 
     def storeArray(self, delta):
+        self.dirty = True
         price = delta[0]
         size = delta[1]
         count = delta[2]
@@ -97,6 +192,27 @@ class CountedOrderBookSide(OrderBookSide):
             del self._index[index]
             del self[index]
 
+    def storeMany(self, deltas):
+        if len(deltas) * 4 < len(self._index):
+            for delta in deltas:
+                self.storeArray(delta)
+            return
+        levels = dict(zip(self._index, list.__iter__(self)))
+        side = self.side
+        for delta in deltas:
+            price = delta[0]
+            index_price = -price if side else price
+            if delta[1] and delta[2]:
+                level = levels.get(index_price)
+                if level is not None:
+                    level[1] = delta[1]
+                    level[2] = delta[2]
+                else:
+                    levels[index_price] = delta
+            elif index_price in levels:
+                del levels[index_price]
+        self._replace(levels)
+
     def store(self, price, size, count):
         self.storeArray([price, size, count])
 
@@ -105,11 +221,12 @@ class CountedOrderBookSide(OrderBookSide):
 
 
 class IndexedOrderBookSide(OrderBookSide):
-    def __init__(self, deltas=[], depth=None):
+    def __init__(self, deltas=[], depth=None, truncate=True):
         self._hashmap = {}
-        super(IndexedOrderBookSide, self).__init__(deltas, depth)
+        super(IndexedOrderBookSide, self).__init__(deltas, depth, truncate)
 
     def storeArray(self, delta):
+        self.dirty = True
         price = delta[0]
         if price is not None:
             index_price = -price if self.side else price
@@ -155,11 +272,296 @@ class IndexedOrderBookSide(OrderBookSide):
             del self[index]
             del self._hashmap[order_id]
 
+    def storeMany(self, deltas):
+        # the order ids can move between price levels, no shortcut here
+        for delta in deltas:
+            self.storeArray(delta)
+
+    def remove_index(self, order):
+        order_id = order[2]
+        if order_id in self._hashmap:
+            del self._hashmap[order_id]
+
+    def clear(self):
+        self._hashmap.clear()
+        super(IndexedOrderBookSide, self).clear()
+
+    def store(self, price, size, order_id):
+        self.storeArray([price, size, order_id])
+
+# -----------------------------------------------------------------------------
+# same public api as OrderBookSide, but the levels are kept in a chunked sorted
+# structure next to a dict keyed by price, an update of an existing level is a
+# dict hit and an insertion or a deletion costs O(log n) plus a short memmove
+# inside a single chunk, instead of shifting the whole side on every delta
+# the underlying list storage is only refreshed by limit(), that is what gets
+# resolved to the user and serialized, everything else reads from the chunks,
+# limit() copies the chunks changed since the previous call into their place in
+# the list storage, the chunks that were split or emptied and the ones after them
+# are copied whole
+
+
+class SortedOrderBookSide(OrderBookSide):
+    _load = 256  # chunks are split when they grow beyond twice this size
+
+    def __init__(self, deltas=[], depth=None, truncate=True):
+        self._levels = {}
+        self._keys = []  # sorted chunks of index prices
+        self._values = []  # chunks of levels parallel to self._keys
+        self._maxes = []  # the last index price of every chunk
+        self._sizes = []  # the length of every chunk in the list storage
+        self._changed = set()  # the chunks whose levels changed since limit()
+        self._moved = None  # the first chunk split or emptied since limit()
+        super(SortedOrderBookSide, self).__init__(deltas, depth, truncate)
+
+    def storeArray(self, delta):
+        self.dirty = True
+        price = delta[0]
+        size = delta[1]
+        index_price = -price if self.side else price
+        level = self._levels.get(index_price)
+        if size:
+            if level is not None:
+                level[1] = size
+            else:
+                self._levels[index_price] = delta
+                self._insert(index_price, delta)
+        elif level is not None:
+            del self._levels[index_price]
+            self._remove(index_price)
+
+    def storeMany(self, deltas):
+        # snapshots come sorted best first, which makes every insertion an append to the last chunk
+        for delta in deltas:
+            self.storeArray(delta)
+
+    def _move(self, i):
+        if self._moved is None or i < self._moved:
+            self._moved = i
+
+    def _insert(self, key, value):
+        maxes = self._maxes
+        if not maxes:
+            self._keys.append([key])
+            self._values.append([value])
+            maxes.append(key)
+            self._move(0)
+            return
+        i = bisect.bisect_left(maxes, key)
+        if i == len(maxes):
+            i -= 1
+            self._keys[i].append(key)
+            self._values[i].append(value)
+            maxes[i] = key
+        else:
+            keys = self._keys[i]
+            j = bisect.bisect_left(keys, key)
+            keys.insert(j, key)
+            self._values[i].insert(j, value)
+        keys = self._keys[i]
+        self._changed.add(i)
+        if len(keys) > 2 * self._load:
+            self._move(i)
+            values = self._values[i]
+            self._keys.insert(i + 1, keys[self._load:])
+            self._values.insert(i + 1, values[self._load:])
+            del keys[self._load:]
+            del values[self._load:]
+            maxes[i] = keys[-1]
+            maxes.insert(i + 1, self._keys[i + 1][-1])
+
+    def _remove(self, key):
+        maxes = self._maxes
+        i = bisect.bisect_left(maxes, key)
+        keys = self._keys[i]
+        j = bisect.bisect_left(keys, key)
+        del keys[j]
+        del self._values[i][j]
+        if keys:
+            maxes[i] = keys[-1]
+            self._changed.add(i)
+        else:
+            del self._keys[i]
+            del self._values[i]
+            del maxes[i]
+            self._move(i)
+
+    def _pop(self):
+        keys = self._keys[-1]
+        values = self._values[-1]
+        key = keys.pop()
+        value = values.pop()
+        if keys:
+            self._maxes[-1] = keys[-1]
+            self._changed.add(len(self._keys) - 1)
+        else:
+            self._keys.pop()
+            self._values.pop()
+            self._maxes.pop()
+            self._move(len(self._keys))
+        del self._levels[key]
+        return value
+
+    def limit(self):
+        difference = len(self._levels) - self._depth if self._truncate else 0
+        if difference > 0:
+            self.dirty = True
+        for _ in range(difference):
+            self.remove_index(self._pop())
+        if self._moved is None and not self._changed:
+            return
+        chunks = self._values
+        sizes = self._sizes
+        moved = len(chunks) if self._moved is None else self._moved
+        changed = []
+        if self._n < sys.maxsize or len(chunks) < 2:
+            # only the top levels are stored, or a single chunk, copied whole
+            moved = 0
+        else:
+            changed = sorted(i for i in self._changed if i < moved)
+        position = 0
+        previous = 0
+        for i in changed:
+            position += sum(sizes[previous:i])
+            list.__setitem__(self, slice(position, position + sizes[i]), chunks[i])
+            sizes[i] = len(chunks[i])
+            position += sizes[i]
+            previous = i + 1
+        if moved < len(chunks) or moved < len(sizes):
+            position += sum(sizes[previous:moved])
+            list.__delitem__(self, slice(position, None))
+            del sizes[moved:]
+            for values in islice(chunks, moved, None):
+                list.extend(self, values)
+                sizes.append(len(values))
+                if list.__len__(self) >= self._n:
+                    list.__delitem__(self, slice(self._n, None))
+                    break
+        self._changed.clear()
+        self._moved = None
+
+    def clear(self):
+        self._levels.clear()
+        self._keys.clear()
+        self._values.clear()
+        self._maxes.clear()
+        self._sizes.clear()
+        self._changed.clear()
+        self._moved = None
+        super(SortedOrderBookSide, self).clear()
+
+    def __len__(self):
+        return min(len(self._levels), self._n)
+
+    def _iter_all(self):
+        return chain.from_iterable(self._values)
+
+    def __iter__(self):
+        if self._n < len(self._levels):
+            return islice(chain.from_iterable(self._values), self._n)
+        return chain.from_iterable(self._values)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self))
+            if step == 1:
+                return list(islice(self._iter_all(), start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        length = len(self)
+        index = item + length if item < 0 else item
+        if index < 0 or index >= length:
+            raise IndexError('list index out of range')
+        for values in self._values:
+            if index < len(values):
+                return values[index]
+            index -= len(values)
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return str(list(self))
+
+# -----------------------------------------------------------------------------
+
+
+class SortedCountedOrderBookSide(SortedOrderBookSide):
+    def storeArray(self, delta):
+        self.dirty = True
+        price = delta[0]
+        size = delta[1]
+        count = delta[2]
+        index_price = -price if self.side else price
+        level = self._levels.get(index_price)
+        if size and count:
+            if level is not None:
+                level[1] = size
+                level[2] = count
+            else:
+                self._levels[index_price] = delta
+                self._insert(index_price, delta)
+        elif level is not None:
+            del self._levels[index_price]
+            self._remove(index_price)
+
+    def store(self, price, size, count):
+        self.storeArray([price, size, count])
+
+# -----------------------------------------------------------------------------
+# levels are keyed by (index price, order id) to keep the order of the ids
+# within the same price level identical to IndexedOrderBookSide
+
+
+class SortedIndexedOrderBookSide(SortedOrderBookSide):
+    def __init__(self, deltas=[], depth=None, truncate=True):
+        self._hashmap = {}
+        super(SortedIndexedOrderBookSide, self).__init__(deltas, depth, truncate)
+
+    def storeArray(self, delta):
+        self.dirty = True
+        price = delta[0]
+        if price is not None:
+            index_price = -price if self.side else price
+        else:
+            index_price = None
+        size = delta[1]
+        order_id = delta[2]
+        if size:
+            if order_id in self._hashmap:
+                old_price = self._hashmap[order_id]
+                index_price = index_price or old_price
+                # in case the price is not defined
+                delta[0] = abs(index_price)
+                key = (old_price, order_id)
+                if index_price == old_price:
+                    # just overwrite the old level
+                    self._levels[key][:] = delta
+                    return
+                # remove old price level
+                del self._levels[key]
+                self._remove(key)
+            # insert new price level
+            self._hashmap[order_id] = index_price
+            key = (index_price, order_id)
+            self._levels[key] = delta
+            self._insert(key, delta)
+        elif order_id in self._hashmap:
+            key = (self._hashmap[order_id], order_id)
+            del self._levels[key]
+            self._remove(key)
+            del self._hashmap[order_id]
+
     def remove_index(self, order):
         order_id = order[2]
         if order_id in self._hashmap:
             del self._hashmap[order_id]
 
+    def clear(self):
+        self._hashmap.clear()
+        super(SortedIndexedOrderBookSide, self).clear()
+
     def store(self, price, size, order_id):
         self.storeArray([price, size, order_id])
 
@@ -172,3 +574,9 @@ class CountedAsks(CountedOrderBookSide): side = False                       # no
 class CountedBids(CountedOrderBookSide): side = True                        # noqa
 class IndexedAsks(IndexedOrderBookSide): side = False                       # noqa
 class IndexedBids(IndexedOrderBookSide): side = True                        # noqa
+class SortedAsks(SortedOrderBookSide): side = False                         # noqa
+class SortedBids(SortedOrderBookSide): side = True                          # noqa
+class SortedCountedAsks(SortedCountedOrderBookSide): side = False           # noqa
+class SortedCountedBids(SortedCountedOrderBookSide): side = True            # noqa
+class SortedIndexedAsks(SortedIndexedOrderBookSide): side = False           # noqa
+class SortedIndexedBids(SortedIndexedOrderBookSide): side = True            # noqa
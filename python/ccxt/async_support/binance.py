@@ -46,6 +46,17 @@ class binance(Exchange, ImplicitAPI):
             'name': 'Binance',
             'countries': ['JP', 'MT'],  # Japan, Malta
             'rateLimit': 50,
+            # the named buckets of the request weight of each api and of the orders, the futures data endpoints are debited from the rateLimit
+            'rateLimitBuckets': {
+                # the capacity is a second of the limit, so a fresh instance does not send a minute of requests at once
+                'weight': {'limit': 6000, 'interval': 60000, 'capacity': 100, 'apis': ['public', 'private'], 'scale': 5, 'header': 'x-mbx-used-weight-1m'},  # 1 IP(api) => cost = 0.2
+                'sapi': {'limit': 12000, 'interval': 60000, 'capacity': 200, 'apis': ['sapi', 'sapiV2', 'sapiV3', 'sapiV4'], 'scale': 10, 'header': 'x-sapi-used-ip-weight-1m'},  # 1 IP(sapi) => cost = 0.1
+                'fapi': {'limit': 2400, 'interval': 60000, 'capacity': 40, 'apis': ['fapiPublic', 'fapiPublicV2', 'fapiPrivate', 'fapiPrivateV2'], 'header': 'x-mbx-used-weight-1m'},  # 1 IP(fapi) => cost = 1
+                'dapi': {'limit': 2400, 'interval': 60000, 'capacity': 40, 'apis': ['dapiPublic', 'dapiPrivate', 'dapiPrivateV2'], 'header': 'x-mbx-used-weight-1m'},  # 1 IP(dapi) => cost = 1
+                'eapi': {'limit': 1200, 'interval': 60000, 'capacity': 20, 'apis': ['eapiPublic', 'eapiPrivate'], 'header': 'x-mbx-used-weight-1m'},  # 1 IP(eapi) => cost = 1
+                'papi': {'limit': 6000, 'interval': 60000, 'capacity': 100, 'apis': ['papi'], 'header': 'x-mbx-used-weight-1m'},  # 1 IP(papi) => cost = 1
+                'orders': {'limit': 100, 'interval': 10000, 'capacity': 10, 'apis': ['private'], 'paths': ['order', 'order/oco', 'orderList/oco', 'orderList/oto', 'orderList/otoco', 'sor/order', 'order/cancelReplace'], 'methods': ['POST'], 'scale': 5},  # 1 order => cost = 0.2
+            },
             'certified': True,
             'pro': True,
             # new metainfo2 interface
@@ -16,6 +16,8 @@ class binanceus(binance, ImplicitAPI):
             'countries': ['US'],  # US
             'hostname': 'binance.us',
             'rateLimit': 50,  # 1200 req per min
+            # the weights of binance.us differ from the ones of binance, its requests are debited from the rateLimit
+            'rateLimitBuckets': None,
             'certified': False,
             'pro': True,
             'urls': {
@@ -502,7 +502,7 @@ class coinbaseinternational(Exchange, ImplicitAPI):
         #
         #    [
         #        {
-        #            "asset_id" = self.parse_networks(rawNetworks)
+        #            "asset_id" = self.extend(currency, {'networks': self.parse_networks(rawNetworks)})
 
     def parse_networks(self, networks, params={}):
         result: dict = {}
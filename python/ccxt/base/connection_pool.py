@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+# -----------------------------------------------------------------------------
+# a requests session shared by every exchange instance created with {'connectionPool': pool},
+# so the instances reuse the same keep-alive connections instead of opening their own
+#
+#     pool = ConnectionPool({'limitPerHost': 20})
+#     binance = ccxt.binance({'connectionPool': pool})
+#     bybit = ccxt.bybit({'connectionPool': pool})
+#
+# requests speaks HTTP/1.1 only and leaves dns to the system resolver, idle connections
+# stay open until the server closes them
+
+
+class ConnectionPool(object):
+    def __init__(self, config={}):
+        self.config = {
+            'hosts': 100,  # number of hosts with pooled connections
+            'limitPerHost': 10,  # connections kept per host
+            'block': False,  # wait for a free connection instead of opening one over the limit
+        }
+        self.config.update(config)
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def session(self, trust_env=True):
+        with self.lock:
+            session = self.sessions.get(trust_env)
+            if session is None:
+                session = Session()
+                session.trust_env = trust_env
+                adapter = HTTPAdapter(pool_connections=self.config['hosts'], pool_maxsize=self.config['limitPerHost'], pool_block=self.config['block'])
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self.sessions[trust_env] = session
+            return session
+
+    def stats(self):
+        # urllib3 counts the requests and the connections it had to open for them
+        result = {
+            'sessions': len(self.sessions),
+            'hosts': 0,
+            'requests': 0,
+            'connectionsCreated': 0,
+            'connectionsReused': 0,
+        }
+        with self.lock:
+            for session in self.sessions.values():
+                adapter = session.get_adapter('https://')
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        result['hosts'] += 1
+                        result['requests'] += pool.num_requests
+                        result['connectionsCreated'] += pool.num_connections
+        result['connectionsReused'] = max(result['requests'] - result['connectionsCreated'], 0)
+        result['hitRate'] = result['connectionsReused'] / result['requests'] if result['requests'] else 0.0
+        return result
+
+    def close(self):
+        with self.lock:
+            sessions = list(self.sessions.values())
+            self.sessions = {}
+        for session in sessions:
+            session.close()
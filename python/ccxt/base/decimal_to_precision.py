@@ -1,8 +1,11 @@
 import decimal
+import fractions
 import numbers
 import itertools
 import re
 
+from ccxt.base.precise import parse, reduce, stringify
+
 __all__ = [
     'TRUNCATE',
     'ROUND',
@@ -14,6 +17,8 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'precision_formatter',
+    'formatted_decimal_to_precision',
 ]
 
 
@@ -56,7 +61,7 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
     context.rounding = decimal.ROUND_HALF_UP  # rounds 0.5 away from zero
 
     dec = decimal.Decimal(str(n))
-    precision_dec = decimal.Decimal(str(precision))
+    precision_dec, tick_digits = precision_numbers(precision)
     string = '{:f}'.format(dec)  # convert to string using .format to avoid engineering notation
     precise = None
 
@@ -92,16 +97,7 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
                     dec = dec + missing
                 else:
                     dec = dec - missing
-        parts = re.sub(r'0+$', '', '{:f}'.format(precision_dec)).split('.')
-        if len(parts) > 1:
-            new_precision = len(parts[1])
-        else:
-            match = re.search(r'0+$', parts[0])
-            if match is None:
-                new_precision = 0
-            else:
-                new_precision = - len(match.group(0))
-        return decimal_to_precision('{:f}'.format(dec), ROUND, new_precision, DECIMAL_PLACES, padding_mode)
+        return decimal_to_precision('{:f}'.format(dec), ROUND, tick_digits, DECIMAL_PLACES, padding_mode)
 
     if rounding_mode == ROUND:
         if counting_mode == DECIMAL_PLACES:
@@ -165,6 +161,153 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
             return precise
 
 
+# the numeric forms of the precisions, computed once, the markets of an exchange share a few of them
+precisions = {}
+
+
+def precision_numbers(precision):
+    # the Decimal of a precision and the number of decimals of it as a tick size
+    key = (type(precision), precision)
+    result = precisions.get(key)
+    if result is None:
+        precision_dec = decimal.Decimal(str(precision))
+        parts = re.sub(r'0+$', '', '{:f}'.format(precision_dec)).split('.')
+        if len(parts) > 1:
+            digits = len(parts[1])
+        else:
+            match = re.search(r'0+$', parts[0])
+            if match is None:
+                digits = 0
+            else:
+                digits = - len(match.group(0))
+        result = (precision_dec, digits)
+        if len(precisions) > 10000:
+            precisions.clear()
+        precisions[key] = result
+    return result
+
+
+class PrecisionFormatter(object):
+    # decimal_to_precision() with the same arguments except the number, the precision is
+    # prepared once and the number is rounded with integer arithmetic, the cases that are
+    # not handled that way, e.g. significant digits, zeros or very long numbers, are passed
+    # to decimal_to_precision(), the result is the same either way
+    #
+    #     format = precision_formatter(0.01, ROUND, TICK_SIZE)
+    #     format(27123.456)  # '27123.46'
+
+    number = re.compile(r'-?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$')
+
+    def __init__(self, precision, rounding_mode=ROUND, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+        self.precision = precision
+        self.rounding_mode = rounding_mode
+        self.counting_mode = counting_mode
+        self.padding_mode = padding_mode
+        self.digits = None  # decimals of the result, None when every number goes to decimal_to_precision()
+        self.tick = None  # (integer, decimals) of the tick size
+        self.half = None  # (numerator, denominator) of half of the tick size, compared exactly like decimal_to_precision() does
+        if rounding_mode not in [TRUNCATE, ROUND] or padding_mode not in [NO_PADDING, PAD_WITH_ZERO] or isinstance(precision, bool):
+            return
+        if counting_mode == DECIMAL_PLACES:
+            if isinstance(precision, numbers.Integral) and 0 <= precision <= 20:
+                self.digits = int(precision)
+        elif counting_mode == TICK_SIZE:
+            if isinstance(precision, (float, decimal.Decimal, numbers.Integral, str)):
+                try:
+                    value = float(precision) if isinstance(precision, str) else precision
+                    precision_dec, tick_digits = precision_numbers(value)
+                    tick = reduce(*parse('{:f}'.format(precision_dec)))
+                except (ValueError, ArithmeticError):
+                    return
+                if tick[0] > 0 and 0 <= tick_digits <= 20 and tick[1] == tick_digits:
+                    self.tick = tick
+                    half = fractions.Fraction(value / 2)
+                    self.half = (half.numerator, half.denominator)
+                    self.digits = tick_digits
+
+    def __call__(self, n):
+        return self.format(n)
+
+    def format(self, n):
+        if self.digits is not None:
+            string = n if isinstance(n, str) else str(n)
+            if self.number.match(string):
+                integer, decimals = parse(string)
+                if -10 <= decimals <= 20 and -10 ** 20 < integer < 10 ** 20:
+                    if self.tick is None:
+                        integer = self.round(integer, decimals)
+                    else:
+                        integer = self.round_to_tick(integer, decimals)
+                    # the zeros keep the sign quirks of decimal_to_precision(), the long numbers
+                    # exceed the precision of the decimal context there
+                    if integer is not None and integer != 0 and -10 ** 26 < integer < 10 ** 26:
+                        return self.pad(integer)
+        return decimal_to_precision(n, self.rounding_mode, self.precision, self.counting_mode, self.padding_mode)
+
+    def round(self, integer, decimals):
+        # the number in units of 10 ** -digits
+        distance = decimals - self.digits
+        if distance <= 0:
+            return integer * 10 ** -distance
+        scale = 10 ** distance
+        result, remainder = divmod(abs(integer), scale)
+        if self.rounding_mode == ROUND and remainder * 2 >= scale:
+            result += 1
+        return -result if integer < 0 else result
+
+    def round_to_tick(self, integer, decimals):
+        tick_integer, tick_decimals = self.tick
+        scale = max(decimals, tick_decimals)
+        integer = integer * 10 ** (scale - decimals)
+        tick = tick_integer * 10 ** (scale - tick_decimals)
+        if abs(integer) >= 10 ** 26:
+            return None
+        missing = abs(integer) % tick
+        if missing != 0:
+            if self.rounding_mode == ROUND:
+                numerator, denominator = self.half
+                up = missing * denominator >= numerator * 10 ** scale
+                if integer > 0:
+                    integer = integer - missing + tick if up else integer - missing
+                else:
+                    integer = integer + missing - tick if up else integer + missing
+            elif integer < 0:
+                integer = integer + missing
+            else:
+                integer = integer - missing
+        return integer // 10 ** (scale - self.digits)
+
+    def pad(self, integer):
+        if self.padding_mode == NO_PADDING or self.digits == 0:
+            return stringify(integer, self.digits)
+        digits = str(abs(integer)).rjust(self.digits + 1, '0')
+        return ('-' if integer < 0 else '') + digits[:-self.digits] + '.' + digits[-self.digits:]
+
+
+formatters = {}
+
+
+def precision_formatter(precision, rounding_mode=ROUND, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # the PrecisionFormatter of the arguments, made once
+    key = (type(precision), precision, rounding_mode, counting_mode, padding_mode)
+    try:
+        return formatters[key]
+    except TypeError:
+        return PrecisionFormatter(precision, rounding_mode, counting_mode, padding_mode)
+    except KeyError:
+        pass
+    formatter = PrecisionFormatter(precision, rounding_mode, counting_mode, padding_mode)
+    if len(formatters) > 10000:
+        formatters.clear()
+    formatters[key] = formatter
+    return formatter
+
+
+def formatted_decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    # decimal_to_precision() through the formatter of its arguments, what Exchange.decimal_to_precision() is
+    return precision_formatter(precision, rounding_mode, counting_mode, padding_mode).format(n)
+
+
 def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     if x is None:
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import sys
+import types
+
+# -----------------------------------------------------------------------------
+# the packages listing the exchanges (ccxt, ccxt.async_support, ccxt.pro) import an
+# exchange module on first access to its class through a module __getattr__ (PEP 562)
+# instead of importing all of them upfront
+
+
+def load_exchange(package, name):
+    module = sys.modules[package]
+    if name not in module.exchanges:
+        raise AttributeError('module ' + repr(package) + ' has no attribute ' + repr(name))
+    exchange = getattr(importlib.import_module(package + '.' + name), name)
+    setattr(module, name, exchange)
+    return exchange
+
+
+class ExchangesPackage(types.ModuleType):
+    # importing a submodule sets it as an attribute of the package, e.g. ccxt.binanceusdm
+    # imports ccxt.binance, but the attribute must remain the exchange class
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and name in self.__dict__.get('exchanges', ()):
+            value = getattr(value, name, value)
+        super(ExchangesPackage, self).__setattr__(name, value)
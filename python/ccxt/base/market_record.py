@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+import keyword
+from collections.abc import Mapping
+
+# -----------------------------------------------------------------------------
+# a compact form of the unified market structures, enabled with compactMarkets:
+#
+#     exchange = ccxt.binance({'compactMarkets': True})
+#
+# every market is a MarketRecord, an object with a slot per key of the market instead of a
+# dict, read like a dict: market['symbol'], market.get('settle'), 'base' in market, ...
+# the nested precision and limits dicts of identical values are one dict shared by the
+# markets and the info of a market is the dict received from the exchange, not a copy,
+# so the records are read-only, extend() or to_dict() make a dict out of one to change it
+#
+# a record is a Mapping but not a dict, json.dumps() needs the default below to serialize them:
+#
+#     json.dumps(exchange.markets, default=json_default)
+#     exchange.json(exchange.markets)  # the same
+#
+# the records of the markets with the same keys share a class, made on first use
+
+
+class MarketRecord(Mapping):
+    __slots__ = []
+    fields = ()  # the keys, in the order of the dict the record was made from
+    members = frozenset()
+    readonly = False  # the existing keys cannot be set either, see readonly_record()
+
+    def __getitem__(self, key):
+        if key in self.members:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if self.readonly:
+            raise TypeError('the market record is shared and read-only, extend() or to_dict() make a dict out of it to change ' + str(key))
+        elif key in self.members:
+            setattr(self, key, value)
+        else:
+            raise TypeError('the compact market records are read-only, ' + str(key) + ' is not a key of the market')
+
+    def __contains__(self, key):
+        return key in self.members
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __eq__(self, other):
+        if isinstance(other, MarketRecord):
+            other = other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.members else default
+
+    def keys(self):
+        return list(self.fields)
+
+    def values(self):
+        return [getattr(self, key) for key in self.fields]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.fields]
+
+    def to_dict(self):
+        return dict((key, getattr(self, key)) for key in self.fields)
+
+    copy = to_dict
+
+    def __reduce__(self):
+        return (make_market_record, (self.to_dict(),))
+
+
+def json_default(value):
+    # the default argument of json.dumps() for the data holding records
+    if isinstance(value, MarketRecord):
+        return value.to_dict()
+    raise TypeError('Object of type ' + type(value).__name__ + ' is not JSON serializable')
+
+
+record_classes = {}
+
+
+def record_class(fields, readonly=False):
+    # None when the keys cannot be slots
+    if (fields, readonly) in record_classes:
+        return record_classes[(fields, readonly)]
+    cls = None
+    if compactable(fields):
+        cls = type('MarketRecord', (MarketRecord,), {
+            '__slots__': list(fields),
+            'fields': fields,
+            'members': frozenset(fields),
+            'readonly': readonly,
+        })
+    record_classes[(fields, readonly)] = cls
+    return cls
+
+
+def compactable(fields):
+    # the keys become attributes, they must be identifiers that do not hide the methods
+    return all(isinstance(key, str) and key.isidentifier() and not keyword.iskeyword(key) and not hasattr(MarketRecord, key) for key in fields)
+
+
+def make_market_record(market, interned=None, info=None):
+    # the record of a market dict, or the dict itself when its keys cannot be slots
+    cls = record_class(tuple(market))
+    if cls is None:
+        return market
+    record = cls.__new__(cls)
+    for key, value in market.items():
+        if interned is not None and isinstance(value, dict) and key != 'info':
+            value = intern_dict(value, interned)
+        setattr(record, key, value)
+    if info is not None:
+        record.info = info
+    return record
+
+
+def readonly_record(record, convert):
+    # a read-only record with the values of another one passed through convert()
+    if record.readonly:
+        return record
+    cls = record_class(record.fields, True)
+    result = cls.__new__(cls)
+    for key in record.fields:
+        setattr(result, key, convert(getattr(record, key)))
+    return result
+
+
+def intern_dict(value, interned):
+    # one dict for the nested dicts with the same content, e.g. the limits of most markets
+    try:
+        key = freeze(value)
+    except TypeError:
+        return value
+    result = interned.get(key)
+    if result is None:
+        interned[key] = value
+        result = value
+    return result
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return tuple((key, freeze(item)) for key, item in value.items())
+    elif isinstance(value, list):
+        return ('list',) + tuple(freeze(item) for item in value)
+    hash(value)
+    return (type(value), value)
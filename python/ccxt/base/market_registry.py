@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import threading
+
+from ccxt.base.market_record import MarketRecord, readonly_record
+
+# -----------------------------------------------------------------------------
+# loaded markets shared by the instances of an exchange in one process, e.g. one
+# instance per sub-account, the first instance fetches and indexes the markets and
+# the others attach to them instead of fetching and indexing them again
+#
+#     registry = MarketRegistry()
+#     accounts = [ccxt.binance({'apiKey': key, 'secret': secret, 'marketRegistry': registry}) for key, secret in credentials]
+#     for account in accounts:
+#         account.load_markets()  # fetched once
+#
+# the entries are keyed on the exchange id, the api urls (sandbox) and the market related
+# options, see Exchange.markets_key(), with the async exchanges the instances that start
+# loading while another one is fetching the same markets wait for it
+#
+# every instance gets its own copy of the indexes (markets, markets_by_id, symbols, ...),
+# so adding or removing a market only changes that instance, the market and currency
+# structures themselves are shared, they are made read-only when they are published,
+# a write raises a TypeError instead of changing the markets of every instance:
+#
+#     market = exchange.extend(exchange.market('BTC/USDT'), {'active': False})  # a dict of its own
+#     exchange.markets['BTC/USDT'] = market  # only changes this instance
+#
+# a reload builds new structures for the markets that changed, the values of the options
+# set while fetching are copied for every instance, as the exchanges update them in place
+
+
+class ReadOnlyDict(dict):
+    # a shared market or currency structure, or a dict nested in one
+    __slots__ = []
+
+    def readonly(self, *args, **kwargs):
+        raise TypeError('the market structures of a MarketRegistry are shared and read-only, extend() makes a dict out of one to change it')
+
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = readonly
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+    def __reduce__(self):
+        # pickled as a plain dict
+        return (dict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    __slots__ = []
+
+    def readonly(self, *args, **kwargs):
+        raise TypeError('the market structures of a MarketRegistry are shared and read-only')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = clear = extend = insert = pop = remove = reverse = sort = readonly
+
+    def copy(self):
+        return list(self)
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(list(self), memo)
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def readonly(value, memo):
+    # the read-only form of a structure, memo keeps one result per object, so the
+    # indexes still point to the same market
+    if isinstance(value, (ReadOnlyDict, ReadOnlyList, str, int, float)) or value is None:
+        return value
+    result = memo.get(id(value))
+    if result is not None:
+        return result[1]
+    if isinstance(value, dict):
+        result = ReadOnlyDict((key, readonly(item, memo)) for key, item in value.items())
+    elif isinstance(value, list):
+        result = ReadOnlyList(readonly(item, memo) for item in value)
+    elif isinstance(value, tuple):
+        result = tuple(readonly(item, memo) for item in value)
+    elif isinstance(value, MarketRecord):
+        result = readonly_record(value, lambda item: readonly(item, memo))
+    else:
+        return value
+    memo[id(value)] = (value, result)  # the value is kept alive for its id not to be reused
+    return result
+
+
+def published(value, memo):
+    # an index stays a plain dict or list, copied for every instance, its values are read-only
+    if isinstance(value, dict):
+        return dict((key, readonly(item, memo)) for key, item in value.items())
+    elif isinstance(value, list):
+        return [readonly(item, memo) for item in value]
+    return readonly(value, memo)
+
+
+class MarketRegistry(object):
+    attributes = ['markets', 'markets_by_id', 'markets_by_lowercase_id', 'markets_by_type', 'markets_by_base_quote', 'market_sources', 'symbols', 'ids', 'currencies', 'currencies_by_id', 'codes', 'baseCurrencies', 'quoteCurrencies']
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.futures = {}
+        self.statistics = {
+            'hits': 0,
+            'misses': 0,
+            'updates': 0,
+        }
+
+    def key(self, exchange):
+        return json.dumps(exchange.markets_key(), sort_keys=True, default=str)
+
+    def put(self, exchange, options={}):
+        # publishes the markets the exchange has just loaded, options are the ones set while fetching them,
+        # the exchange gets the read-only structures too
+        memo = {}
+        entry = dict((name, published(getattr(exchange, name, None), memo)) for name in self.attributes)
+        entry['options'] = dict((key, copy.copy(value)) for key, value in options.items())
+        with self.lock:
+            self.entries[self.key(exchange)] = entry
+            self.statistics['updates'] += 1
+        self.set(exchange, entry)
+
+    def attach(self, exchange):
+        # sets the shared markets on the exchange, False when there are none yet
+        with self.lock:
+            entry = self.entries.get(self.key(exchange))
+            self.statistics['hits' if entry is not None else 'misses'] += 1
+        if entry is None:
+            return False
+        exchange.options.update(dict((key, copy.copy(value)) for key, value in entry['options'].items()))
+        self.set(exchange, entry)
+        return True
+
+    def set(self, exchange, entry):
+        for name in self.attributes:
+            setattr(exchange, name, copy.copy(entry[name]))
+
+    def loading(self, exchange, loop):
+        # the task of another instance fetching the same markets in the event loop
+        future = self.futures.get(self.key(exchange))
+        if future is None or future.done() or future.get_loop() is not loop:
+            return None
+        return future
+
+    def set_loading(self, exchange, future):
+        key = self.key(exchange)
+        self.futures[key] = future
+
+        def done(future):
+            if self.futures.get(key) is future:
+                del self.futures[key]
+
+        future.add_done_callback(done)
+
+    def clear(self, exchange=None):
+        with self.lock:
+            if exchange is None:
+                self.entries = {}
+            else:
+                self.entries.pop(self.key(exchange), None)
+
+    def stats(self):
+        with self.lock:
+            result = dict(self.statistics)
+            result['entries'] = len(self.entries)
+        return result
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# -----------------------------------------------------------------------------
+# keeps the loaded markets and currencies in a local file, so that a new process
+# does not need to fetch and parse them again before it can trade
+#
+#     cache = MarketsCache('~/.ccxt/markets', ttl=3600000)
+#     exchange = ccxt.binance({'marketsCache': cache})
+#     exchange.load_markets()  # from the file when it is younger than the ttl
+#
+# an entry is only used by the same ccxt version and with the same api urls (sandbox)
+# and market related options, e.g. defaultType or fetchMarkets, see Exchange.markets_key(), otherwise
+# the markets are fetched again
+# an expired entry is refreshed in place, the async exchanges return the expired markets
+# right away and refresh them in the background when background is True
+#
+# the file holds what fetch_markets() and fetch_currencies() returned and the options they set,
+# set_markets() runs on it just like on a response, so the entries stay valid when set_markets() changes
+
+
+class MarketsCache(object):
+    def __init__(self, path='~/.ccxt/markets', ttl=3600000, background=True):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl  # milliseconds
+        self.background = background
+
+    def key(self, exchange):
+        from ccxt.base.exchange import __version__
+        key = exchange.markets_key()
+        key['version'] = __version__
+        return key
+
+    def filename(self, exchange):
+        key = json.dumps(self.key(exchange), sort_keys=True, default=str)
+        return os.path.join(self.path, exchange.id + '-' + hashlib.sha1(key.encode()).hexdigest()[0:16] + '.json')
+
+    def load(self, exchange):
+        # the entry {'timestamp', 'markets', 'currencies', 'options'} or None when there is no valid one
+        try:
+            with open(self.filename(exchange), 'rb') as file:
+                data = file.read()
+            entry = exchange.json_loads(data)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != json.loads(json.dumps(self.key(exchange), default=str)):
+            return None
+        return entry
+
+    def expired(self, entry):
+        return self.ttl is not None and (time.time() * 1000 - entry['timestamp']) > self.ttl
+
+    def save(self, exchange, markets, currencies, options={}):
+        # options are the ones set while fetching the markets, e.g. additional indexes of them
+        entry = {
+            'key': self.key(exchange),
+            'timestamp': int(time.time() * 1000),
+            'markets': markets,
+            'currencies': currencies,
+            'options': options,
+        }
+        try:
+            data = json.dumps(entry, separators=(',', ':')).encode()
+        except (TypeError, ValueError):
+            # not a plain json structure, not cached
+            return False
+        filename = self.filename(exchange)
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            # written aside and renamed, readers in other processes never see a partial file
+            descriptor, temporary = tempfile.mkstemp(dir=self.path, prefix='.' + exchange.id + '-')
+        except OSError:
+            return False
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(data)
+            os.replace(temporary, filename)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            return False
+        return True
+
+    def clear(self, exchange=None):
+        prefix = exchange.id + '-' if exchange is not None else ''
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return
+        for name in names:
+            if name.startswith(prefix) and name.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+import contextvars
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# -----------------------------------------------------------------------------
+# candles as one numpy structured array instead of a list of lists, requires numpy:
+#
+#     candles = exchange.fetch_ohlcv_array('BTC/USDT', '1m', since, 1000)
+#     candles['timestamp']  # int64 milliseconds
+#     candles['close']  # float64, nan where the exchange sent no value
+#
+# the rows are sorted by timestamp and unique, a repeated timestamp keeps the last row,
+# so the pages of a backfill can be merged with concatenate() in any order
+#
+# the default fetch_ohlcv() output, a list of [timestamp, open, high, low, close, volume], is unchanged
+#
+# with the exchanges listed in streamed, fetch_ohlcv() returns what parse_ohlcvs() returns as it is,
+# so parse_ohlcvs() writes each candle into the array as soon as it is parsed and returns an empty list,
+# the list of lists of the whole response is never built, with the other exchanges fetch_ohlcv()
+# builds the lists first and they are written into the array after, one row at a time, so the peak
+# memory is the one of fetch_ohlcv() plus the array
+
+streamed = frozenset(['binance', 'bingx', 'bitget', 'bybit', 'coinbase', 'gate', 'htx', 'kraken', 'kucoin', 'mexc', 'okx'])
+
+collecting = contextvars.ContextVar('ccxt_ohlcv_array', default=None)
+
+fields = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+
+def dtype():
+    return numpy.dtype([('timestamp', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8'), ('volume', 'f8')])
+
+
+def empty(length=0):
+    return numpy.empty(length, dtype=dtype())
+
+
+def ohlcv_array(rows, length=None):
+    # the array of parsed candles, [timestamp, open, high, low, close, volume] lists or tuples in any order,
+    # written one row at a time into a block of floats, rows can be an iterator of length rows
+    values = numpy.empty((len(rows) if length is None else length, 6), dtype=numpy.float64)
+    count = 0
+    for row in rows:
+        if row[0] is None:
+            continue
+        if len(row) == 6:
+            values[count] = row  # None becomes nan
+        else:
+            values[count] = (list(row[0:6]) + [None] * 6)[0:6]
+        count += 1
+    result = empty(count)
+    result['timestamp'] = values[0:count, 0]
+    for i in range(1, 6):
+        result[fields[i]] = values[0:count, i]
+    return sort_unique(result)
+
+
+class Columns(object):
+    # collects the arrays parse_ohlcvs() writes while fetch_ohlcv() runs for exchange:
+    #
+    #     with Columns(exchange) as columns:
+    #         ohlcvs = exchange.fetch_ohlcv(symbol, timeframe, since, limit, params)
+    #     array = columns.array(ohlcvs)
+
+    def __init__(self, exchange):
+        self.exchange = exchange
+        self.arrays = []
+        self.token = None
+
+    def __enter__(self):
+        if self.exchange.id in streamed:
+            stream(self.exchange)
+            self.token = collecting.set(self)
+        return self
+
+    def __exit__(self, *args):
+        if self.token is not None:
+            collecting.reset(self.token)
+            self.token = None
+
+    def array(self, ohlcvs):
+        # the candles written while parsing, or the ones returned when nothing was written
+        if self.arrays:
+            return concatenate(self.arrays)
+        return ohlcv_array(ohlcvs)
+
+
+def stream(exchange):
+    # parse_ohlcvs() of the instance writes the candles into the columns being collected for it, if any
+    if 'parse_ohlcvs' in exchange.__dict__:
+        return
+    parse_ohlcvs = exchange.parse_ohlcvs
+
+    def wrapper(ohlcvs, market=None, timeframe='1m', since=None, limit=None, *args):
+        columns = collecting.get()
+        if columns is None or columns.exchange is not exchange:
+            return parse_ohlcvs(ohlcvs, market, timeframe, since, limit, *args)
+        # since and limit are applied to the whole array after
+        columns.arrays.append(ohlcv_array((exchange.parse_ohlcv(ohlcvs[i], market) for i in range(0, len(ohlcvs))), len(ohlcvs)))
+        return []
+
+    exchange.parse_ohlcvs = wrapper
+
+
+def sort_unique(array):
+    # sorted by timestamp, the last of the rows with the same timestamp
+    if len(array) < 2:
+        return array
+    timestamps = array['timestamp']
+    if numpy.all(timestamps[1:] > timestamps[:-1]):
+        return array
+    array = array[numpy.argsort(timestamps, kind='stable')]
+    timestamps = array['timestamp']
+    last = numpy.append(timestamps[1:] != timestamps[:-1], True)
+    return array[last]
+
+
+def concatenate(arrays):
+    arrays = [array for array in arrays if array is not None]
+    if not arrays:
+        return empty()
+    return sort_unique(numpy.concatenate(arrays))
+
+
+def filter_by_since_limit(array, since=None, limit=None, tail=False):
+    # like Exchange.filter_by_since_limit() on the sorted rows, the first limit rows from since or the last limit rows
+    if since is not None:
+        array = array[numpy.searchsorted(array['timestamp'], since, side='left'):]
+    if limit is not None:
+        if since is not None and not tail:
+            array = array[0:limit]
+        elif limit < len(array):
+            array = array[len(array) - limit:]
+    return array
+
+
+def to_list(array):
+    # the rows as the lists fetch_ohlcv() returns, None where the value is nan
+    result = []
+    for row in array.tolist():
+        result.append([row[0]] + [None if value != value else value for value in row[1:]])
+    return result
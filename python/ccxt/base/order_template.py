@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import fractions
+
+from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TICK_SIZE
+from ccxt.base.errors import ArgumentsRequired, InvalidOrder, NotSupported
+
+# -----------------------------------------------------------------------------
+# an order of a market, type and side prepared once and sent with only its amount and price:
+#
+#     template = exchange.order_template('BTC/USDT', 'limit', 'buy', {'timeInForce': 'IOC'})
+#     response = exchange.create_order_from_template(template, 0.001, 50000)  # the raw response
+#     order = template.parse_order(response)  # the unified order, once the order is sent
+#
+# order_template() runs create_order() twice with sample amounts and prices and stops each run at
+# the request it would send, nothing is sent, the fields of the request that follow the amount or the
+# price, and the ones made with the uuid and clock methods, e.g. a client order id, are the only ones
+# filled per order, the endpoint, its rate limit cost, the rest of the request and the precision
+# formatters are reused, the order is then signed with a fresh nonce and sent as fetch2() would
+#
+# the orders whose request cannot be prepared raise NotSupported, e.g. when create_order() fetches
+# something else first or sends a field derived from both the amount and the price, a clientOrderId
+# in the params of the template is sent with every order, pass one per order to create_order_from_template()
+
+GENERATORS = {
+    # the methods create_order() can make a field with, and the offset of the second run
+    'uuid': None,
+    'uuid16': None,
+    'uuid22': None,
+    'uuidv1': None,
+    'seconds': 86400,
+    'milliseconds': 86400000,
+    'microseconds': 86400000000,
+}
+
+
+class Captured(BaseException):
+    # stops create_order() at its request, not an Exception so that nothing on the way catches it
+    def __init__(self, request):
+        self.request = request
+
+
+class Capture(object):
+    # the request of a create_order() call and the values the generators made meanwhile, nothing is sent,
+    # the call is made on a shallow copy of the exchange, the methods of the exchange itself are untouched
+    # while other threads or coroutines use it
+    def __init__(self, exchange, index, asynchronous=False):
+        self.exchange = copy.copy(exchange)
+        if exchange.profiler is not None:
+            # the unified methods wrapped by the profiler are bound to the exchange
+            for name in exchange.profiler.wrapped.get(id(exchange), []):
+                self.exchange.__dict__.pop(name, None)
+            self.exchange.profiler = None
+        self.index = index
+        self.asynchronous = asynchronous
+        self.request = None
+        self.generated = []  # [name, value]
+
+    def generator(self, name, method):
+        offset = GENERATORS[name]
+
+        def generate(*args):
+            value = method(*args)
+            if offset is not None:
+                # the clocks of the two runs differ, a field derived from one is not mistaken for a constant
+                value += offset * self.index
+            self.generated.append([name, value])
+            return value
+        return generate
+
+    def __enter__(self):
+        def fetch2(path, api='public', method='GET', params={}, headers=None, body=None, config={}):
+            raise Captured({'path': path, 'api': api, 'method': method, 'params': params, 'headers': headers, 'body': body, 'config': config})
+
+        async def async_fetch2(*args, **kwargs):
+            fetch2(*args, **kwargs)
+
+        for name in GENERATORS:
+            setattr(self.exchange, name, self.generator(name, getattr(self.exchange, name)))
+        self.exchange.fetch2 = async_fetch2 if self.asynchronous else fetch2
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        # the sessions belong to the exchange, the copy does not close them
+        self.exchange.session = None
+        self.exchange.socks_proxy_sessions = None
+        if isinstance(exception, Captured):
+            self.request = copy.deepcopy(exception.request)
+            return True
+        return False
+
+
+def differences(first, second, path=()):
+    # the paths of the values that differ between two requests
+    if isinstance(first, dict) and isinstance(second, dict) and list(first.keys()) == list(second.keys()):
+        for key in first:
+            yield from differences(first[key], second[key], path + (key,))
+    elif isinstance(first, list) and isinstance(second, list) and len(first) == len(second):
+        for i in range(0, len(first)):
+            yield from differences(first[i], second[i], path + (i,))
+    elif first != second or type(first) is not type(second):
+        yield path
+
+
+def get(value, path):
+    for key in path:
+        value = value[key]
+    return value
+
+
+def filled(value, path, replacement):
+    # a copy of the containers along the path with the replacement at its end
+    if not path:
+        return replacement
+    result = dict(value) if isinstance(value, dict) else list(value)
+    result[path[0]] = filled(value[path[0]], path[1:], replacement)
+    return result
+
+
+class OrderTemplate(object):
+    def __init__(self, exchange, symbol, type, side, params={}):
+        self.exchange = exchange
+        self.market = exchange.market(symbol)
+        self.symbol = self.market['symbol']
+        self.type = type
+        self.side = side
+        self.params = params
+        # the precision methods of the exchange when it overrides them, the formatters of the market otherwise
+        self.amount_formatter = None
+        self.price_formatter = None
+        if not overridden(exchange, 'amount_to_precision'):
+            self.amount_formatter = exchange.precision_formatter(self.symbol, 'amount')
+        if not overridden(exchange, 'price_to_precision'):
+            self.price_formatter = exchange.precision_formatter(self.symbol, 'price')
+        self.captures = []
+        self.fields = []  # [path, source, kind]
+        self.request = None
+        self.nested = False
+        self.cost = None
+
+    def samples(self):
+        # two amounts and two prices between the steps of the precision, so that the request tells
+        # a truncated amount and a rounded price apart from the raw numbers, the first of each is
+        # formatted to a whole number and the second to a fraction unless the step is whole, so that
+        # a field sent with int(), float() or parse_to_numeric() is told apart, all four strings differ
+        amounts = self.sample_values('amount')
+        factor = 1
+        prices = self.sample_values('price', factor)
+        while set(amounts) & set(prices):
+            factor += 1
+            prices = self.sample_values('price', factor)
+        result = []
+        for i in range(0, 2):
+            # 0.4 of a step above the multiple, truncated and rounded to it
+            amount = float(amounts[i] + self.sample_step('amount') * fractions.Fraction(2, 5))
+            price = float(prices[i] + self.sample_step('price') * fractions.Fraction(2, 5))
+            result.append([amount, None if self.type == 'market' else price])
+        return result
+
+    def sample_step(self, field):
+        precision = self.market['precision'][field]
+        if precision is not None:
+            if self.exchange.precisionMode == TICK_SIZE:
+                return fractions.Fraction(self.exchange.number_to_string(precision))
+            elif self.exchange.precisionMode == DECIMAL_PLACES:
+                return fractions.Fraction(1, 10 ** int(precision))
+        return fractions.Fraction(1)
+
+    def sample_values(self, field, factor=1):
+        # the whole multiple of the step above the minimum, times the factor, and the next multiple
+        step = self.sample_step(field)
+        limits = self.exchange.safe_dict(self.market['limits'], field, {})
+        minimum = self.exchange.safe_string(limits, 'min')
+        count = 1
+        if minimum is not None:
+            count = int(fractions.Fraction(minimum) / step.numerator) + 1
+        whole = step.numerator * count * factor
+        return [whole, whole + step]
+
+    def capture(self, amount, price, asynchronous=False):
+        result = Capture(self.exchange, len(self.captures), asynchronous)
+        self.captures.append([amount, price, result])
+        return result
+
+    def format(self, field, value):
+        if field == 'amount':
+            if self.amount_formatter is None:
+                return self.exchange.amount_to_precision(self.symbol, value)
+            result = self.amount_formatter.format(value)
+        else:
+            if self.price_formatter is None:
+                return self.exchange.price_to_precision(self.symbol, value)
+            result = self.price_formatter.format(value)
+        if result == '0':
+            raise InvalidOrder(self.exchange.id + ' ' + field + ' of ' + self.symbol + ' must be greater than minimum ' + field + ' precision of ' + self.exchange.number_to_string(self.market['precision'][field]))
+        return result
+
+    def source(self, value, amount, price, generated):
+        # what a field of a request is made of
+        if price is not None:
+            formatted = {'amount': self.format('amount', amount), 'price': self.format('price', price)}
+        else:
+            formatted = {'amount': self.format('amount', amount)}
+        for field in formatted:
+            string = formatted[field]
+            if type(value) is str and value == string:
+                return [field, 'string']
+            if type(value) in [int, float] and value == float(string):
+                return [field, type(value).__name__]
+        for i in range(0, len(generated)):
+            name, output = generated[i]
+            if value == output and type(value) is type(output):
+                return ['generated', [name, i, None, None]]
+            if type(value) is str and str(output) in value:
+                prefix, suffix = value.split(str(output), 1)
+                return ['generated', [name, i, prefix, suffix]]
+        return None
+
+    def prepare(self):
+        requests = [capture.request for amount, price, capture in self.captures]
+        if any(request is None for request in requests):
+            raise NotSupported(self.exchange.id + ' orderTemplate() could not capture the request of createOrder() for ' + self.symbol)
+        fields = ['amount'] if self.type == 'market' else ['amount', 'price']
+        if any(self.market['precision'][field] is None for field in fields):
+            raise NotSupported(self.exchange.id + ' orderTemplate() requires the precision of the market ' + self.symbol)
+        first = requests[0]
+        second = requests[1]
+        for key in ['path', 'api', 'method', 'headers', 'body', 'config']:
+            if first[key] != second[key]:
+                raise NotSupported(self.exchange.id + ' orderTemplate() does not support the ' + key + ' that createOrder() makes per order for ' + self.symbol)
+        if not isinstance(first['params'], dict):
+            raise NotSupported(self.exchange.id + ' orderTemplate() does not support the request of createOrder() for ' + self.symbol)
+        for path in differences(first['params'], second['params']):
+            sources = []
+            for amount, price, capture in self.captures:
+                sources.append(self.source(get(capture.request['params'], path), amount, price, capture.generated) if path else None)
+            if sources[0] is not None and sources[1] is not None and sources[0][0] == sources[1][0] and [sources[0][1], sources[1][1]] == ['int', 'float']:
+                # a whole number sent as an int and a fraction as a float, as parse_to_numeric() does
+                sources = [[sources[0][0], 'numeric']] * 2
+            if sources[0] is None or sources[0] != sources[1]:
+                raise NotSupported(self.exchange.id + ' orderTemplate() does not support the ' + '.'.join(str(key) for key in path) + ' field of the request of createOrder() for ' + self.symbol)
+            self.fields.append([path, sources[0][0], sources[0][1]])
+        if not any(source == 'amount' for path, source, kind in self.fields):
+            raise NotSupported(self.exchange.id + ' orderTemplate() could not find the amount in the request of createOrder() for ' + self.symbol)
+        self.request = first
+        self.nested = any(isinstance(value, (dict, list)) for value in first['params'].values())
+        self.cost = self.exchange.calculate_rate_limiter_cost(first['api'], first['method'], first['path'], first['params'], first['config'])
+        return self
+
+    def fill(self, amount, price=None, params={}):
+        # the params of the request of an order, before signing
+        request = self.request
+        values = {}
+        if amount is None:
+            raise ArgumentsRequired(self.exchange.id + ' createOrderFromTemplate() requires an amount argument')
+        values['amount'] = self.format('amount', amount)
+        result = copy.deepcopy(request['params']) if self.nested else dict(request['params'])
+        for path, source, kind in self.fields:
+            if source == 'generated':
+                name, i, prefix, suffix = kind
+                value = getattr(self.exchange, name)()
+                if prefix is not None:
+                    value = prefix + str(value) + suffix
+            else:
+                if source not in values:
+                    if price is None:
+                        raise ArgumentsRequired(self.exchange.id + ' createOrderFromTemplate() requires a price argument for a ' + self.type + ' order')
+                    values[source] = self.format(source, price)
+                value = values[source]
+                if kind == 'float':
+                    value = float(value)
+                elif kind == 'int':
+                    value = int(float(value))
+                elif kind == 'numeric':
+                    value = self.exchange.parse_to_numeric(value)
+            result = filled(result, path, value)
+        if params:
+            result = self.exchange.extend(result, params)
+        return result
+
+    def parse_order(self, response):
+        # the unified order of the response of an exchange that parses it as is, like binance
+        return self.exchange.parse_order(response, self.market)
+
+
+def overridden(exchange, name):
+    # whether a method of ccxt.base.exchange.Exchange is replaced by the class of the exchange
+    for klass in exchange.__class__.__mro__:
+        if name in klass.__dict__:
+            return klass.__module__ != 'ccxt.base.exchange'
+    return False
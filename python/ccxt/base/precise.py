@@ -11,26 +11,92 @@
 # (╯°□°）╯︵ ┻━┻
 
 
+# the parsed form of the strings seen recently, the same prices, amounts and contract sizes repeat
+parsed = {}
+
+
+def parse(string):
+    # (integer, decimals) of a number string
+    try:
+        return parsed[string]
+    except KeyError:
+        pass
+    modifier = 0
+    number = string.lower()
+    if 'e' in number:
+        number, modifier = number.split('e')
+        modifier = int(modifier)
+    decimal_index = number.find('.')
+    if decimal_index > -1:
+        decimals = len(number) - decimal_index - 1
+        integer = int(number.replace('.', ''))
+    else:
+        decimals = 0
+        integer = int(number)
+    result = (integer, decimals - modifier)
+    if len(parsed) >= 10000:
+        parsed.clear()
+    parsed[string] = result
+    return result
+
+
+def reduce(integer, decimals):
+    # drops the trailing zeros of the integer
+    if integer == 0:
+        return 0, 0
+    if integer % 10:
+        return integer, decimals
+    string = str(integer)
+    stripped = string.rstrip('0')
+    return int(stripped), decimals - (len(string) - len(stripped))
+
+
+def stringify(integer, decimals):
+    integer, decimals = reduce(integer, decimals)
+    if decimals == 0:
+        return str(integer)
+    sign = '-' if integer < 0 else ''
+    digits = str(abs(integer))
+    if decimals < 0:
+        return sign + digits + '0' * (-decimals)
+    digits = digits.rjust(decimals, '0')
+    index = len(digits) - decimals
+    return sign + ('0.' if index == 0 else digits[:index] + '.') + digits[index:]
+
+
+def align(integer1, decimals1, integer2, decimals2):
+    # the integers scaled to the same decimals
+    if decimals1 == decimals2:
+        return integer1, integer2, decimals1
+    elif decimals1 > decimals2:
+        return integer1, integer2 * (10 ** (decimals1 - decimals2)), decimals1
+    return integer1 * (10 ** (decimals2 - decimals1)), integer2, decimals2
+
+
+def divide(integer1, decimals1, integer2, decimals2, precision=18):
+    distance = precision - decimals1 + decimals2
+    if distance == 0:
+        numerator = integer1
+    elif distance < 0:
+        numerator = integer1 // (10 ** -distance)
+    else:
+        numerator = integer1 * (10 ** distance)
+    result, mod = divmod(numerator, integer2)
+    # python floors negative numbers down instead of truncating
+    # if mod is zero it will be floored to itself so we do not add one
+    return result + 1 if result < 0 and mod else result
+
+
 class Precise:
+    __slots__ = ['integer', 'decimals']
+    base = 10
+
     def __init__(self, number, decimals=None):
         if decimals is None:
-            modifier = 0
-            number = number.lower()
-            if 'e' in number:
-                number, modifier = number.split('e')
-                modifier = int(modifier)
-            decimal_index = number.find('.')
-            if decimal_index > -1:
-                self.decimals = len(number) - decimal_index - 1
-                self.integer = int(number.replace('.', ''))
-            else:
-                self.decimals = 0
-                self.integer = int(number)
-            self.decimals = self.decimals - modifier
+            self.integer, self.decimals = parse(number)
         else:
             self.integer = number
             self.decimals = decimals
-        self.base = 10
 
     def __add__(self, other):
         return self.add(other)
@@ -78,39 +144,18 @@ class Precise:
         return self.equals(other)
 
     def mul(self, other):
-        integer_result = self.integer * other.integer
-        return Precise(integer_result, self.decimals + other.decimals)
+        return Precise(self.integer * other.integer, self.decimals + other.decimals)
 
     def div(self, other, precision=18):
-        distance = precision - self.decimals + other.decimals
-        if distance == 0:
-            numerator = self.integer
-        elif distance < 0:
-            exponent = self.base ** -distance
-            numerator = self.integer // exponent
-        else:
-            exponent = self.base ** distance
-            numerator = self.integer * exponent
-        result, mod = divmod(numerator, other.integer)
-        # python floors negative numbers down instead of truncating
-        # if mod is zero it will be floored to itself so we do not add one
-        result = result + 1 if result < 0 and mod else result
-        return Precise(result, precision)
+        return Precise(divide(self.integer, self.decimals, other.integer, other.decimals, precision), precision)
 
     def add(self, other):
-        if self.decimals == other.decimals:
-            integer_result = self.integer + other.integer
-            return Precise(integer_result, self.decimals)
-        else:
-            smaller, bigger = [other, self] if self.decimals > other.decimals else [self, other]
-            exponent = bigger.decimals - smaller.decimals
-            normalised = smaller.integer * (self.base ** exponent)
-            result = normalised + bigger.integer
-            return Precise(result, bigger.decimals)
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return Precise(integer1 + integer2, decimals)
 
     def sub(self, other):
-        negative = Precise(-other.integer, other.decimals)
-        return self.add(negative)
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return Precise(integer1 - integer2, decimals)
 
     def abs(self):
         return Precise(abs(self.integer), self.decimals)
@@ -137,12 +182,12 @@ class Precise:
         return self if self.gt(other) else other
 
     def gt(self, other):
-        add = self.sub(other)
-        return add.integer > 0
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return integer1 > integer2
 
     def ge(self, other):
-        add = self.sub(other)
-        return add.integer >= 0
+        integer1, integer2, decimals = align(self.integer, self.decimals, other.integer, other.decimals)
+        return integer1 >= integer2
 
     def lt(self, other):
         return other.gt(self)
@@ -151,20 +196,8 @@ class Precise:
         return other.ge(self)
 
     def reduce(self):
-        string = str(self.integer)
-        start = len(string) - 1
-        if start == 0:
-            if string == "0":
-                self.decimals = 0
-            return self
-        for i in range(start, -1, -1):
-            if string[i] != '0':
-                break
-        difference = start - i
-        if difference == 0:
-            return self
-        self.decimals -= difference
-        self.integer = int(string[:i + 1])
+        self.integer, self.decimals = reduce(self.integer, self.decimals)
+        return self
 
     def equals(self, other):
         self.reduce()
@@ -173,19 +206,7 @@ class Precise:
 
     def __str__(self):
         self.reduce()
-        sign = '-' if self.integer < 0 else ''
-        integer_array = list(str(abs(self.integer)).rjust(self.decimals, '0'))
-        index = len(integer_array) - self.decimals
-        if index == 0:
-            item = '0.'
-        elif self.decimals < 0:
-            item = '0' * (-self.decimals)
-        elif self.decimals == 0:
-            item = ''
-        else:
-            item = '.'
-        integer_array.insert(index, item)
-        return sign + ''.join(integer_array)
+        return stringify(self.integer, self.decimals)
 
     def __repr__(self):
         return "Precise(" + str(self) + ")"
@@ -193,20 +214,26 @@ class Precise:
     def __float__(self):
         return float(str(self))
 
+    # the string methods below work on the parsed (integer, decimals) pairs directly,
+    # without making Precise instances, with the same results as the instance methods
+
     @staticmethod
     def string_mul(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).mul(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return stringify(integer1 * integer2, decimals1 + decimals2)
 
     @staticmethod
     def string_div(string1, string2, precision=18):
         if string1 is None or string2 is None:
             return None
-        string2_precise = Precise(string2)
-        if string2_precise.integer == 0:
+        integer2, decimals2 = parse(string2)
+        if integer2 == 0:
             return None
-        return str(Precise(string1).div(string2_precise, precision))
+        integer1, decimals1 = parse(string1)
+        return stringify(divide(integer1, decimals1, integer2, decimals2, precision), precision)
 
     @staticmethod
     def string_add(string1, string2):
@@ -216,25 +243,29 @@ class Precise:
             return string2
         elif string2 is None:
             return string1
-        return str(Precise(string1).add(Precise(string2)))
+        integer1, integer2, decimals = align(*(parse(string1) + parse(string2)))
+        return stringify(integer1 + integer2, decimals)
 
     @staticmethod
     def string_sub(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).sub(Precise(string2)))
+        integer1, integer2, decimals = align(*(parse(string1) + parse(string2)))
+        return stringify(integer1 - integer2, decimals)
 
     @staticmethod
     def string_abs(string):
         if string is None:
             return None
-        return str(Precise(string).abs())
+        integer, decimals = parse(string)
+        return stringify(abs(integer), decimals)
 
     @staticmethod
     def string_neg(string):
         if string is None:
             return None
-        return str(Precise(string).neg())
+        integer, decimals = parse(string)
+        return stringify(-integer, decimals)
 
     @staticmethod
     def string_mod(string1, string2):
@@ -246,52 +277,64 @@ class Precise:
     def string_or(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).orn(Precise(string2)))
+        integer1, decimals1 = parse(string1)
+        integer2, decimals2 = parse(string2)
+        return stringify(integer1 | integer2, decimals1)
 
     @staticmethod
     def string_equals(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return reduce(*parse(string1)) == reduce(*parse(string2))
 
     @staticmethod
     def string_eq(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).equals(Precise(string2))
+        return reduce(*parse(string1)) == reduce(*parse(string2))
 
     @staticmethod
     def string_min(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).min(Precise(string2)))
+        parsed1 = parse(string1)
+        parsed2 = parse(string2)
+        integer1, integer2, decimals = align(*(parsed1 + parsed2))
+        return stringify(*(parsed1 if integer1 < integer2 else parsed2))
 
     @staticmethod
     def string_max(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return str(Precise(string1).max(Precise(string2)))
+        parsed1 = parse(string1)
+        parsed2 = parse(string2)
+        integer1, integer2, decimals = align(*(parsed1 + parsed2))
+        return stringify(*(parsed1 if integer1 > integer2 else parsed2))
 
     @staticmethod
     def string_gt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).gt(Precise(string2))
+        integer1, integer2, decimals = align(*(parse(string1) + parse(string2)))
+        return integer1 > integer2
 
     @staticmethod
     def string_ge(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).ge(Precise(string2))
+        integer1, integer2, decimals = align(*(parse(string1) + parse(string2)))
+        return integer1 >= integer2
 
     @staticmethod
     def string_lt(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).lt(Precise(string2))
+        integer1, integer2, decimals = align(*(parse(string1) + parse(string2)))
+        return integer1 < integer2
 
     @staticmethod
     def string_le(string1, string2):
         if string1 is None or string2 is None:
             return None
-        return Precise(string1).le(Precise(string2))
+        integer1, integer2, decimals = align(*(parse(string1) + parse(string2)))
+        return integer1 <= integer2
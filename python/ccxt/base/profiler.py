@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import time
+
+from ccxt.base.types import Entry
+
+# -----------------------------------------------------------------------------
+# the time of every stage of the requests of an exchange, per endpoint:
+#
+#     profiler = Profiler()
+#     exchange.set_profiler(profiler)
+#     exchange.fetch_ticker('BTC/USDT')
+#     profiler.endpoints['publicGetTicker24hr']  # {'calls': 1, 'failures': 0, 'throttle': 0.0, 'sign': 0.00002, 'network': 0.21, ...}
+#     exchange.set_profiler(None)
+#
+# the stages, in seconds summed over the calls:
+#
+#     throttle   waiting for the rate limit, until sign()
+#     sign       sign()
+#     network    the http request, from sign() to the body of the response
+#     json       parse_json()
+#     errors     handle_errors() and the checks of the status, the time of a request that raised after the network
+#     parse      the rest of the unified method, building the request and parsing the response
+#
+# bytesOut and bytesIn are the lengths of the bodies, the endpoints are named after the implicit api
+# methods, e.g. privatePostOrder, the parse time of a unified method is counted for the endpoint of its
+# last request and for the method itself in profiler.methods, with the total time of its calls
+#
+# the profiler wraps fetch2() and sign() of the exchange, fetch() records the rest of the stages, the
+# retries of a request are part of it, without a profiler, the default, nothing is wrapped or recorded
+
+STAGES = ['throttle', 'sign', 'network', 'json', 'errors', 'parse']
+
+active_request = contextvars.ContextVar('ccxt_profiled_request', default=None)
+active_call = contextvars.ContextVar('ccxt_profiled_call', default=None)
+no_profiling = contextlib.nullcontext()  # the context of the requests of an exchange without a profiler
+
+
+class ProfiledRequest(object):
+    __slots__ = ['endpoint', 'start', 'mark', 'stages', 'bytes_out', 'bytes_in']
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.start = self.mark = time.perf_counter()
+        self.stages = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+
+    def lap(self, stage):
+        # the time since the previous lap is the one of the stage
+        now = time.perf_counter()
+        self.stages[stage] = self.stages.get(stage, 0) + now - self.mark
+        self.mark = now
+
+
+class ProfiledCall(object):
+    __slots__ = ['requests', 'endpoint']
+
+    def __init__(self):
+        self.requests = 0  # seconds
+        self.endpoint = None  # of the last request
+
+
+class Profiler(object):
+    def __init__(self):
+        self.endpoints = {}
+        self.methods = {}
+        self.names = {}  # (class, api, method, path): endpoint
+        self.wrapped = {}  # id of an exchange: the names of the methods wrapped
+
+    def endpoint(self, exchange, path, api, method):
+        key = (exchange.__class__, tuple(api) if isinstance(api, list) else api, method, path)
+        name = self.names.get(key)
+        if name is None:
+            for klass in exchange.__class__.__mro__:
+                for value in vars(klass).values():
+                    if isinstance(value, Entry):
+                        entry_api = tuple(value.api) if isinstance(value.api, list) else value.api
+                        self.names.setdefault((exchange.__class__, entry_api, value.method, value.path), value.name)
+            name = self.names.get(key)
+            if name is None:
+                # a request of the exchange that is not an implicit api method
+                name = self.names[key] = ' '.join([str(key[1]), method, path])
+        return name
+
+    def begin(self, exchange, path, api, method):
+        return ProfiledRequest(self.endpoint(exchange, path, api, method))
+
+    @contextlib.contextmanager
+    def request(self, exchange, path, api, method):
+        # the request made within, recorded once it returns or raises
+        if active_request.get() is not None:
+            yield
+            return
+        request = self.begin(exchange, path, api, method)
+        token = active_request.set(request)
+        try:
+            yield
+        except Exception:
+            self.end(request, True)
+            raise
+        finally:
+            active_request.reset(token)
+        self.end(request)
+
+    def end(self, request, failed=False):
+        if failed:
+            request.lap('errors')
+        stats = self.stats(request.endpoint)
+        stats['calls'] += 1
+        if failed:
+            stats['failures'] += 1
+        for stage in request.stages:
+            stats[stage] += request.stages[stage]
+        stats['bytesOut'] += request.bytes_out
+        stats['bytesIn'] += request.bytes_in
+        call = active_call.get()
+        if call is not None:
+            call.requests += request.mark - request.start
+            call.endpoint = request.endpoint
+
+    def stats(self, endpoint):
+        stats = self.endpoints.get(endpoint)
+        if stats is None:
+            stats = self.endpoints[endpoint] = dict([['calls', 0], ['failures', 0]] + [[stage, 0] for stage in STAGES] + [['bytesOut', 0], ['bytesIn', 0]])
+        return stats
+
+    def record_call(self, name, call, seconds):
+        parse = max(0, seconds - call.requests)
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = {'calls': 0, 'seconds': 0, 'parse': 0}
+        stats['calls'] += 1
+        stats['seconds'] += seconds
+        stats['parse'] += parse
+        if call.endpoint is not None:
+            self.stats(call.endpoint)['parse'] += parse
+
+    def wrap(self, name, method):
+        # the unified method timed, the calls it makes to other unified methods are part of it
+        profiler = self
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(*args, **kwargs):
+                if active_call.get() is not None:
+                    return await method(*args, **kwargs)
+                call = ProfiledCall()
+                token = active_call.set(call)
+                start = time.perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    profiler.record_call(name, call, time.perf_counter() - start)
+                    active_call.reset(token)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            if active_call.get() is not None:
+                return method(*args, **kwargs)
+            call = ProfiledCall()
+            token = active_call.set(call)
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler.record_call(name, call, time.perf_counter() - start)
+                active_call.reset(token)
+        return wrapper
+
+    def wrap_fetch2(self, exchange, fetch2):
+        profiler = self
+
+        if inspect.iscoroutinefunction(fetch2):
+            @functools.wraps(fetch2)
+            async def async_wrapper(path, api='public', method='GET', *args, **kwargs):
+                with profiler.request(exchange, path, api, method):
+                    return await fetch2(path, api, method, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fetch2)
+        def wrapper(path, api='public', method='GET', *args, **kwargs):
+            with profiler.request(exchange, path, api, method):
+                return fetch2(path, api, method, *args, **kwargs)
+        return wrapper
+
+    def wrap_sign(self, sign):
+        # the throttle stage ends where sign() begins
+
+        @functools.wraps(sign)
+        def wrapper(*args, **kwargs):
+            request = active_request.get()
+            if request is None:
+                return sign(*args, **kwargs)
+            request.lap('throttle')
+            try:
+                return sign(*args, **kwargs)
+            finally:
+                request.lap('sign')
+        return wrapper
+
+    def attach(self, exchange):
+        names = []
+        for key in exchange.has:
+            name = exchange.un_camel_case(key)
+            if name.startswith('watch') or name.startswith('un_watch') or name.endswith('_ws') or name in exchange.__dict__:
+                continue
+            method = getattr(exchange, name, None)
+            if callable(method):
+                wrapper = self.wrap(key, method)
+                # the camelcase alias too, e.g. fetchTicker
+                for alias in set([name, key]):
+                    if alias not in exchange.__dict__ and hasattr(exchange, alias):
+                        setattr(exchange, alias, wrapper)
+                        names.append(alias)
+        for name, wrapper in [['fetch2', self.wrap_fetch2(exchange, exchange.fetch2)], ['sign', self.wrap_sign(exchange.sign)]]:
+            if name not in exchange.__dict__:
+                setattr(exchange, name, wrapper)
+                names.append(name)
+        self.wrapped[id(exchange)] = names
+
+    def detach(self, exchange):
+        for name in self.wrapped.pop(id(exchange), []):
+            if name in exchange.__dict__:
+                delattr(exchange, name)
+
+    def reset(self):
+        self.endpoints = {}
+        self.methods = {}
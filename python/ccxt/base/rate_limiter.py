@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+import contextvars
+import os
+import threading
+from abc import ABC, abstractmethod
+from time import monotonic, time
+
+from ccxt.base.errors import NotSupported
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+# -----------------------------------------------------------------------------
+# named rate limit buckets, e.g. request weight per minute and orders per 10 seconds,
+# an exchange enables them by setting rateLimitBuckets:
+#
+#     'rateLimitBuckets': {
+#         'weight': {'limit': 6000, 'interval': 60000, 'apis': ['public', 'private'], 'scale': 5, 'header': 'x-mbx-used-weight-1m'},
+#         'orders': {'limit': 100, 'interval': 10000, 'apis': ['private'], 'paths': ['order'], 'methods': ['POST']},
+#     }
+#
+# limit            number of units per interval (milliseconds)
+# capacity         largest burst, defaults to the limit
+# apis/paths/methods   requests debited with their cost, all of them when omitted
+# scale            units per cost, the endpoint costs are relative to rateLimit
+# header           response header reporting the units used so far, read to correct the local state,
+#                  only for the buckets the request was debited from, several apis can report the same header
+#
+# an endpoint can also debit buckets explicitly with {'cost': 1, 'buckets': {'orders': 1}}
+# once buckets are defined they replace the default single bucket based on rateLimit, except
+# for the requests that match none of them, those are still debited from the default one
+# all timestamps are in milliseconds of the monotonic clock, the one asyncio uses by default
+#
+# with a rateLimitBackend the buckets are kept outside of the exchange instance, so that
+# several instances or processes using the same api key draw from the same budget, the
+# backends never wait for a lock held by another process, the async exchanges call them
+# on the event loop, a locked backend returns a short delay to try again after instead
+
+
+active_debits = contextvars.ContextVar('ccxt_rate_limit_debits', default=None)  # of the request being made
+
+
+class RateLimitBucket(object):
+    def __init__(self, name, config):
+        self.name = name
+        self.limit = float(config['limit'])
+        self.interval = float(config.get('interval', 1000))
+        self.capacity = float(config.get('capacity', self.limit))
+        self.refillRate = self.limit / self.interval
+        self.scale = config.get('scale', 1)
+        self.apis = config.get('apis')
+        self.paths = config.get('paths')
+        self.methods = config.get('methods')
+        self.header = config['header'].lower() if config.get('header') else None
+        self.tokens = self.capacity
+        self.timestamp = None
+        self.used = None
+
+    def matches(self, api, path, method):
+        return ((self.apis is None or api in self.apis) and
+                (self.paths is None or path in self.paths) and
+                (self.methods is None or method in self.methods))
+
+    def refill(self, now):
+        if self.timestamp is not None and now > self.timestamp:
+            self.tokens = min(self.tokens + (now - self.timestamp) * self.refillRate, self.capacity)
+        self.timestamp = now
+
+    def delay(self, amount):
+        # milliseconds until the amount is available, an amount over the capacity waits for a full bucket
+        missing = min(amount, self.capacity) - self.tokens
+        return missing / self.refillRate if missing > 0 else 0
+
+    def correct(self, used):
+        remaining = min(self.limit - used, self.capacity)
+        # a lower usage than before means the exchange started a new window
+        reset = self.used is not None and used < self.used
+        if reset or remaining < self.tokens:
+            # otherwise only lowered, other clients share the limit or the endpoint costs more than configured
+            self.tokens = remaining
+        self.used = used
+        return remaining, reset
+
+
+class RateLimiter(object):
+    def __init__(self, buckets, backend=None, default=None):
+        self.backend = backend
+        self.prefix = ''  # namespaces the buckets in the backend, e.g. by exchange and api key
+        self.buckets = {}
+        for name in buckets:
+            self.buckets[name] = RateLimitBucket(name, buckets[name])
+        # the bucket of the rateLimit, for the requests without a named one
+        self.default = RateLimitBucket('default', default) if default is not None else None
+        self.headers = [bucket for bucket in self.buckets.values() if bucket.header is not None]
+        self.routes = {}
+
+    def debits(self, api, path, method, cost, config={}):
+        # [[bucket, amount], ...] for a request
+        if not isinstance(api, str):
+            api = '/'.join(api)
+        key = (api, path, method)
+        route = self.routes.get(key)
+        if route is None:
+            route = [bucket for bucket in self.buckets.values() if bucket.matches(api, path, method)]
+            self.routes[key] = route
+        cost = 1 if cost is None else cost
+        result = [[bucket, cost * bucket.scale] for bucket in route]
+        explicit = config.get('buckets') if config else None
+        if explicit:
+            for name in explicit:
+                result.append([self.buckets[name], explicit[name]])
+        if not result and self.default is not None:
+            result.append([self.default, cost])
+        active_debits.set(result)
+        return result
+
+    def milliseconds(self):
+        return monotonic() * 1000
+
+    def delay(self, debits, now=None):
+        # milliseconds until every bucket of the request has enough tokens, 0 when it can go now
+        now = self.milliseconds() if now is None else now
+        result = 0
+        for bucket, amount in debits:
+            bucket.refill(now)
+            delay = bucket.delay(amount)
+            if delay > result:
+                result = delay
+        return result
+
+    def consume(self, debits):
+        for bucket, amount in debits:
+            bucket.tokens -= amount
+
+    def acquire(self, debits):
+        # takes the tokens and returns 0, or returns the milliseconds to wait before trying again
+        if self.backend is not None:
+            return self.backend.acquire([[self.prefix + bucket.name, amount, min(amount, bucket.capacity), bucket.refillRate, bucket.capacity] for bucket, amount in debits])
+        delay = self.delay(debits)
+        if delay == 0:
+            self.consume(debits)
+        return delay
+
+    def update(self, headers, now=None, debits=None):
+        # adaptive correction from the usage reported by the exchange, debits are the ones of the request
+        if not self.headers or not headers:
+            return
+        now = self.milliseconds() if now is None else now
+        debits = active_debits.get() if debits is None else debits
+        buckets = self.headers if debits is None else [bucket for bucket in self.headers if any(debit[0] is bucket for debit in debits)]
+        lowercase = {}
+        for key in headers:
+            lowercase[key.lower()] = headers[key]
+        for bucket in buckets:
+            value = lowercase.get(bucket.header)
+            if value is not None:
+                try:
+                    used = float(value)
+                except ValueError:
+                    continue
+                bucket.refill(now)
+                remaining, reset = bucket.correct(used)
+                if self.backend is not None:
+                    self.backend.correct(self.prefix + bucket.name, remaining, reset, bucket.refillRate, bucket.capacity)
+
+    def stats(self):
+        buckets = list(self.buckets.values()) + ([self.default] if self.default is not None else [])
+        return dict((bucket.name, {
+            'tokens': bucket.tokens,
+            'capacity': bucket.capacity,
+            'used': bucket.used,
+        }) for bucket in buckets)
+
+
+class RateLimitBackend(ABC):
+    # keeps token buckets by key, each one refilled at refillRate tokens per millisecond up to capacity
+
+    @abstractmethod
+    def acquire(self, requests):
+        # requests is [[key, amount, required, refillRate, capacity], ...], taken atomically:
+        # when every bucket has the required tokens the amounts are subtracted and it returns 0,
+        # otherwise nothing changes and it returns the milliseconds until they will be there
+        pass
+
+    @abstractmethod
+    def correct(self, key, tokens, reset, refillRate, capacity):
+        # lowers the tokens of a bucket, or sets them when the exchange started a new window
+        pass
+
+    @staticmethod
+    def refill(row, now, refillRate, capacity):
+        if row is None:
+            return capacity
+        tokens, timestamp = row
+        if now > timestamp:
+            tokens = min(tokens + (now - timestamp) * refillRate, capacity)
+        return tokens
+
+    @staticmethod
+    def wait(tokens, required, refillRate):
+        missing = required - tokens
+        return missing / refillRate if missing > 0 else 0
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    # shared by the exchange instances and threads of one process
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}  # key -> (tokens, timestamp)
+
+    def acquire(self, requests):
+        now = time() * 1000
+        with self.lock:
+            delay = 0
+            tokens = []
+            for key, amount, required, refillRate, capacity in requests:
+                available = self.refill(self.buckets.get(key), now, refillRate, capacity)
+                delay = max(delay, self.wait(available, required, refillRate))
+                tokens.append(available - amount)
+            if delay > 0:
+                return delay
+            for i in range(0, len(requests)):
+                self.buckets[requests[i][0]] = (tokens[i], now)
+            return 0
+
+    def correct(self, key, tokens, reset, refillRate, capacity):
+        now = time() * 1000
+        with self.lock:
+            available = self.refill(self.buckets.get(key), now, refillRate, capacity)
+            if reset or tokens < available:
+                available = tokens
+            self.buckets[key] = (available, now)
+
+
+class SqliteRateLimitBackend(RateLimitBackend):
+    # shared by all processes on the machine through a sqlite database file, each acquire() is
+    # one write transaction, when another process holds the lock it returns retry milliseconds
+    # right away instead of waiting, timeout only applies to opening the database
+
+    def __init__(self, path, timeout=10, retry=1):
+        if sqlite3 is None:
+            raise NotSupported('SqliteRateLimitBackend requires the sqlite3 module')
+        self.path = path
+        self.timeout = timeout  # seconds
+        self.retry = retry  # milliseconds
+        self.local = threading.local()
+        self.connection()
+
+    def connection(self):
+        # one connection per thread and per process, a forked child opens its own
+        connection = getattr(self.local, 'connection', None)
+        pid = getattr(self.local, 'pid', None)
+        if connection is None or pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            connection.execute('CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL NOT NULL, timestamp REAL NOT NULL)')
+            connection.execute('PRAGMA busy_timeout=0')
+            self.local.connection = connection
+            self.local.pid = os.getpid()
+        return connection
+
+    @staticmethod
+    def begin(connection):
+        # False when another connection holds the write lock
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+        except sqlite3.OperationalError as e:
+            if 'locked' in str(e) or 'busy' in str(e):
+                return False
+            raise
+        return True
+
+    def acquire(self, requests):
+        connection = self.connection()
+        if not self.begin(connection):
+            return self.retry
+        try:
+            now = time() * 1000
+            delay = 0
+            tokens = []
+            for key, amount, required, refillRate, capacity in requests:
+                row = connection.execute('SELECT tokens, timestamp FROM buckets WHERE key = ?', (key,)).fetchone()
+                available = self.refill(row, now, refillRate, capacity)
+                delay = max(delay, self.wait(available, required, refillRate))
+                tokens.append(available - amount)
+            if delay == 0:
+                connection.executemany('INSERT OR REPLACE INTO buckets (key, tokens, timestamp) VALUES (?, ?, ?)',
+                                       [(requests[i][0], tokens[i], now) for i in range(0, len(requests))])
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+        return delay
+
+    def correct(self, key, tokens, reset, refillRate, capacity):
+        connection = self.connection()
+        if not self.begin(connection):
+            # skipped, the headers of the next response correct it
+            return
+        try:
+            now = time() * 1000
+            row = connection.execute('SELECT tokens, timestamp FROM buckets WHERE key = ?', (key,)).fetchone()
+            available = self.refill(row, now, refillRate, capacity)
+            if reset or tokens < available:
+                available = tokens
+            connection.execute('INSERT OR REPLACE INTO buckets (key, tokens, timestamp) VALUES (?, ?, ?)', (key, available, now))
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
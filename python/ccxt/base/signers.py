@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import hmac
+
+from cryptography.hazmat import backends
+from cryptography.hazmat.primitives.asymmetric import ed25519
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+# -----------------------------------------------------------------------------
+# the keys of Exchange.hmac(), Exchange.rsa(), Exchange.eddsa() and Exchange.jwt(), made once per secret:
+#
+#     h = hmac_template(secret, hashlib.sha256).copy()  # the key is already hashed into the inner and outer states
+#     h.update(request)
+#     rsa_key(pem).sign(...)  # the pem is parsed by the first signature only
+#
+# an entry is found by the secret itself, so when the secret of an exchange changes the next signature
+# uses a new entry and never the key of the previous secret, clear() drops all of them, e.g. after
+# rotating the credentials of a long running process
+
+hmac_templates = {}
+rsa_keys = {}
+eddsa_keys = {}
+
+
+def bounded(cache, key, value):
+    if len(cache) > 1000:
+        cache.clear()
+    cache[key] = value
+    return value
+
+
+def hmac_template(secret, algorithm):
+    # an hmac with the key and no message, copied for every message
+    key = (secret, algorithm)
+    template = hmac_templates.get(key)
+    if template is None:
+        template = bounded(hmac_templates, key, hmac.new(secret, None, algorithm))
+    return template
+
+
+def rsa_key(secret):
+    # the private key of a pem string or bytes
+    key = rsa_keys.get(secret)
+    if key is None:
+        pem = secret.encode('latin-1') if isinstance(secret, str) else secret
+        key = bounded(rsa_keys, secret, load_pem_private_key(pem, None, backends.default_backend()))
+    return key
+
+
+def eddsa_key(secret):
+    # the ed25519 private key of 32 raw bytes or a pem
+    key = eddsa_keys.get(secret)
+    if key is None:
+        raw = secret.encode('latin-1') if isinstance(secret, str) else secret
+        key = bounded(eddsa_keys, secret, ed25519.Ed25519PrivateKey.from_private_bytes(raw) if len(raw) == 32 else load_pem_private_key(raw, None))
+    return key
+
+
+def clear():
+    hmac_templates.clear()
+    rsa_keys.clear()
+    eddsa_keys.clear()
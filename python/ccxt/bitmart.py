@@ -3241,7 +3241,7 @@ class bitmart(Exchange, ImplicitAPI):
             network = self.safe_string(networks, network, network)  # handle ERC20>ETH alias
             if network is not None:
                 request['currency'] += '-' + network  # when network the currency need to be changed to currency + '-' + network https://developer-pro.bitmart.com/en/account/withdraw_apply.html on the end of page
-                currency['code'] = request['currency']  # update currency code to filter
+                currency = self.extend(currency, {'code': request['currency']})  # update currency code to filter, on a copy of the shared currency
                 params = self.omit(params, 'network')
         response = self.privateGetAccountV2DepositWithdrawHistory(self.extend(request, params))
         #
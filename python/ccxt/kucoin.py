@@ -3241,7 +3241,10 @@ class kucoin(Exchange, ImplicitAPI):
             data = self.safe_dict(response, 'data', {})
             precision = self.parse_number(self.parse_precision(self.safe_string(data, 'precision')))
             code = currency['code']
-            self.currencies[code]['networks'][networkCode]['precision'] = precision
+            # the currency is replaced, not changed in place, the currencies can be shared with other instances
+            currencyNetworks = self.extend(self.currencies[code]['networks'], {})
+            currencyNetworks[networkCode] = self.extend(currencyNetworks[networkCode], {'precision': precision})
+            self.currencies[code] = self.extend(self.currencies[code], {'networks': currencyNetworks})
 
     def parse_transaction_status(self, status: Str):
         statuses: dict = {
@@ -729,8 +729,12 @@ class binance(ccxt.async_support.binance):
         bookside.store(price, amount)
 
     def handle_deltas(self, bookside, deltas):
+        # parse the whole side first and apply it in one batch
+        bidAsks = []
         for i in range(0, len(deltas)):
-            self.handle_delta(bookside, deltas[i])
+            delta = deltas[i]
+            bidAsks.append([self.safe_float(delta, 0), self.safe_float(delta, 1)])
+        bookside.storeMany(bidAsks)
 
     def handle_order_book_message(self, client: Client, message, orderbook):
         u = self.safe_integer(message, 'u')
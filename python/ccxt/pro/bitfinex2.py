@@ -620,25 +620,38 @@ class bitfinex2(ccxt.async_support.bitfinex2):
         if book is None:
             return
         depth = 25  # covers the first 25 bids and asks
-        stringArray = []
+        checksumHelper = self.order_book_checksum(book, depth)
+        if not checksumHelper.due():
+            return
         bids = book['bids']
         asks = book['asks']
-        prec = self.safe_string(subscription, 'prec', 'P0')
-        isRaw = (prec == 'R0')
-        idToCheck = 2 if isRaw else 0
-        # pepperoni pizza from bitfinex
-        for i in range(0, depth):
-            bid = self.safe_value(bids, i)
-            ask = self.safe_value(asks, i)
-            if bid is not None:
-                stringArray.append(self.number_to_string(bids[i][idToCheck]))
-                stringArray.append(self.number_to_string(bids[i][1]))
-            if ask is not None:
-                stringArray.append(self.number_to_string(asks[i][idToCheck]))
-                aski1 = asks[i][1]
-                stringArray.append(self.number_to_string(-aski1))
-        payload = ':'.join(stringArray)
-        localChecksum = self.crc32(payload, True)
+        # the top levels did not change since the last verified message
+        localChecksum = checksumHelper.reuse(bids, asks, True)
+        if localChecksum is None:
+            stringArray = []
+            prec = self.safe_string(subscription, 'prec', 'P0')
+            isRaw = (prec == 'R0')
+            # the raw books are keyed by order id, there can be several orders at the same price
+            idToCheck = 2 if isRaw else 0
+            # pepperoni pizza from bitfinex
+            for i in range(0, depth):
+                bid = self.safe_value(bids, i)
+                ask = self.safe_value(asks, i)
+                if bid is not None:
+                    bidStrings = checksumHelper.cached('bids', bid[idToCheck], bid[1])
+                    if bidStrings is None:
+                        bidStrings = checksumHelper.store('bids', bid[idToCheck], bid[1], self.number_to_string(bid[idToCheck]), self.number_to_string(bid[1]))
+                    stringArray.append(bidStrings[0])
+                    stringArray.append(bidStrings[1])
+                if ask is not None:
+                    aski1 = ask[1]
+                    askStrings = checksumHelper.cached('asks', ask[idToCheck], aski1)
+                    if askStrings is None:
+                        askStrings = checksumHelper.store('asks', ask[idToCheck], aski1, self.number_to_string(ask[idToCheck]), self.number_to_string(-aski1))
+                    stringArray.append(askStrings[0])
+                    stringArray.append(askStrings[1])
+            payload = ':'.join(stringArray)
+            localChecksum = checksumHelper.crc32(payload, True)
         responseChecksum = self.safe_integer(message, 2)
         if responseChecksum != localChecksum:
             del client.subscriptions[messageHash]
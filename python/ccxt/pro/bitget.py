@@ -525,21 +525,25 @@ class bitget(ccxt.async_support.bitget):
             storedOrderBook['datetime'] = self.iso8601(timestamp)
             checksum = self.safe_bool(self.options, 'checksum', True)
             isSnapshot = self.safe_string(message, 'action') == 'snapshot'  # snapshot does not have a checksum
-            if not isSnapshot and checksum:
+            checksumHelper = self.order_book_checksum(storedOrderBook, 25)
+            if not isSnapshot and checksum and checksumHelper.due():
                 storedAsks = storedOrderBook['asks']
                 storedBids = storedOrderBook['bids']
-                asksLength = len(storedAsks)
-                bidsLength = len(storedBids)
-                payloadArray = []
-                for i in range(0, 25):
-                    if i < bidsLength:
-                        payloadArray.append(storedBids[i][2][0])
-                        payloadArray.append(storedBids[i][2][1])
-                    if i < asksLength:
-                        payloadArray.append(storedAsks[i][2][0])
-                        payloadArray.append(storedAsks[i][2][1])
-                payload = ':'.join(payloadArray)
-                calculatedChecksum = self.crc32(payload, True)
+                # the top levels did not change since the last verified message
+                calculatedChecksum = checksumHelper.reuse(storedBids, storedAsks, True)
+                if calculatedChecksum is None:
+                    asksLength = len(storedAsks)
+                    bidsLength = len(storedBids)
+                    payloadArray = []
+                    for i in range(0, 25):
+                        if i < bidsLength:
+                            payloadArray.append(storedBids[i][2][0])
+                            payloadArray.append(storedBids[i][2][1])
+                        if i < asksLength:
+                            payloadArray.append(storedAsks[i][2][0])
+                            payloadArray.append(storedAsks[i][2][1])
+                    payload = ':'.join(payloadArray)
+                    calculatedChecksum = checksumHelper.crc32(payload, True)
                 responseChecksum = self.safe_integer(rawOrderBook, 'checksum')
                 if calculatedChecksum != responseChecksum:
                     del client.subscriptions[messageHash]
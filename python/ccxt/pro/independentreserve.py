@@ -199,19 +199,31 @@ class independentreserve(ccxt.async_support.independentreserve):
             orderbook['timestamp'] = timestamp
             orderbook['datetime'] = self.iso8601(timestamp)
         checksum = self.handle_option('watchOrderBook', 'checksum', True)
-        if checksum and receivedSnapshot:
+        checksumHelper = self.order_book_checksum(orderbook, 10)
+        if checksum and receivedSnapshot and checksumHelper.due():
             storedAsks = orderbook['asks']
             storedBids = orderbook['bids']
-            asksLength = len(storedAsks)
-            bidsLength = len(storedBids)
-            payload = ''
-            for i in range(0, 10):
-                if i < bidsLength:
-                    payload = payload + self.value_to_checksum(storedBids[i][0]) + self.value_to_checksum(storedBids[i][1])
-            for i in range(0, 10):
-                if i < asksLength:
-                    payload = payload + self.value_to_checksum(storedAsks[i][0]) + self.value_to_checksum(storedAsks[i][1])
-            calculatedChecksum = self.crc32(payload, True)
+            # the top levels did not change since the last verified message
+            calculatedChecksum = checksumHelper.reuse(storedBids, storedAsks, True)
+            if calculatedChecksum is None:
+                asksLength = len(storedAsks)
+                bidsLength = len(storedBids)
+                payload = ''
+                for i in range(0, 10):
+                    if i < bidsLength:
+                        bid = storedBids[i]
+                        bidStrings = checksumHelper.cached('bids', bid[0], bid[1])
+                        if bidStrings is None:
+                            bidStrings = checksumHelper.store('bids', bid[0], bid[1], self.value_to_checksum(bid[0]), self.value_to_checksum(bid[1]))
+                        payload = payload + bidStrings[0] + bidStrings[1]
+                for i in range(0, 10):
+                    if i < asksLength:
+                        ask = storedAsks[i]
+                        askStrings = checksumHelper.cached('asks', ask[0], ask[1])
+                        if askStrings is None:
+                            askStrings = checksumHelper.store('asks', ask[0], ask[1], self.value_to_checksum(ask[0]), self.value_to_checksum(ask[1]))
+                        payload = payload + askStrings[0] + askStrings[1]
+                calculatedChecksum = checksumHelper.crc32(payload, True)
             responseChecksum = self.safe_integer(orderBook, 'Crc32')
             if calculatedChecksum != responseChecksum:
                 error = ChecksumError(self.id + ' ' + self.orderbook_checksum_message(symbol))
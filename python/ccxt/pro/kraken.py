@@ -719,23 +719,35 @@ class kraken(ccxt.async_support.kraken):
             # don't remove self line or I will poop on your face
             orderbook.limit()
             checksum = self.handle_option('watchOrderBook', 'checksum', True)
-            if checksum:
+            checksumHelper = self.order_book_checksum(orderbook, 10)
+            if checksum and checksumHelper.due():
                 priceString = self.safe_string(example, 0)
                 amountString = self.safe_string(example, 1)
                 priceParts = priceString.split('.')
                 amountParts = amountString.split('.')
                 priceLength = len(priceParts[1]) - 0
                 amountLength = len(amountParts[1]) - 0
-                payloadArray = []
-                if c is not None:
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedAsks[i][0], priceLength) + self.format_number(storedAsks[i][1], amountLength)
-                        payloadArray.append(formatted)
-                    for i in range(0, 10):
-                        formatted = self.format_number(storedBids[i][0], priceLength) + self.format_number(storedBids[i][1], amountLength)
-                        payloadArray.append(formatted)
-                payload = ''.join(payloadArray)
-                localChecksum = self.crc32(payload, False)
+                # the formatted levels are cached until the number of decimals changes
+                checksumHelper.track(self.number_to_string(priceLength) + ':' + self.number_to_string(amountLength))
+                # the top levels did not change since the last verified message
+                localChecksum = checksumHelper.reuse(storedBids, storedAsks, False)
+                if localChecksum is None:
+                    payloadArray = []
+                    if c is not None:
+                        for i in range(0, 10):
+                            ask = storedAsks[i]
+                            askStrings = checksumHelper.cached('asks', ask[0], ask[1])
+                            if askStrings is None:
+                                askStrings = checksumHelper.store('asks', ask[0], ask[1], self.format_number(ask[0], priceLength), self.format_number(ask[1], amountLength))
+                            payloadArray.append(askStrings[0] + askStrings[1])
+                        for i in range(0, 10):
+                            bid = storedBids[i]
+                            bidStrings = checksumHelper.cached('bids', bid[0], bid[1])
+                            if bidStrings is None:
+                                bidStrings = checksumHelper.store('bids', bid[0], bid[1], self.format_number(bid[0], priceLength), self.format_number(bid[1], amountLength))
+                            payloadArray.append(bidStrings[0] + bidStrings[1])
+                    payload = ''.join(payloadArray)
+                    localChecksum = checksumHelper.crc32(payload, False)
                 if localChecksum != c:
                     error = ChecksumError(self.id + ' ' + self.orderbook_checksum_message(symbol))
                     del client.subscriptions[messageHash]
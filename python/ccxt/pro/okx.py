@@ -870,24 +870,38 @@ class okx(ccxt.async_support.okx):
         if checksum:
             prevSeqId = self.safe_integer(message, 'prevSeqId')
             nonce = orderbook['nonce']
-            asksLength = len(storedAsks)
-            bidsLength = len(storedBids)
-            payloadArray = []
-            for i in range(0, 25):
-                if i < bidsLength:
-                    payloadArray.append(self.number_to_string(storedBids[i][0]))
-                    payloadArray.append(self.number_to_string(storedBids[i][1]))
-                if i < asksLength:
-                    payloadArray.append(self.number_to_string(storedAsks[i][0]))
-                    payloadArray.append(self.number_to_string(storedAsks[i][1]))
-            payload = ':'.join(payloadArray)
-            responseChecksum = self.safe_integer(message, 'checksum')
-            localChecksum = self.crc32(payload, True)
             error = None
             if prevSeqId != -1 and nonce != prevSeqId:
                 error = InvalidNonce(self.id + ' watchOrderBook received invalid nonce')
-            if responseChecksum != localChecksum:
-                error = ChecksumError(self.id + ' ' + self.orderbook_checksum_message(symbol))
+            checksumHelper = self.order_book_checksum(orderbook, 25)
+            if checksumHelper.due():
+                # the top levels did not change since the last verified message
+                localChecksum = checksumHelper.reuse(storedBids, storedAsks, True)
+                if localChecksum is None:
+                    asksLength = len(storedAsks)
+                    bidsLength = len(storedBids)
+                    payloadArray = []
+                    for i in range(0, 25):
+                        if i < bidsLength:
+                            bid = storedBids[i]
+                            # the levels are formatted once per amount
+                            bidStrings = checksumHelper.cached('bids', bid[0], bid[1])
+                            if bidStrings is None:
+                                bidStrings = checksumHelper.store('bids', bid[0], bid[1], self.number_to_string(bid[0]), self.number_to_string(bid[1]))
+                            payloadArray.append(bidStrings[0])
+                            payloadArray.append(bidStrings[1])
+                        if i < asksLength:
+                            ask = storedAsks[i]
+                            askStrings = checksumHelper.cached('asks', ask[0], ask[1])
+                            if askStrings is None:
+                                askStrings = checksumHelper.store('asks', ask[0], ask[1], self.number_to_string(ask[0]), self.number_to_string(ask[1]))
+                            payloadArray.append(askStrings[0])
+                            payloadArray.append(askStrings[1])
+                    payload = ':'.join(payloadArray)
+                    localChecksum = checksumHelper.crc32(payload, True)
+                responseChecksum = self.safe_integer(message, 'checksum')
+                if responseChecksum != localChecksum:
+                    error = ChecksumError(self.id + ' ' + self.orderbook_checksum_message(symbol))
             if error is not None:
                 del client.subscriptions[messageHash]
                 del self.orderbooks[symbol]
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.throttler import Throttler, TokenBucketThrottler  # noqa: E402
+
+# compares the polling looper against the timer-based token bucket on a backlog of
+# requests queued at once, the timer can be enabled on an exchange instance with
+# exchange = ccxt.async_support.binance({'tokenBucket': {'scheduler': 'timer'}})
+
+
+async def backlog(throttler, costs):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    lateness = []
+
+    async def request(cost):
+        await throttler(cost)
+        lateness.append((loop.time() - start) * 1000)
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    await asyncio.gather(*[request(cost) for cost in costs])
+    return time.perf_counter() - wall, time.process_time() - cpu, lateness
+
+
+def run(cls, config, costs):
+    throttler = cls(dict(config))
+    wall, cpu, granted = asyncio.run(backlog(throttler, costs))
+    # jitter: how late each request was granted compared to the ideal schedule
+    ideal = []
+    total = 0
+    for cost in costs:
+        ideal.append(max(0, total - config['tokens']) / config['refillRate'])
+        total += cost
+    granted = sorted(granted)
+    jitter = [g - granted[0] - i for g, i in zip(granted, ideal)]
+    return wall, cpu, sum(jitter) / len(jitter), max(jitter)
+
+
+def main():
+    scenarios = [
+        # rateLimit 0.5 ms, refilled faster than the looper polls
+        ('2000 x cost 1', 2.0, [1] * 2000),
+        # rateLimit 10 ms
+        ('300 x cost 1', 0.1, [1] * 300),
+        # weighted endpoints, rateLimit 0.5 ms
+        ('1000 x cost 1..20', 2.0, [1 + (i * 7) % 20 for i in range(1000)]),
+    ]
+    print('%-20s %-22s %10s %10s %12s %12s' % ('backlog', 'scheduler', 'wall s', 'cpu s', 'avg late ms', 'max late ms'))
+    for name, refill_rate, costs in scenarios:
+        config = {'refillRate': refill_rate, 'capacity': 1.0, 'tokens': 0, 'delay': 0.001, 'maxCapacity': 10000}
+        for cls in (Throttler, TokenBucketThrottler):
+            wall, cpu, average, maximum = run(cls, config, costs)
+            print('%-20s %-22s %10.3f %10.3f %12.3f %12.3f' % (name, cls.__name__, wall, cpu, average, maximum))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import os
+import sys
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt import Exchange  # noqa: E402
+from ccxt.async_support.base.ws.order_book import OrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_checksum import OrderBookChecksum  # noqa: E402
+
+
+exchange = Exchange()
+
+
+def random_deltas(count):
+    deltas = []
+    for _ in range(count):
+        price = random.randint(1000, 1100) / 10
+        amount = random.choice([0, random.randint(1, 500) / 100])
+        deltas.append([price, amount])
+    return deltas
+
+
+def reference_payload(book, depth):
+    payload = []
+    for i in range(0, depth):
+        if i < len(book['bids']):
+            payload.append(exchange.number_to_string(book['bids'][i][0]))
+            payload.append(exchange.number_to_string(book['bids'][i][1]))
+        if i < len(book['asks']):
+            payload.append(exchange.number_to_string(book['asks'][i][0]))
+            payload.append(exchange.number_to_string(book['asks'][i][1]))
+    return ':'.join(payload)
+
+
+def level_strings(checksum, side, level):
+    strings = checksum.cached(side, level[0], level[1])
+    if strings is None:
+        strings = checksum.store(side, level[0], level[1], exchange.number_to_string(level[0]), exchange.number_to_string(level[1]))
+    return strings
+
+
+def test_order_book_checksum():
+    random.seed(3)
+    book = OrderBook()
+    checksum = OrderBookChecksum(25)
+    formatted = [0]
+    number_to_string = exchange.number_to_string
+
+    def counting_number_to_string(value):
+        formatted[0] += 1
+        return number_to_string(value)
+
+    exchange.number_to_string = counting_number_to_string
+    try:
+        for _ in range(50):
+            for side in ['bids', 'asks']:
+                book[side].storeMany(random_deltas(20))
+            payload = []
+            for i in range(0, 25):
+                if i < len(book['bids']):
+                    payload.extend(level_strings(checksum, 'bids', book['bids'][i])[0:2])
+                if i < len(book['asks']):
+                    payload.extend(level_strings(checksum, 'asks', book['asks'][i])[0:2])
+            payload = ':'.join(payload)
+            assert payload == reference_payload(book, 25)
+            assert checksum.crc32(payload, True) == Exchange.crc32(payload, True)
+            assert checksum.crc32(payload, False) == Exchange.crc32(payload, False)
+        # the levels that did not change are not formatted again
+        formatted[0] = 0
+        for i in range(0, 25):
+            level_strings(checksum, 'bids', book['bids'][i])
+        assert formatted[0] == 0
+        book['bids'].store(book['bids'][0][0], book['bids'][0][1] + 1)
+        level_strings(checksum, 'bids', book['bids'][0])
+        assert formatted[0] == 2
+    finally:
+        exchange.number_to_string = number_to_string
+    # the levels that left the top are dropped
+    assert len(checksum.levels['bids']) < 4 * 25 and len(checksum.levels['asks']) < 4 * 25
+    # a snapshot drops the cached strings
+    book.checksum = checksum
+    book.reset({'bids': [[100.0, 1.0]], 'asks': [[101.0, 1.0]]})
+    assert checksum.levels == {'bids': {}, 'asks': {}} and checksum.payload is None
+    # the formatting rules
+    checksum.store('bids', 100.0, 1.0, '100.00', '1.0')
+    checksum.track('2:1')
+    assert checksum.cached('bids', 100.0, 1.0) is None
+    # verification cadence
+    every_third = OrderBookChecksum(25, 3)
+    assert [every_third.due() for _ in range(6)] == [False, False, True, False, False, True]
+    timed = OrderBookChecksum(25, 1, 60000)
+    assert [timed.due() for _ in range(3)] == [True, False, False]
+
+
+def checksum_of(checksum, book):
+    value = checksum.reuse(book['bids'], book['asks'], True)
+    if value is None:
+        value = checksum.crc32(reference_payload(book, 25), True)
+    return value
+
+
+def test_order_book_checksum_reuse():
+    random.seed(5)
+    book = OrderBook({}, 30)
+    checksum = OrderBookChecksum(25)
+    book.checksum = checksum
+    for _ in range(20):
+        for side in ['bids', 'asks']:
+            book[side].storeMany(random_deltas(20))
+        book.limit()
+        assert checksum_of(checksum, book) == Exchange.crc32(reference_payload(book, 25), True)
+    # the sides did not change, the last checksum is returned without a payload
+    value = checksum_of(checksum, book)
+    assert checksum.reuse(book['bids'], book['asks'], True) == value
+    assert checksum.reuse(book['bids'], book['asks'], False) == Exchange.crc32(reference_payload(book, 25), False)
+    # a stored level
+    book['asks'].store(book['asks'][0][0], book['asks'][0][1] + 1)
+    assert checksum.reuse(book['bids'], book['asks'], True) is None
+    assert checksum_of(checksum, book) == Exchange.crc32(reference_payload(book, 25), True)
+    # the levels dropped by limit()
+    for i in range(20):
+        book['bids'].store(200.0 + i, 1.0)
+    checksum_of(checksum, book)
+    book.limit()
+    assert checksum.reuse(book['bids'], book['asks'], True) is None
+    # not reused until crc32() is called again
+    assert checksum.reuse(book['bids'], book['asks'], True) is None
+    assert checksum_of(checksum, book) == Exchange.crc32(reference_payload(book, 25), True)
+    # a snapshot
+    assert checksum.reuse(book['bids'], book['asks'], True) is not None
+    book.reset({'bids': [[100.0, 1.0]], 'asks': [[101.0, 1.0]]})
+    assert checksum.reuse(book['bids'], book['asks'], True) is None
+    assert checksum_of(checksum, book) == Exchange.crc32('100:1:101:1', True)
@@ -0,0 +1,54 @@
+import os
+import sys
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+import ccxt.pro  # noqa: E402
+from ccxt.async_support.base.ws import order_book_side  # noqa: E402
+
+
+def random_deltas(count, levels, counted=False):
+    deltas = []
+    for _ in range(count):
+        price = random.randint(1, levels) / 10
+        size = random.choice([0, random.randint(1, 100)])
+        if counted:
+            deltas.append([price, size, random.randint(0, 3)])
+        else:
+            deltas.append([price, size])
+    return deltas
+
+
+def test_order_book_store_many():
+    random.seed(7)
+    side_classes = [
+        (order_book_side.Asks, False),
+        (order_book_side.Bids, False),
+        (order_book_side.CountedAsks, True),
+        (order_book_side.CountedBids, True),
+        (order_book_side.SortedAsks, False),
+        (order_book_side.SortedCountedBids, True),
+    ]
+    for side_class, counted in side_classes:
+        one_by_one = side_class()
+        batched = side_class()
+        # both large batches that get merged and small ones that get inserted one by one
+        for count in [500, 10, 300, 1, 50, 1000]:
+            deltas = random_deltas(count, 400, counted)
+            for delta in deltas:
+                one_by_one.storeArray(list(delta))
+            batched.storeMany([list(delta) for delta in deltas])
+            assert one_by_one == batched
+            assert one_by_one._index == batched._index
+        snapshot = random_deltas(200, 400, counted)
+        batched.clear()
+        batched._index.clear()
+        batched.store_many(snapshot)
+        assert batched == side_class(snapshot)
+    # the deltas of a binance message, parsed and applied in one batch
+    exchange = ccxt.pro.binance()
+    book = exchange.order_book({'asks': [[10.0, 1.0], [11.0, 2.0]], 'bids': [[9.0, 1.0]]})
+    exchange.handle_order_book_message(None, {'u': 5, 'E': 1700000000000, 'a': [['10.00', '0.00'], ['10.50', '3.00']], 'b': [['9.50', '1.50']]}, book)
+    assert book['asks'] == [[10.5, 3.0], [11.0, 2.0]] and book['bids'] == [[9.5, 1.5], [9.0, 1.0]] and book['nonce'] == 5
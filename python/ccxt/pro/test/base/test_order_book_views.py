@@ -0,0 +1,64 @@
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, SortedOrderBook  # noqa: E402
+
+
+def test_order_book_views():
+    snapshot = {
+        'bids': [[10, 1], [9, 2], [8, 3], [7, 4], [6, 5]],
+        'asks': [[11, 1], [12, 2], [13, 3], [14, 4], [15, 5]],
+        'timestamp': 1574827239000,
+        'nonce': 69,
+        'symbol': 'BTC/USDT',
+    }
+    for book_class in [OrderBook, SortedOrderBook]:
+        book = book_class(snapshot)
+        book.limit()
+        assert book.best_bid() == [10, 1]
+        assert book.best_ask() == [11, 1]
+        top = book.top(2)
+        assert top['bids'] == [[10, 1], [9, 2]]
+        assert top['asks'] == [[11, 1], [12, 2]]
+        assert top['nonce'] == 69
+        assert top['bids'][0] is book['bids'][0]  # levels are shared, not copied
+        assert book['bids'].cumulative_size(8) == 6
+        assert book['asks'].cumulative_size(12.5) == 3
+        assert book['asks'].price_for_size(4) == 13
+        assert book['asks'].price_for_size(100) is None
+        assert book['asks'].vwap(3) == (11 * 1 + 12 * 2) / 3
+        assert book['bids'].vwap(100) is None
+        assert book['bids'][1:3] == [[9, 2], [8, 3]]
+        assert book['bids'][-1] == [6, 5]
+        try:
+            book['bids'][-6]
+            assert False
+        except IndexError:
+            pass
+        # the full book is stored, only the top 3 levels are visible
+        full = book_class(snapshot, 3, False)
+        full.limit()
+        assert full['bids'] == [[10, 1], [9, 2], [8, 3]]
+        assert len(full['asks']) == 3
+        assert full['asks'][-1] == [13, 3]
+        assert full['asks'][-3] == [11, 1]
+        try:
+            full['asks'][-4]
+            assert False
+        except IndexError:
+            pass
+        full['bids'].store(10, 0)
+        full['bids'].store(9, 0)
+        full.limit()
+        assert full['bids'] == [[8, 3], [7, 4], [6, 5]]
+        assert full['bids'].top(10) == [[8, 3], [7, 4], [6, 5]]
+        assert full['asks'].top(5) == [[11, 1], [12, 2], [13, 3], [14, 4], [15, 5]]
+        # and the regular mode drops them
+        limited = book_class(snapshot, 3)
+        limited.limit()
+        limited['bids'].store(10, 0)
+        limited.limit()
+        assert limited['bids'] == [[9, 2], [8, 3]]
@@ -0,0 +1,74 @@
+import os
+import sys
+import random
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.ws.order_book import OrderBook, IndexedOrderBook, CountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book import SortedOrderBook, SortedIndexedOrderBook, SortedCountedOrderBook  # noqa: E402
+from ccxt.async_support.base.ws.order_book_side import SortedOrderBookSide  # noqa: E402
+
+
+def random_deltas(count, levels, extra=None):
+    deltas = []
+    for _ in range(count):
+        price = random.randint(1, levels) / 10
+        size = random.choice([0, 0, random.randint(1, 100)])
+        if extra is None:
+            deltas.append([price, size])
+        else:
+            deltas.append([price, size, extra()])
+    return deltas
+
+
+def assert_same_books(book, sorted_book):
+    assert book == sorted_book
+    assert len(book['bids']) == len(sorted_book['bids'])
+    assert book['asks'][0:3] == sorted_book['asks'][0:3]
+    if len(book['asks']):
+        assert book['asks'][-1] == sorted_book['asks'][-1]
+    # the underlying list storage is what gets serialized
+    for side in ['asks', 'bids']:
+        assert list(list.__iter__(sorted_book[side])) == list(book[side])
+
+
+def check_sorted_order_book_pair(book_class, sorted_class, extra=None, depth=None):
+    snapshot = {
+        'asks': random_deltas(200, 300, extra),
+        'bids': random_deltas(200, 300, extra),
+    }
+    book = book_class(snapshot, depth)
+    sorted_book = sorted_class(snapshot, depth)
+    book.limit()
+    sorted_book.limit()
+    assert_same_books(book, sorted_book)
+    for count in [100] * 20 + [1, 2, 3] * 10:
+        # the few changes between the calls to limit() are copied chunk by chunk
+        for delta in random_deltas(count, 300, extra):
+            book['asks'].storeArray(list(delta))
+            sorted_book['asks'].storeArray(list(delta))
+        for delta in random_deltas(count, 300, extra):
+            book['bids'].storeArray(list(delta))
+            sorted_book['bids'].storeArray(list(delta))
+        book.limit()
+        sorted_book.limit()
+        assert_same_books(book, sorted_book)
+    book.reset(snapshot)
+    sorted_book.reset(snapshot)
+    book.limit()
+    sorted_book.limit()
+    assert_same_books(book, sorted_book)
+
+
+def test_sorted_order_book():
+    random.seed(42)
+    load = SortedOrderBookSide._load
+    SortedOrderBookSide._load = 4  # force plenty of chunk splits
+    try:
+        for depth in [None, 10]:
+            check_sorted_order_book_pair(OrderBook, SortedOrderBook, None, depth)
+            check_sorted_order_book_pair(CountedOrderBook, SortedCountedOrderBook, lambda: random.randint(0, 3), depth)
+            check_sorted_order_book_pair(IndexedOrderBook, SortedIndexedOrderBook, lambda: str(random.randint(1000, 1100)), depth)
+    finally:
+        SortedOrderBookSide._load = load
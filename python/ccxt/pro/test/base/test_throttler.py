@@ -0,0 +1,103 @@
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root)
+
+from ccxt.async_support.base.throttler import Throttler, TokenBucketThrottler  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+
+async def throttled(throttler, costs):
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    granted = []
+
+    async def request(i, cost):
+        await throttler(cost)
+        granted.append((i, (loop.time() - start) * 1000))
+
+    await asyncio.gather(*[request(i, cost) for i, cost in enumerate(costs)])
+    return granted
+
+
+async def check_throttler():
+    # one token every 10 ms
+    config = {'refillRate': 0.1, 'capacity': 1.0, 'tokens': 0, 'maxCapacity': 20}
+    throttler = TokenBucketThrottler(config)
+    granted = await throttled(throttler, [None] * 10)
+    # first in first out, the first one right away, the rest spaced by the refill rate
+    assert [i for i, _ in granted] == list(range(0, 10))
+    assert granted[0][1] < 5
+    assert granted[-1][1] >= 85
+    stats = throttler.stats()
+    assert stats['granted'] == 10
+    assert stats['queued'] == 0
+    assert stats['maxQueued'] == 9
+    assert stats['maxWait'] >= 85
+    # a single wakeup per granted request, no polling in between
+    assert stats['wakeups'] <= 2 * 9
+    # weighted costs wait for all of their tokens at once
+    throttler = TokenBucketThrottler(config)
+    granted = await throttled(throttler, [5, 1])
+    assert granted[1][1] >= 45
+    assert throttler.stats()['wakeups'] <= 2
+    # cancelled requests do not consume tokens
+    throttler = TokenBucketThrottler(config)
+    await throttler(1)
+    cancelled = throttler(1)
+    waiting = throttler(1)
+    cancelled.cancel()
+    await waiting
+    assert throttler.stats()['cancelled'] == 1
+    assert throttler.stats()['tokens'] < 0 and throttler.stats()['tokens'] > -1
+    # the queue is bounded the same way as the looper, the first request does not wait
+    throttler = TokenBucketThrottler(dict(config, maxCapacity=2))
+    for _ in range(0, 4):
+        throttler(1)
+    try:
+        throttler(1)
+        assert False
+    except RuntimeError:
+        pass
+
+
+async def check_scheduler_option():
+    exchange = ccxt.async_support.Exchange()
+    assert type(exchange.throttle) is Throttler
+    exchange = ccxt.async_support.Exchange({'tokenBucket': {'scheduler': 'timer'}})
+    assert type(exchange.throttle) is TokenBucketThrottler
+    assert exchange.throttle.config['refillRate'] == exchange.tokenBucket['refillRate']
+
+
+async def check_rate_limit_buckets():
+    exchange = ccxt.async_support.Exchange({
+        'rateLimitBuckets': {
+            'weight': {'limit': 20, 'interval': 100, 'capacity': 2},
+            'orders': {'limit': 10, 'interval': 100, 'capacity': 1, 'paths': ['order']},
+        },
+    })
+    throttler = exchange.throttle
+    assert type(throttler) is TokenBucketThrottler
+    assert throttler.limiter is exchange.rateLimiter
+    order = exchange.rate_limit_debits('private', 'order', 'POST', 1)
+    ticker = exchange.rate_limit_debits('public', 'ticker', 'GET', 1)
+    # orders are limited to one per 10 ms by their own bucket, the rest only by the weight
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await asyncio.gather(*[throttler(1, order) for _ in range(0, 5)])
+    assert loop.time() - start >= 0.035
+    start = loop.time()
+    await asyncio.gather(*[throttler(1, ticker) for _ in range(0, 5)])
+    elapsed = loop.time() - start
+    assert elapsed >= 0.01 and elapsed < 0.5
+    assert throttler.stats()['buckets']['orders']['capacity'] == 1
+    # and the websocket clients keep the default bucket
+    assert type(exchange.create_throttler()) is Throttler
+
+
+def test_throttler():
+    asyncio.run(check_throttler())
+    asyncio.run(check_scheduler_option())
+    asyncio.run(check_rate_limit_buckets())
@@ -8,6 +8,11 @@ from asyncio import run
 
 from ccxt.pro.test.base.test_order_book import test_ws_order_book  # noqa: F401
 from ccxt.pro.test.base.test_cache import test_ws_cache  # noqa: F401
+from ccxt.pro.test.base.test_sorted_order_book import test_sorted_order_book  # noqa: F401
+from ccxt.pro.test.base.test_order_book_store_many import test_order_book_store_many  # noqa: F401
+from ccxt.pro.test.base.test_order_book_views import test_order_book_views  # noqa: F401
+from ccxt.pro.test.base.test_order_book_checksum import test_order_book_checksum  # noqa: F401
+from ccxt.pro.test.base.test_throttler import test_throttler  # noqa: F401
 # todo : from ccxt.pro.test.base.test_close import test_ws_close  # noqa: F401
 from ccxt.pro.test.base.test_future import test_ws_future  # noqa: F401
 from ccxt.pro.test.base.test_abnormal_close import test_abnormal_close  # noqa: F401
@@ -15,6 +20,11 @@ from ccxt.pro.test.base.test_abnormal_close import test_abnormal_close  # noqa:
 def test_base_init_ws():
     test_ws_order_book()
     test_ws_cache()
+    test_sorted_order_book()
+    test_order_book_store_many()
+    test_order_book_views()
+    test_order_book_checksum()
+    test_throttler()
     # todo : run(test_ws_close())
     run(test_ws_future())
     # run(test_abnormal_close()) stays in infinite loop in travis
@@ -1,3 +1,78 @@
-from .keccak import SHA3
+import hashlib
 
-__all__ = ['SHA3']
+from .keccak import SHA3 as python_keccak
+
+try:
+    from Crypto.Hash import keccak as pycryptodome_keccak
+except ImportError:
+    try:
+        from Cryptodome.Hash import keccak as pycryptodome_keccak
+    except ImportError:
+        pycryptodome_keccak = None
+
+try:
+    import sha3 as pysha3  # pysha3 or safe-pysha3
+    if not hasattr(pysha3, 'keccak_256'):
+        pysha3 = None
+except ImportError:
+    pysha3 = None
+
+# keccak-256 (the ethereum one, not the NIST sha3_256 of hashlib) from a native implementation
+# when one is installed, the pure python sponge of keccak.py otherwise, in this order:
+#
+#     hashlib        when it is built with openssl 3.2 or newer
+#     pysha3         pip install safe-pysha3
+#     pycryptodome   pip install pycryptodome
+#     python
+#
+# all of them return the same bytearray, use() selects one explicitly, e.g. use('python')
+
+
+def hashlib_keccak(_input):
+    return bytearray(hashlib.new('keccak-256', _input).digest())
+
+
+def pysha3_keccak(_input):
+    return bytearray(pysha3.keccak_256(_input).digest())
+
+
+def cryptodome_keccak(_input):
+    return bytearray(pycryptodome_keccak.new(data=_input, digest_bits=256).digest())
+
+
+def available():
+    result = {}
+    try:
+        hashlib.new('keccak-256')
+        result['hashlib'] = hashlib_keccak
+    except ValueError:
+        pass
+    if pysha3 is not None:
+        result['pysha3'] = pysha3_keccak
+    if pycryptodome_keccak is not None:
+        result['pycryptodome'] = cryptodome_keccak
+    result['python'] = python_keccak
+    return result
+
+
+backends = available()
+backend = next(iter(backends))
+implementation = backends[backend]
+
+
+def use(name):
+    global backend, implementation
+    if name not in backends:
+        raise ValueError('keccak backend ' + name + ' is not available, the available ones are ' + ', '.join(backends))
+    backend = name
+    implementation = backends[name]
+
+
+def SHA3(_input):
+    if not isinstance(_input, (bytes, bytearray, memoryview)):
+        # a list of byte values
+        _input = bytes(_input)
+    return implementation(_input)
+
+
+__all__ = ['SHA3', 'use', 'backends']
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# memory held by the loaded markets as dicts and as compact records (compactMarkets),
+# the recorded markets of the static tests are multiplied up to the usual number of markets
+#
+#     python python/ccxt/test/base/benchmark_markets_memory.py
+
+EXCHANGES = {
+    'binance': 3000,
+    'okx': 1000,
+    'deribit': 1500,
+}
+
+
+def fixture(id, count):
+    with open(os.path.join(root, 'ts', 'src', 'test', 'static', 'markets', id + '.json')) as file:
+        static = list(json.load(file).values())
+    markets = []
+    i = 0
+    while len(markets) < count:
+        for market in static[0:count - len(markets)]:
+            market = copy.deepcopy(market)
+            market['id'] = market['id'] + str(i)
+            market['symbol'] = market['symbol'] + str(i)
+            markets.append(market)
+        i += 1
+    return markets
+
+
+def measure(id, markets, compact):
+    exchange = getattr(ccxt, id)({'compactMarkets': compact})
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    exchange.set_markets(markets)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before
+
+
+def main():
+    print('%-10s %8s %14s %14s %8s' % ('exchange', 'markets', 'dicts KB', 'compact KB', 'ratio'))
+    for id, count in EXCHANGES.items():
+        markets = fixture(id, count)
+        dicts = measure(id, markets, False)
+        compact = measure(id, markets, True)
+        print('%-10s %8d %14.0f %14.0f %8.2f' % (id, len(markets), dicts / 1024, compact / 1024, compact / dicts))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+# the exchanges of the tests of the markets cache and the market registry, fetched counts
+# the markets fetched by an instance and total the ones fetched by all of them
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'linear': None, 'inverse': None, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {'altname': 'XBTUSDT'}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'linear': None, 'inverse': None, 'precision': {'amount': 0.001, 'price': 0.01}, 'info': {'altname': 'ETHUSDT'}},
+    {'id': 'BTCUSDT_PERP', 'symbol': 'BTC/USDT:USDT', 'base': 'BTC', 'quote': 'USDT', 'settle': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'settleId': 'USDT', 'type': 'swap', 'spot': False, 'swap': True, 'contract': True, 'linear': True, 'inverse': False, 'contractSize': 1, 'precision': {'amount': 0.001, 'price': 0.1}, 'info': {'altname': 'XBTUSDT_PERP'}},
+]
+
+DESCRIPTION = {
+    'id': 'marketstest',
+    'has': {
+        'fetchCurrencies': True,
+    },
+    'options': {
+        'networks': {
+            'ETH': 'erc20',
+        },
+        'fetchMarkets': ['spot', 'swap'],
+    },
+}
+
+
+def fetched_markets(exchange):
+    # like binance, okx and bybit, options['fetchMarkets'] selects the types of markets fetched
+    types = exchange.safe_list(exchange.options, 'fetchMarkets', [])
+    return [market for market in MARKETS if market['type'] in types]
+
+
+class SyncExchange(ccxt.Exchange):
+    fetched = 0
+    total = 0
+
+    def describe(self):
+        return self.deep_extend(super().describe(), DESCRIPTION)
+
+    def fetch_currencies(self, params={}):
+        # changed in place
+        self.options['networks']['BTC'] = 'bitcoin'
+        return None
+
+    def fetch_markets(self, params={}):
+        self.fetched += 1
+        SyncExchange.total += 1
+        # like kraken, an index used later on is built while fetching
+        markets = fetched_markets(self)
+        self.options['marketsByAltname'] = dict((market['info']['altname'], market) for market in markets)
+        return markets
+
+
+class AsyncExchange(ccxt.async_support.Exchange):
+    fetched = 0
+    total = 0
+
+    def describe(self):
+        return self.deep_extend(super().describe(), DESCRIPTION)
+
+    async def fetch_currencies(self, params={}):
+        self.options['networks']['BTC'] = 'bitcoin'
+        return None
+
+    async def fetch_markets(self, params={}):
+        await asyncio.sleep(0.05)
+        self.fetched += 1
+        AsyncExchange.total += 1
+        markets = fetched_markets(self)
+        self.options['marketsByAltname'] = dict((market['info']['altname'], market) for market in markets)
+        return markets
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.async_support.base.backfill import Backfill, BackfillCheckpoint  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MINUTE = 60000
+START = 1700000000000
+CANDLES = [[START + i * MINUTE, 1.0, 2.0, 0.5, 1.5, float(i)] for i in range(0, 95)]
+TRADES = [{'id': str(i), 'timestamp': START + (i // 3) * 1000, 'price': 1.0, 'amount': 1.0, 'side': 'buy'} for i in range(0, 60)]
+
+
+class BackfillExchange(ccxt.async_support.Exchange):
+    def describe(self):
+        return self.deep_extend(super().describe(), {
+            'id': 'backfilltest',
+            'rateLimit': 100,
+            'options': {
+                'fetchOHLCV': {'maxEntriesPerRequest': 10},
+                'fetchTrades': {'maxEntriesPerRequest': 4},
+            },
+        })
+
+    def __init__(self, config={}):
+        super().__init__(config)
+        self.calls = []
+        self.failures = []  # the errors raised by the next calls
+        self.active = 0
+        self.most = 0
+
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.calls.append(since)
+        self.active += 1
+        self.most = max(self.most, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures:
+                raise self.failures.pop(0)
+            return [candle for candle in CANDLES if candle[0] >= since][0:limit]
+        finally:
+            self.active -= 1
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        self.calls.append(since)
+        return [trade for trade in TRADES if trade['timestamp'] >= since][0:limit]
+
+
+async def collect(generator):
+    result = []
+    async for chunk in generator:
+        result.append(chunk)
+    return result
+
+
+def test_backfill():
+
+    async def test():
+        exchange = BackfillExchange({'enableRateLimit': False})
+        try:
+            # candles, windows of maxEntriesPerRequest candles fetched concurrently and streamed in order
+            chunks = await collect(exchange.backfill('fetchOHLCV', 'BTC/USDT', START, START + 100 * MINUTE, '1m'))
+            assert [len(chunk) for chunk in chunks] == [10] * 9 + [5]
+            assert [candle for chunk in chunks for candle in chunk] == CANDLES
+            assert exchange.most > 1
+            # trades, a window paginated forward, the trades repeated across the pages dropped
+            chunks = await collect(exchange.backfill('fetchTrades', 'BTC/USDT', START, START + 20000, None, window=10000))
+            assert [trade['id'] for chunk in chunks for trade in chunk] == [trade['id'] for trade in TRADES]
+            # the network errors are retried
+            backfill = Backfill(exchange, 'fetchOHLCV', 'BTC/USDT', START, START + 20 * MINUTE, '1m', concurrency=1)
+            backfill.retryDelay = 1
+            exchange.failures = [ccxt.NetworkError('timeout')]
+            chunks = await collect(backfill.chunks())
+            assert [candle for chunk in chunks for candle in chunk] == CANDLES[0:20]
+            # other errors stop the backfill, it resumes from the checkpoint
+            checkpoint = BackfillCheckpoint(tempfile.mkdtemp())
+            backfill = Backfill(exchange, 'fetchOHLCV', 'BTC/USDT', START, START + 100 * MINUTE, '1m', checkpoint=checkpoint, concurrency=1)
+            received = []
+            try:
+                async for chunk in backfill.chunks():
+                    received.extend(chunk)
+                    if len(received) == 30:
+                        exchange.failures = [ccxt.BadRequest('invalid')]
+                assert False
+            except ccxt.BadRequest:
+                pass
+            assert len(received) == 30
+            exchange.calls = []
+            resumed = Backfill(exchange, 'fetchOHLCV', 'BTC/USDT', START, START + 100 * MINUTE, '1m', checkpoint=checkpoint, concurrency=1)
+            assert resumed.since == START + 30 * MINUTE
+            received.extend([candle for chunk in await collect(resumed.chunks()) for candle in chunk])
+            assert received == CANDLES
+            assert exchange.calls[0] == START + 30 * MINUTE
+            # since is required
+            try:
+                exchange.backfill('fetchOHLCV', 'BTC/USDT', None)
+                assert False
+            except ccxt.ArgumentsRequired:
+                pass
+        finally:
+            await exchange.close()
+
+    asyncio.run(test())
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.connection_pool import ConnectionPool  # noqa: E402
+from ccxt.async_support.base.connection_pool import ConnectionPool as AsyncConnectionPool  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"ok":true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'session=' + self.path[1:])
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+async def fetch_with_async_pool(url):
+    pool = AsyncConnectionPool({'limitPerHost': 1})
+    exchanges = [ccxt.async_support.Exchange({'id': 'pooled', 'connectionPool': pool}) for _ in range(0, 2)]
+    for i in range(0, 2):
+        for exchange in exchanges:
+            assert await exchange.fetch(url + str(i)) == {'ok': True}
+    assert exchanges[0].session is exchanges[1].session
+    for exchange in exchanges:
+        await exchange.close()
+    stats = pool.stats()
+    assert stats['sessions'] == 1
+    assert stats['requests'] == 4
+    assert stats['connectionsCreated'] == 1
+    assert stats['connectionsReused'] == 3
+    # closing an exchange leaves the shared session open
+    session = pool.session(asyncio.get_running_loop(), exchanges[0].ssl_context, False)
+    assert not session.closed
+    await pool.close()
+    assert session.closed
+
+
+def test_connection_pool():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = 'http://127.0.0.1:' + str(server.server_address[1]) + '/'
+    try:
+        # two instances share one keep-alive connection
+        pool = ConnectionPool()
+        first = ccxt.Exchange({'id': 'pooled', 'connectionPool': pool})
+        second = ccxt.Exchange({'id': 'pooled', 'connectionPool': pool})
+        assert first.session is second.session
+        for i in range(0, 2):
+            assert first.fetch(url + str(i)) == {'ok': True}
+            assert second.fetch(url + str(i)) == {'ok': True}
+        # the jar only holds the cookie of the last response, it is cleared before every request
+        assert len(first.session.cookies) == 1
+        stats = pool.stats()
+        assert stats['hosts'] == 1
+        assert stats['requests'] == 4
+        assert stats['connectionsCreated'] == 1
+        assert stats['connectionsReused'] == 3
+        # an instance going away does not close the shared session
+        del first
+        assert second.fetch(url) == {'ok': True}
+        assert pool.stats()['connectionsCreated'] == 1
+        pool.close()
+        asyncio.run(fetch_with_async_pool(url))
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import ecdsa_signer  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# [request, secret, algorithm, fixed_length, r, s, v] signed with SigningKey.sign_digest_deterministic()
+VECTORS = [
+    ['ab' * 32, '11' * 32, 'secp256k1', False, '5b8478db7aca5ce61cb05a96ae1a82f63d3cf68e74012dfe74f8379aee6f2e1e', '0fa6b21ba8c6d03e4877ccb11f3abfdbbe033d9594eb8c2b4055807ee1964b1d', 0],
+    ['cd' * 32, '22' * 32, 'secp256k1', False, 'f5b77712cc4b5bad84091622122efa2d14cabe674d06cc3f401d4d7b970ace79', '63089287f75ed2695a444b7ac02f8a5254fd22a64fd318e57d12d7b2f0fbcaa2', 0],
+    ['ab' * 32, '33' * 32, 'secp256k1', False, 'fe0aa37801fb1f413e5a0f87f4e2e4beda6af6b2399c77b97b984ab7d18039fd', '6dc63dc3109d4eaa88ce356116ee4c0d82d70556e1c3703a0d7139f7d071f5ee', 1],
+    ['ab' * 32, '33' * 32, 'secp256k1', True, '01cd73230c586133e84a89ca4e17fb871ddaf5b2d636858e9a900912c67d50b7', '6de221cf1caf56d93f60b1a26c96a1f52b53479f31eec892077757ef41cef79c', 1],
+    ['ab' * 32, '66' * 32, 'secp256k1', True, '76ba60f618863e353abcd6f0f191ea40df6c2fb6a2b64811903baf9e456cf426', '3be873213cfc7edfbe7149eb7f240c8913ae1c666190d12b6ef08f700bcc930c', 0],
+    ['ab' * 32, '11' * 32, 'p256', False, '43d0427db535d71b907c4f717ee15919d0d759c1f9447f02d215fb988f986f03', '28744787b0728b3cd3ae673f21afcae86d19c7544122ec0d126700ca70691a39', 0],
+    ['ab' * 48, '11' * 48, 'p384', False, 'd4ec6cbeb80c9eec83076c7be1c2e9ff37c14bf8096de4b792bf259c881d4fb875b636762532924ef340f983a8cb9b1a', '5b71c8000825cb8861c7808109a9ce7386bb420d47981afed8a91cc68025b8756a1be05bd725b523df9eb243173b8932', 1],
+]
+
+
+def test_ecdsa_signer():
+    for request, secret, algorithm, fixed_length, r, s, v in VECTORS:
+        expected = {'r': r, 's': s, 'v': v}
+        assert ccxt.Exchange.ecdsa(request, secret, algorithm, None, fixed_length) == expected
+        # the same signature without libsecp256k1
+        signer = ecdsa_signer.EcdsaSigner(secret, algorithm)
+        signer.native = None
+        r_binary, s_binary, v_value = signer.sign(bytes.fromhex(request), fixed_length)
+        assert [r_binary.hex(), s_binary.hex(), v_value] == [r, s, v]
+    # the point additions of the table are the scalar multiplication of the generator
+    curve = ecdsa_signer.EcdsaSigner.algorithms['secp256k1'][0]
+    for k in [1, 2, 15, 16, 17, 255, 256, 0x1234567890abcdef, curve.order - 1]:
+        point = k * curve.generator
+        assert ecdsa_signer.multiply(curve, k) == (point.x(), point.y())
+    # the key is parsed once per secret
+    assert ecdsa_signer.ecdsa_signer('11' * 32, 'secp256k1') is ecdsa_signer.ecdsa_signer('11' * 32, 'secp256k1')
+    assert ecdsa_signer.ecdsa_signer('11' * 32, 'secp256k1') is not ecdsa_signer.ecdsa_signer('11' * 32, 'p256')
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.pro  # noqa: E402
+
+
+def test_exchange_construction():
+    # describe() is evaluated once per class, the instances get their own copies
+    first = ccxt.binance()
+    second = ccxt.binance({'options': {'defaultType': 'future'}})
+    assert first.options['defaultType'] == 'spot'
+    assert second.options['defaultType'] == 'future'
+    first.options['fetchMarkets'].append('test')
+    assert 'test' not in second.options['fetchMarkets']
+    assert 'test' not in ccxt.binance().options['fetchMarkets']
+    first.has['fetchTicker'] = False
+    assert ccxt.binance().has['fetchTicker'] is True
+    # the api definitions are only read, they are shared unless overridden
+    assert first.api is second.api
+    assert ccxt.binance({'api': {'public': {}}}).api is not first.api
+    # the methods referenced by describe() are bound to the new instance
+    exchange = ccxt.pro.okx()
+    other = ccxt.pro.okx()
+    assert exchange.streaming['ping'].__self__ is exchange
+    assert other.streaming['ping'].__self__ is other
+    # camelcase aliases of methods and attributes
+    assert first.fetchTicker == first.fetch_ticker
+    assert first.loadMarkets == first.load_markets
+    assert ccxt.Exchange.camelcase_alias('fetch_order_book') == 'fetchOrderBook'
+    assert ccxt.Exchange.camelcase_alias('fetch') is None
+    config = ccxt.kraken({'enableRateLimit': False, 'apiKey': 'key'})
+    assert config.enableRateLimit is False and config.apiKey == 'key'
+    assert ccxt.kraken().enableRateLimit is True
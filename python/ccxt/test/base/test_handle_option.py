@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import pickle
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+
+def test_handle_option():
+    exchange = ccxt.Exchange({
+        'id': 'sampleexchange',
+        'options': {
+            'defaultType': 'spot',
+            'fetchTickers': {'type': 'swap'},
+            'watchOrderBook': {'checksum': True},
+        },
+    })
+    # from the method options, the exchange-wide options or the default value
+    assert exchange.handle_option_and_params({}, 'fetchTickers', 'type') == ['swap', {}]
+    assert exchange.handle_option_and_params({}, 'fetchTicker', 'type') == ['spot', {}]
+    assert exchange.handle_option_and_params({}, 'fetchTicker', 'marginMode', 'cross') == ['cross', {}]
+    # params take precedence and are omitted
+    assert exchange.handle_option_and_params({'type': 'future', 'limit': 5}, 'fetchTickers', 'type') == ['future', {'limit': 5}]
+    assert exchange.handle_option_and_params({'defaultType': 'future'}, 'fetchTickers', 'type') == ['future', {}]
+    # routed methods
+    assert exchange.handle_option_and_params({'callerMethodName': 'fetchTickers'}, 'fetchTicker', 'type') == ['swap', {}]
+    # the returned params are never the dict passed in
+    params = {}
+    assert exchange.handle_option_and_params(params, 'fetchTicker', 'type')[1] is not params
+    # the options are read for every call, a change to them or the dicts inside them applies at once
+    assert exchange.handle_option('watchOrderBook', 'checksum') is True
+    exchange.options['watchOrderBook']['checksum'] = False
+    assert exchange.handle_option('watchOrderBook', 'checksum') is False
+    exchange.options['watchOrderBook'] = {'checksum': 'new'}
+    assert exchange.handle_option('watchOrderBook', 'checksum') == 'new'
+    exchange.options['watchOrderBook'].update({'checksum': 'updated'})
+    assert exchange.handle_option('watchOrderBook', 'checksum') == 'updated'
+    del exchange.options['watchOrderBook']
+    assert exchange.handle_option('watchOrderBook', 'checksum', 'default') == 'default'
+    exchange.options.setdefault('defaultChecksum', 'global')
+    assert exchange.handle_option('watchOrderBook', 'checksum') == 'global'
+    exchange.options['fetchTickers'].pop('type')
+    assert exchange.handle_option('fetchTickers', 'type') == 'spot'
+    # or replaced
+    exchange.extend_exchange_options({'defaultType': 'margin'})
+    assert exchange.handle_option('fetchTickers', 'type') == 'margin'
+    exchange.options = {'fetchTickers': {'type': 'option'}}
+    assert exchange.handle_option('fetchTickers', 'type') == 'option'
+    # the options are a plain dict
+    options = {'watchOrderBook': {'checksum': True}}
+    exchange.options = options
+    exchange.options['fetchTickers'] = options['watchOrderBook']
+    assert exchange.options['fetchTickers'] is options['watchOrderBook']
+    assert pickle.loads(pickle.dumps(exchange.options)) == exchange.options
+    copied = copy.copy(exchange.options)
+    copied['watchOrderBook'] = {'checksum': False}
+    assert exchange.handle_option('watchOrderBook', 'checksum') is True
+    # empty strings are missing values, like in safe_value()
+    exchange.options = {'defaultType': 'spot', 'fetchTickers': {'type': ''}, 'fetchTicker': {'defaultType': ''}, 'marginMode': ''}
+    assert exchange.handle_option('fetchTickers', 'type') == 'spot'
+    assert exchange.handle_option('fetchTicker', 'type') == 'spot'
+    assert exchange.handle_option('fetchTicker', 'marginMode', 'cross') == 'cross'
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_json_decoding():
+    exchange = ccxt.Exchange()
+    body = '{"price":0.10,"amount":"1.5","id":12345678901234567890123,"tiny":1e-8,"list":[1,2.50],"ok":true,"none":null}'
+    # numbers are kept exactly as received
+    quoted = exchange.on_json_response(body)
+    assert quoted == {'price': '0.10', 'amount': '1.5', 'id': '12345678901234567890123', 'tiny': '1e-8', 'list': ['1', '2.50'], 'ok': True, 'none': None}
+    assert ccxt.Exchange.json_loads_quoted(body.encode()) == quoted
+    # numbers as numbers, from str or bytes, including what the native decoders reject
+    exchange.quoteJsonNumbers = False
+    decoded = exchange.on_json_response(body)
+    assert decoded['price'] == 0.1
+    # every digit of the integers beyond 64 bits, that orjson returns as floats
+    assert decoded['id'] == 12345678901234567890123 and type(decoded['id']) is int
+    for wide in ['18446744073709551615', '18446744073709551616', '-9223372036854775809', '123456789012345678901234567890']:
+        assert ccxt.Exchange.json_loads('[' + wide + ',1.5]') == [int(wide), 1.5]
+        assert ccxt.Exchange.json_loads(('{"a":' + wide + '}').encode()) == {'a': int(wide)}
+    assert decoded['list'] == [1, 2.5]
+    assert ccxt.Exchange.json_loads(body.encode()) == decoded
+    assert str(ccxt.Exchange.json_loads('[NaN]')[0]) == 'nan'
+    # a custom decoder replaces both
+    exchange.json_decoder = lambda data: {'decoded': data}
+    assert exchange.on_json_response('{}') == {'decoded': '{}'}
+    assert exchange.parse_json('not json') is None
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import os
+import random
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.static_dependencies import keccak  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+VECTORS = [
+    [b'', 'c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470'],
+    [b'abc', '4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45'],
+    [b'The quick brown fox jumps over the lazy dog', '4d741b6f1eb29cb2a9b9911c82f56fa8d73b04959d3d9d222895df6c0b28aa15'],
+    [b'a' * 135, '34367dc248bbd832f4e3e69dfaac2f92638bd0bbd18f2912ba4ef454919cf446'],  # the padding fills the last byte of the block
+    [b'a' * 136, 'a6c4d403279fe3e0af03729caada8374b5ca54d8065329a3ebcaeb4b60aa386e'],  # a full block
+]
+
+
+def test_keccak():
+    generator = random.Random(1)
+    messages = [bytes(generator.getrandbits(8) for i in range(0, length)) for length in [1, 31, 32, 64, 134, 137, 271, 272, 273, 500]]
+    expected = [keccak.backends['python'](message) for message in messages]
+    for name in keccak.backends:
+        backend = keccak.backends[name]
+        for message, digest in VECTORS:
+            result = backend(message)
+            assert isinstance(result, bytearray)
+            assert result.hex() == digest, name
+        for i in range(0, len(messages)):
+            assert backend(messages[i]) == expected[i], name
+    # the backend of SHA3 and Exchange.hash
+    default = keccak.backend
+    try:
+        for name in keccak.backends:
+            keccak.use(name)
+            assert keccak.SHA3(b'abc').hex() == VECTORS[1][1]
+            assert keccak.SHA3(list(b'abc')).hex() == VECTORS[1][1]
+            assert ccxt.Exchange.hash(b'abc', 'keccak', 'hex') == VECTORS[1][1]
+        try:
+            keccak.use('unknown')
+            assert False
+        except ValueError:
+            pass
+    finally:
+        keccak.use(default)
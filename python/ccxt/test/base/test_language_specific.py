@@ -14,6 +14,45 @@ sys.path.append(root)
 
 
 from ccxt.test.base.test_deep_extend import test_deep_extend # noqa E402
+from ccxt.test.base.test_json_decoding import test_json_decoding # noqa E402
+from ccxt.test.base.test_connection_pool import test_connection_pool # noqa E402
+from ccxt.test.base.test_lazy_exchanges import test_lazy_exchanges # noqa E402
+from ccxt.test.base.test_exchange_construction import test_exchange_construction # noqa E402
+from ccxt.test.base.test_markets_cache import test_markets_cache # noqa E402
+from ccxt.test.base.test_market_registry import test_market_registry # noqa E402
+from ccxt.test.base.test_set_markets import test_set_markets # noqa E402
+from ccxt.test.base.test_handle_option import test_handle_option # noqa E402
+from ccxt.test.base.test_market_record import test_market_record # noqa E402
+from ccxt.test.base.test_precise import test_precise # noqa E402
+from ccxt.test.base.test_precision_formatter import test_precision_formatter # noqa E402
+from ccxt.test.base.test_ohlcv_array import test_ohlcv_array # noqa E402
+from ccxt.test.base.test_backfill import test_backfill # noqa E402
+from ccxt.test.base.test_keccak import test_keccak # noqa E402
+from ccxt.test.base.test_ecdsa_signer import test_ecdsa_signer # noqa E402
+from ccxt.test.base.test_signers import test_signers # noqa E402
+from ccxt.test.base.test_order_template import test_order_template # noqa E402
+from ccxt.test.base.test_profiler import test_profiler # noqa E402
+from ccxt.test.base.test_rate_limiter import test_rate_limiter, test_rate_limit_backends # noqa E402
 
 def test_language_specific():
     test_deep_extend()
+    test_json_decoding()
+    test_rate_limiter()
+    test_rate_limit_backends()
+    test_connection_pool()
+    test_lazy_exchanges()
+    test_exchange_construction()
+    test_markets_cache()
+    test_market_registry()
+    test_set_markets()
+    test_handle_option()
+    test_market_record()
+    test_precise()
+    test_precision_formatter()
+    test_ohlcv_array()
+    test_backfill()
+    test_keccak()
+    test_ecdsa_signer()
+    test_signers()
+    test_order_template()
+    test_profiler()
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import os
+import subprocess
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+SCRIPT = """
+import sys
+sys.path.insert(0, %r)
+import ccxt
+import ccxt.async_support
+import ccxt.pro
+# nothing is imported upfront
+assert not [name for name in sys.modules if name.split('.')[-1] in ccxt.exchanges], 'exchanges imported on import'
+# the classes on first access
+from ccxt import binance
+assert binance is ccxt.binance and isinstance(binance, type)
+# a submodule import does not replace the class on the package
+import ccxt.binanceusdm
+import ccxt.async_support.binanceusdm
+assert isinstance(ccxt.binanceusdm, type) and isinstance(ccxt.async_support.binance, type)
+assert ccxt.pro.binance.__module__ == 'ccxt.pro.binance'
+assert 'okx' in dir(ccxt.pro) and 'okx' in ccxt.pro.__all__
+try:
+    ccxt.unknown
+    raise RuntimeError('no AttributeError')
+except AttributeError:
+    pass
+"""
+
+
+def test_lazy_exchanges():
+    subprocess.check_call([sys.executable, '-c', SCRIPT % root])
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import os
+import pickle
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from collections.abc import Mapping  # noqa: E402
+from ccxt.base.market_record import MarketRecord, json_default  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'linear': None, 'inverse': None, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {'status': 'TRADING'}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'linear': None, 'inverse': None, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {'status': 'TRADING'}, 'baseNumericId': 2},
+]
+
+
+def test_market_record():
+    exchange = ccxt.Exchange({'id': 'compact', 'compactMarkets': True, 'precisionMode': ccxt.TICK_SIZE})
+    expected = ccxt.Exchange({'id': 'dicts', 'precisionMode': ccxt.TICK_SIZE})
+    exchange.set_markets(copy.deepcopy(MARKETS))
+    expected.set_markets(copy.deepcopy(MARKETS))
+    market = exchange.markets['BTC/USDT']
+    assert isinstance(market, MarketRecord)
+    # the same content, read like a dict
+    assert market == expected.markets['BTC/USDT'] and expected.markets['BTC/USDT'] == market
+    assert list(market.keys()) == list(expected.markets['BTC/USDT'].keys())
+    assert market['symbol'] == 'BTC/USDT' and market.get('settle') is None and market.get('unknown', 1) == 1
+    assert 'base' in market and 'unknown' not in market
+    assert exchange.safe_string(market, 'id') == 'BTCUSDT'
+    assert exchange.safe_value(market, 'unknown') is None
+    assert exchange.safe_dict(market, 'precision') == {'amount': 0.0001, 'price': 0.01, 'cost': None, 'base': None, 'quote': None}
+    assert exchange.extend(market, {'active': False})['active'] is False
+    assert exchange.markets['ETH/USDT']['baseNumericId'] == 2
+    assert exchange.currencies == expected.currencies and exchange.symbols == expected.symbols
+    # changing a key is possible, adding one is not
+    market['active'] = True
+    assert market['active'] is True
+    try:
+        market['unknown'] = 1
+        assert False
+    except TypeError:
+        pass
+    # the nested dicts of the same content are shared, the info is the one received
+    assert market['precision'] is exchange.markets['ETH/USDT']['precision']
+    assert market['limits'] is exchange.markets['ETH/USDT']['limits']
+    assert market['info'] is exchange.markets_by_id['BTCUSDT'][0]['info']
+    # the records of markets with the same keys share a class without a __dict__
+    assert type(market) is not type(exchange.markets['ETH/USDT'])
+    assert not hasattr(market, '__dict__')
+    assert pickle.loads(pickle.dumps(market)) == market
+    # serialized like the dicts
+    expected.markets['BTC/USDT']['active'] = True
+    assert isinstance(market, Mapping) and dict(market) == market.to_dict()
+    assert json.loads(json.dumps(exchange.markets, default=json_default)) == json.loads(json.dumps(expected.markets))
+    assert exchange.json(market) == expected.json(expected.markets['BTC/USDT'])
+    # the precision methods
+    assert exchange.price_to_precision('BTC/USDT', 123.456) == expected.price_to_precision('BTC/USDT', 123.456) == '123.46'
+    assert exchange.amount_to_precision('ETH/USDT', 1.23456789) == '1.2345'
+    # switching the mode builds the structures again
+    exchange.compactMarkets = False
+    exchange.set_markets(copy.deepcopy(MARKETS))
+    assert type(exchange.markets['BTC/USDT']) is dict
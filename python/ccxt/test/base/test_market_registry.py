@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import copy
+import json
+import os
+import pickle
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.market_registry import MarketRegistry  # noqa: E402
+from ccxt.test.base.markets_fixture import SyncExchange, AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_market_registry():
+    fetched = SyncExchange.total
+    registry = MarketRegistry()
+    first = SyncExchange({'marketRegistry': registry, 'apiKey': 'first'})
+    first.load_markets()
+    accounts = [SyncExchange({'marketRegistry': registry, 'apiKey': str(i)}) for i in range(0, 10)]
+    for account in accounts:
+        account.load_markets()
+    assert SyncExchange.total == fetched + 1
+    assert registry.stats()['hits'] == 10
+    account = accounts[0]
+    assert account.symbols == first.symbols and account.ids == first.ids and account.codes == first.codes
+    assert account.markets_by_id['BTCUSDT'][0]['symbol'] == 'BTC/USDT'
+    assert 'XBTUSDT' in account.options['marketsByAltname']
+    # the structures are shared, the indexes are copied
+    assert account.markets['BTC/USDT'] is first.markets['BTC/USDT']
+    del account.markets['ETH/USDT']
+    account.symbols.remove('ETH/USDT')
+    assert 'ETH/USDT' in first.markets and 'ETH/USDT' in accounts[1].markets and 'ETH/USDT' in accounts[1].symbols
+    # the shared structures are read-only, for the instance that fetched them too
+    for market in [account.markets['BTC/USDT'], first.markets['BTC/USDT'], account.markets['BTC/USDT']['precision'], account.markets_by_id['BTCUSDT'][0], account.currencies['BTC']]:
+        for write in [lambda: market.__setitem__('active', False), lambda: market.update({'active': False}), lambda: market.pop('id')]:
+            try:
+                write()
+                assert False
+            except TypeError:
+                pass
+    try:
+        account.markets_by_id['BTCUSDT'].append({})
+        assert False
+    except TypeError:
+        pass
+    account.markets['BTC/USDT'] = account.extend(account.markets['BTC/USDT'], {'active': False})
+    assert account.markets['BTC/USDT']['active'] is False and first.markets['BTC/USDT']['active'] is not False
+    # the copies are plain dicts
+    market = accounts[1].markets['BTC/USDT']
+    result = copy.copy(market)
+    result['active'] = False
+    assert type(result) is dict and market['active'] is not False
+    for result in [copy.deepcopy(market), pickle.loads(pickle.dumps(market)), account.deep_extend({}, market)]:
+        assert type(result) is dict and result == market
+        result['precision']['price'] = 1
+        assert market['precision']['price'] == 0.01
+    assert json.loads(first.json(first.markets))['BTC/USDT']['id'] == 'BTCUSDT'
+    # the options set while fetching are copied for every instance
+    account.options['networks']['XRP'] = 'ripple'
+    assert accounts[1].options['networks'] == {'ETH': 'erc20', 'BTC': 'bitcoin'}
+    # compared by value, the options rebuilt with the same content are not changed
+    assert first.changed_options(first.deep_extend({}, first.options)) == {}
+    # a reload publishes the new indexes
+    first.load_markets(True)
+    assert SyncExchange.total == fetched + 2
+    assert first.markets is not accounts[1].markets
+    assert SyncExchange({'marketRegistry': registry}).load_markets()['BTC/USDT'] is first.markets['BTC/USDT']
+    # other market related options are kept apart
+    SyncExchange({'marketRegistry': registry, 'options': {'defaultType': 'swap'}}).load_markets()
+    assert SyncExchange.total == fetched + 3
+    assert registry.stats()['entries'] == 2
+    # nor another market set
+    spot = SyncExchange({'marketRegistry': registry, 'options': {'fetchMarkets': ['spot']}})
+    assert 'BTC/USDT:USDT' not in spot.load_markets()
+    assert SyncExchange.total == fetched + 4
+    other = SyncExchange({'marketRegistry': registry, 'options': {'fetchMarkets': ['swap']}})
+    assert list(other.load_markets()) == ['BTC/USDT:USDT']
+    assert SyncExchange.total == fetched + 5
+    assert 'BTC/USDT:USDT' in SyncExchange({'marketRegistry': registry}).load_markets()
+    assert SyncExchange.total == fetched + 5
+    okx = [ccxt.okx({'marketRegistry': registry, 'options': options}) for options in [{'fetchMarkets': ['spot']}, {}, {'defaultUnderlying': ['ETH-USD']}]]
+    assert len(set(registry.key(exchange) for exchange in okx)) == 3
+    # the exchanges copy the shared currencies to change them
+    bitmart = ccxt.bitmart({'marketRegistry': MarketRegistry()})
+    bitmart.set_markets([], {'USDT': {'id': 'USDT', 'code': 'USDT', 'precision': 0.01}})
+    bitmart.marketRegistry.put(bitmart)
+    bitmart.privateGetAccountV2DepositWithdrawHistory = lambda params={}: {'data': {'records': []}}
+    assert bitmart.fetch_deposits('USDT', None, None, {'network': 'TRC20'}) == []
+    assert bitmart.currencies['USDT']['code'] == 'USDT'
+    kucoin = ccxt.kucoin({'marketRegistry': MarketRegistry()})
+    kucoin.set_markets([], {'USDT': {'id': 'USDT', 'code': 'USDT', 'precision': 0.01, 'networks': {'TRC20': {'id': 'trx', 'network': 'TRC20'}}}})
+    kucoin.marketRegistry.put(kucoin)
+    kucoin.privateGetWithdrawalsQuotas = lambda params={}: {'data': {'precision': 6}}
+    kucoin.load_currency_precision(kucoin.currency('USDT'), 'TRC20')
+    assert kucoin.currencies['USDT']['networks']['TRC20']['precision'] == 0.000001
+    # the compact records
+    compact = SyncExchange({'marketRegistry': MarketRegistry(), 'compactMarkets': True})
+    market = compact.load_markets()['BTC/USDT']
+    assert market['symbol'] == 'BTC/USDT' and market.to_dict()['id'] == 'BTCUSDT'
+    try:
+        market['active'] = False
+        assert False
+    except TypeError:
+        pass
+
+    async def test_async():
+        # the instances that start while another one is fetching wait for it
+        fetched = AsyncExchange.total
+        registry = MarketRegistry()
+        exchanges = [AsyncExchange({'marketRegistry': registry}) for i in range(0, 20)]
+        results = await asyncio.gather(*[exchange.load_markets() for exchange in exchanges])
+        assert AsyncExchange.total == fetched + 1
+        assert all(result['ETH/USDT'] is results[0]['ETH/USDT'] for result in results)
+        await asyncio.gather(*[exchange.close() for exchange in exchanges])
+
+    asyncio.run(test_async())
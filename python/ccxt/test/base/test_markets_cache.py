@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import tempfile
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.markets_cache import MarketsCache  # noqa: E402
+from ccxt.test.base.markets_fixture import SyncExchange, AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_markets_cache():
+    with tempfile.TemporaryDirectory() as path:
+        cache = MarketsCache(path, ttl=60000)
+        first = SyncExchange({'marketsCache': cache})
+        first.load_markets()
+        assert first.fetched == 1
+        # a new instance reads the file
+        second = SyncExchange({'marketsCache': cache})
+        second.load_markets()
+        assert second.fetched == 0
+        assert second.symbols == first.symbols and second.ids == first.ids
+        assert second.markets['BTC/USDT']['precision'] == first.markets['BTC/USDT']['precision']
+        assert sorted(second.currencies) == ['BTC', 'ETH', 'USDT']
+        # with the options set while fetching
+        assert second.options['marketsByAltname']['XBTUSDT']['id'] == 'BTCUSDT'
+        assert second.options['networks'] == {'ETH': 'erc20', 'BTC': 'bitcoin'}
+        # other market related options and the sandbox urls have their own entries
+        other = SyncExchange({'marketsCache': cache, 'options': {'defaultType': 'swap'}})
+        other.load_markets()
+        assert other.fetched == 1
+        other = SyncExchange({'marketsCache': cache, 'urls': {'api': {'public': 'https://test.example.com'}}})
+        other.load_markets()
+        assert other.fetched == 1
+        # the markets of another fetchMarkets are not used for the default one
+        spot = SyncExchange({'marketsCache': cache, 'options': {'fetchMarkets': ['spot']}})
+        spot.load_markets()
+        assert spot.fetched == 1 and 'BTC/USDT:USDT' not in spot.markets
+        spot = SyncExchange({'marketsCache': cache, 'options': {'fetchMarkets': ['spot']}})
+        spot.load_markets()
+        assert spot.fetched == 0 and 'BTC/USDT:USDT' not in spot.markets
+        assert 'BTC/USDT:USDT' in SyncExchange({'marketsCache': cache}).load_markets()
+        other = SyncExchange({'marketsCache': cache, 'options': {'sandboxMode': True}})
+        other.load_markets()
+        assert other.fetched == 1
+        # the options an exchange adds to the key
+        assert cache.filename(SyncExchange({'options': {'marketsKeyOptions': ['defaultUnderlying'], 'defaultUnderlying': ['BTC-USD']}})) != cache.filename(SyncExchange({'options': {'marketsKeyOptions': ['defaultUnderlying']}}))
+        # reload and params skip the cache
+        second.load_markets(True)
+        assert second.fetched == 1
+        other = SyncExchange({'marketsCache': cache})
+        other.load_markets(False, {'type': 'spot'})
+        assert other.fetched == 1
+        # an expired entry is fetched again by the sync exchanges
+        expired = MarketsCache(path, ttl=-1)
+        other = SyncExchange({'marketsCache': expired})
+        other.load_markets()
+        assert other.fetched == 1
+        # the entries of another version are ignored
+        with open(cache.filename(first), 'w') as file:
+            file.write('{"key": {"version": "0.0.0"}, "timestamp": 0}')
+        other = SyncExchange({'marketsCache': cache})
+        other.load_markets()
+        assert other.fetched == 1
+        cache.clear(first)
+        assert [name for name in os.listdir(path) if name.startswith('marketstest-')] == []
+
+        async def test_async():
+            exchange = AsyncExchange({'marketsCache': cache})
+            await exchange.load_markets()
+            assert exchange.fetched == 1
+            exchange = AsyncExchange({'marketsCache': cache})
+            await exchange.load_markets()
+            assert exchange.fetched == 0
+            # the expired markets are returned and refreshed in the background
+            exchange = AsyncExchange({'marketsCache': expired})
+            markets = await exchange.load_markets()
+            assert 'BTC/USDT' in markets and exchange.fetched == 0
+            await exchange.markets_refreshing
+            assert exchange.fetched == 1
+            await exchange.close()
+            exchange = AsyncExchange({'marketsCache': MarketsCache(path, ttl=-1, background=False)})
+            await exchange.load_markets()
+            assert exchange.fetched == 1
+            await exchange.close()
+
+        asyncio.run(test_async())
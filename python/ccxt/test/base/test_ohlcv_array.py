@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base import ohlcv_array  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MARKETS = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'markets', 'binance.json')
+
+RESPONSE = [
+    ['1700000120000', '3', '4', '2', '3.5', '10'],
+    ['1700000000000', '1', '2', '0.5', '1.5', '20'],
+    ['1700000060000', '1.5', '3', '1', '3', None],
+    ['1700000060000', '1.5', '3', '1', '2.5', '5'],
+]
+
+
+class SampleExchange(ccxt.Exchange):
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        return self.parse_ohlcvs(RESPONSE, None, timeframe, since, limit)
+
+
+class AsyncSampleExchange(ccxt.async_support.Exchange):
+    async def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        return self.parse_ohlcvs(RESPONSE, None, timeframe, since, limit)
+
+
+def test_ohlcv_array():
+    exchange = SampleExchange({'id': 'sampleexchange'})
+    if ohlcv_array.numpy is None:
+        try:
+            exchange.fetch_ohlcv_array('BTC/USDT')
+            assert False
+        except ccxt.NotSupported:
+            pass
+        return
+    numpy = ohlcv_array.numpy
+    candles = exchange.fetch_ohlcv_array('BTC/USDT')
+    assert candles.dtype.names == ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+    assert candles['timestamp'].dtype == numpy.int64
+    # sorted and unique, the last of the repeated candles
+    assert candles['timestamp'].tolist() == [1700000000000, 1700000060000, 1700000120000]
+    assert candles['close'].tolist() == [1.5, 2.5, 3.5]
+    # the same candles as the lists
+    assert ohlcv_array.to_list(candles) == [[1700000000000, 1.0, 2.0, 0.5, 1.5, 20.0], [1700000060000, 1.5, 3.0, 1.0, 2.5, 5.0], [1700000120000, 3.0, 4.0, 2.0, 3.5, 10.0]]
+    assert numpy.isnan(exchange.ohlcv_to_array([[1, 2, 3, 4, 5, None]])['volume'][0])
+    assert len(exchange.ohlcv_to_array([])) == 0
+    # since and limit
+    assert exchange.fetch_ohlcv_array('BTC/USDT', '1m', 1700000060000)['timestamp'].tolist() == [1700000060000, 1700000120000]
+    assert exchange.fetch_ohlcv_array('BTC/USDT', '1m', None, 2)['timestamp'].tolist() == [1700000060000, 1700000120000]
+    assert exchange.fetch_ohlcv_array('BTC/USDT', '1m', 1700000000000, 2)['timestamp'].tolist() == [1700000000000, 1700000060000]
+    # pages merged in any order
+    merged = ohlcv_array.concatenate([candles[1:], candles[0:2]])
+    assert merged['timestamp'].tolist() == candles['timestamp'].tolist()
+
+    async def fetch():
+        exchange = AsyncSampleExchange({'id': 'sampleexchange'})
+        try:
+            return await exchange.fetch_ohlcv_array('BTC/USDT')
+        finally:
+            await exchange.close()
+
+    assert asyncio.run(fetch()).tolist() == candles.tolist()
+
+    # the candles of the streamed exchanges are written while parsing
+    binance = ccxt.binance()
+    with open(MARKETS) as file:
+        binance.set_markets(json.load(file))
+    binance.publicGetKlines = lambda params={}: [row + ['0', 1, '0', '0', '0', '0'] for row in RESPONSE]
+    parsed = []
+    parse_ohlcv = binance.parse_ohlcv
+
+    def counting_parse_ohlcv(ohlcv, market=None):
+        parsed.append(None)
+        return parse_ohlcv(ohlcv, market)
+
+    binance.parse_ohlcv = counting_parse_ohlcv
+    assert 'binance' in ohlcv_array.streamed
+    candles = binance.fetch_ohlcv_array('BTC/USDT')
+    assert len(parsed) == len(RESPONSE)
+    assert candles.tolist() == binance.ohlcv_to_array(binance.fetch_ohlcv('BTC/USDT')).tolist()
+    assert binance.fetch_ohlcv_array('BTC/USDT', '1m', 1700000000000, 2)['timestamp'].tolist() == [1700000000000, 1700000060000]
+    # the lists are returned outside of fetch_ohlcv_array()
+    assert binance.fetch_ohlcv('BTC/USDT', '1m', None, 1) == [[1700000120000, 3.0, 4.0, 2.0, 3.5, 10.0]]
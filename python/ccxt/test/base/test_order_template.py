@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MARKETS = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'markets')
+
+
+class costexchange(ccxt.Exchange):
+    # an exchange that sends the cost of an order, derived from both the amount and the price
+    def create_order(self, symbol, type, side, amount, price=None, params={}):
+        return self.fetch2('order', 'private', 'POST', {'symbol': symbol, 'cost': amount * price})
+
+
+def load(module, id='binance'):
+    exchange = getattr(module, id)({'apiKey': 'key', 'secret': 'secret'})
+    with open(os.path.join(MARKETS, id + '.json')) as file:
+        exchange.set_markets(json.load(file))
+    exchange.sent = []
+
+    def fetch(url, method='GET', headers=None, body=None):
+        exchange.sent.append([url, method, body])
+        return {'orderId': 1, 'symbol': 'BTCUSDT', 'status': 'NEW'}
+
+    async def async_fetch(url, method='GET', headers=None, body=None):
+        return fetch(url, method, headers, body)
+
+    exchange.fetch = async_fetch if module is ccxt.async_support else fetch
+    return exchange
+
+
+def deterministic(exchange):
+    exchange.milliseconds = lambda: 1700000000000
+    exchange.uuid22 = lambda *args: 'a' * 22
+
+
+def test_order_template():
+    exchange = load(ccxt)
+    for symbol, type, side, amount, price, params in [
+        ['BTC/USDT', 'limit', 'buy', 0.0012345, 50000.123, {}],
+        ['BTC/USDT', 'market', 'sell', 0.01, None, {}],
+        ['BTC/USDT:USDT', 'limit', 'sell', 0.5, 43000.17, {'timeInForce': 'IOC'}],
+    ]:
+        template = exchange.order_template(symbol, type, side, params)
+        assert [field[0:2] for field in template.fields] == [[('newClientOrderId',), 'generated'], [('quantity',), 'amount']] + ([[('price',), 'price']] if price is not None else [])
+        # the same request as create_order()
+        deterministic(exchange)
+        exchange.create_order(symbol, type, side, amount, price, dict(params))
+        exchange.create_order_from_template(template, amount, price)
+        assert exchange.sent[-1] == exchange.sent[-2]
+        del exchange.milliseconds, exchange.uuid22
+    assert template.parse_order({'orderId': 1, 'symbol': 'BTCUSDT', 'status': 'NEW'})['id'] == '1'
+    # a new client order id per order, unless the params have one
+    template = exchange.order_template('BTC/USDT', 'limit', 'buy')
+    exchange.create_order_from_template(template, 0.1, 50000)
+    exchange.create_order_from_template(template, 0.1, 50000)
+    assert exchange.sent[-1] != exchange.sent[-2]
+    exchange.create_order_from_template(template, 0.1, 50000, {'newClientOrderId': 'mine'})
+    assert 'newClientOrderId=mine&' in exchange.sent[-1][2]
+    try:
+        exchange.create_order_from_template(template, 0.1)
+        assert False
+    except ccxt.ArgumentsRequired:
+        pass
+    try:
+        exchange.create_order_from_template(template, 0.000001, 50000)
+        assert False
+    except ccxt.InvalidOrder:
+        pass
+    # nothing is sent while a template is prepared
+    count = len(exchange.sent)
+    exchange.order_template('ETH/USDT', 'limit', 'sell')
+    assert len(exchange.sent) == count
+    assert 'fetch2' not in exchange.__dict__ and 'uuid22' not in exchange.__dict__
+    # a price of a tick of 0.5 sent as an int when it is whole and as a float otherwise
+    bitmex = load(ccxt, 'bitmex')
+    template = bitmex.order_template('BTC/USD:BTC', 'limit', 'buy')
+    assert [field[1:] for field in template.fields] == [['amount', 'int'], ['price', 'numeric']]
+    for price in [50000.5, 50000, 49999.76]:
+        bitmex.create_order('BTC/USD:BTC', 'limit', 'buy', 200, price)
+        bitmex.create_order_from_template(template, 200, price)
+        assert bitmex.sent[-1] == bitmex.sent[-2]
+    assert '"price":50000.5' in bitmex.sent[0][2] and '"price":50000}' in bitmex.sent[2][2]
+    # the requests that cannot be prepared
+    other = costexchange({'id': 'costexchange'})
+    other.set_markets([{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'precision': {'amount': 0.001, 'price': 0.01}, 'limits': {}}])
+    try:
+        other.order_template('BTC/USDT', 'limit', 'buy')
+        assert False
+    except ccxt.NotSupported:
+        pass
+
+    async def run():
+        async_exchange = load(ccxt.async_support)
+        try:
+            template = await async_exchange.order_template('BTC/USDT', 'limit', 'buy')
+            deterministic(async_exchange)
+            await async_exchange.create_order('BTC/USDT', 'limit', 'buy', 0.0012345, 50000.123)
+            await async_exchange.create_order_from_template(template, 0.0012345, 50000.123)
+            assert async_exchange.sent[-1] == async_exchange.sent[-2]
+        finally:
+            await async_exchange.close()
+
+    asyncio.run(run())
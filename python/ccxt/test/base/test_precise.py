@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base import precise  # noqa: E402
+from ccxt.base.precise import Precise  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+NUMBERS = ['0', '-0', '0.000', '1', '-1', '10', '100', '1.50', '-1.123e-6', '1E8', '2.5e-7', '.5', '-.5', '0.00000002', '69696900000', '27123.45', '0.0015', '1.00e2']
+
+
+def test_precise():
+    # the string methods match the instance methods they replace
+    for a in NUMBERS:
+        assert Precise.string_abs(a) == str(Precise(a).abs())
+        assert Precise.string_neg(a) == str(Precise(a).neg())
+        for b in NUMBERS:
+            assert Precise.string_mul(a, b) == str(Precise(a).mul(Precise(b)))
+            assert Precise.string_add(a, b) == str(Precise(a).add(Precise(b)))
+            assert Precise.string_sub(a, b) == str(Precise(a).sub(Precise(b)))
+            assert Precise.string_min(a, b) == str(Precise(a).min(Precise(b)))
+            assert Precise.string_max(a, b) == str(Precise(a).max(Precise(b)))
+            assert Precise.string_eq(a, b) == Precise(a).equals(Precise(b))
+            assert Precise.string_gt(a, b) == Precise(a).gt(Precise(b))
+            assert Precise.string_ge(a, b) == Precise(a).ge(Precise(b))
+            assert Precise.string_lt(a, b) == Precise(a).lt(Precise(b))
+            assert Precise.string_le(a, b) == Precise(a).le(Precise(b))
+            if Precise(b).integer != 0:
+                for precision in [-1, 0, 8, 18]:
+                    assert Precise.string_div(a, b, precision) == str(Precise(a).div(Precise(b), precision))
+    assert Precise.string_min('1.0', '1') == '1'
+    assert Precise.string_max('-0', '0') == '0'
+    assert Precise.string_mul('1.50', '1') == '1.5'
+    assert Precise.string_add('1.50', None) == '1.50'
+    assert Precise.string_div('1', '0.000') is None
+    # the parsed strings are cached
+    precise.parsed.clear()
+    assert Precise('0.0015').integer == 15
+    assert precise.parsed['0.0015'] == (15, 4)
+    assert Precise('1.00e2').decimals == 0
+    assert Precise('-1.123e-6').decimals == 9
+    # the instances have no __dict__
+    number = Precise('1.5')
+    try:
+        number.other = 1
+        assert False
+    except AttributeError:
+        pass
+    assert repr(Precise('1.50')) == 'Precise(1.5)'
+    assert float(Precise('-2.5e-7')) == -2.5e-7
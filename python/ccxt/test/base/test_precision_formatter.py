@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+import decimal
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.decimal_to_precision import decimal_to_precision, precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import ROUND, TRUNCATE, DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE, NO_PADDING, PAD_WITH_ZERO  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+NUMBERS = ['0', '-0', '0.000', '1', '-1', '0.05', '0.25', '-0.005', '27123.456', '27123.455', '-5.555', '1.50', '1e-3', '1.00e2', '.5', '69696900000.00000002', '1022631662e7', 0.1 + 0.2, 1e-05, 27123.456, -7, decimal.Decimal('1.25')]
+
+
+def test_precision_formatter():
+    # the same results as decimal_to_precision()
+    for precision, counting_mode in [[0, DECIMAL_PLACES], [2, DECIMAL_PLACES], [8, DECIMAL_PLACES], [-1, DECIMAL_PLACES], [3, SIGNIFICANT_DIGITS], [0.01, TICK_SIZE], [0.1, TICK_SIZE], [0.5, TICK_SIZE], [10, TICK_SIZE], ['0.001', TICK_SIZE], [decimal.Decimal('0.25'), TICK_SIZE]]:
+        for rounding_mode in [ROUND, TRUNCATE]:
+            for padding_mode in [NO_PADDING, PAD_WITH_ZERO]:
+                formatter = precision_formatter(precision, rounding_mode, counting_mode, padding_mode)
+                assert formatter is precision_formatter(precision, rounding_mode, counting_mode, padding_mode)
+                for number in NUMBERS:
+                    try:
+                        expected = decimal_to_precision(number, rounding_mode, precision, counting_mode, padding_mode)
+                    except decimal.InvalidOperation:
+                        expected = decimal.InvalidOperation
+                    try:
+                        result = formatter(number)
+                    except decimal.InvalidOperation:
+                        result = decimal.InvalidOperation
+                    assert result == expected, str([number, precision, rounding_mode, counting_mode, padding_mode, result, expected])
+    # the formatters of the markets
+    exchange = ccxt.Exchange({'id': 'sampleexchange', 'precisionMode': TICK_SIZE})
+    exchange.set_markets([
+        {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'baseId': 'BTC', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'precision': {'amount': 0.0001, 'price': 0.01}},
+        {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'baseId': 'ETH', 'quoteId': 'USDT', 'type': 'spot', 'spot': True, 'precision': {'amount': 0.0001, 'price': 0.01}},
+    ])
+    price = exchange.precision_formatter('BTC/USDT')
+    amount = exchange.precision_formatter('BTC/USDT', 'amount')
+    assert price is exchange.precision_formatter('ETH/USDT')
+    assert price(27123.456) == '27123.46' == exchange.price_to_precision('BTC/USDT', 27123.456)
+    assert amount(0.123456) == '0.1234' == exchange.amount_to_precision('BTC/USDT', 0.123456)
+    assert exchange.precision_formatter('BTC/USDT', 'price', TRUNCATE)(27123.456) == '27123.45' == exchange.cost_to_precision('BTC/USDT', 27123.456)
+    try:
+        exchange.amount_to_precision('BTC/USDT', 0.00001)
+        assert False
+    except ccxt.InvalidOrder:
+        pass
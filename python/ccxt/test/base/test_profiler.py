@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import http.server
+import json
+import os
+import sys
+import threading
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+from ccxt.base.profiler import Profiler, STAGES  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MARKETS = os.path.join(os.path.dirname(root), 'ts', 'src', 'test', 'static', 'markets', 'binance.json')
+
+TICKER = json.dumps({'symbol': 'BTCUSDT', 'lastPrice': '50000.00', 'bidPrice': '49999.99', 'askPrice': '50000.01', 'volume': '1000', 'openTime': 1700000000000, 'closeTime': 1700086400000, 'note': 'è'}, ensure_ascii=False).encode()  # the bytes are counted, not the characters
+ORDER = json.dumps({'symbol': 'BTCUSDT', 'orderId': 1, 'transactTime': 1700000000000, 'price': '50000.00', 'origQty': '0.001', 'executedQty': '0', 'status': 'NEW', 'type': 'LIMIT', 'side': 'BUY'}).encode()
+ERROR = json.dumps({'code': -2011, 'msg': 'Unknown order sent.'}).encode()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self, status, body):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.respond(200, TICKER)
+
+    def do_POST(self):
+        self.respond(200, ORDER)
+
+    def do_DELETE(self):
+        self.respond(400, ERROR)
+
+    def log_message(self, *args):
+        pass
+
+
+def binance(module, url, config={}):
+    exchange = module.binance(dict({'apiKey': 'key', 'secret': 'secret', 'enableRateLimit': False}, **config))
+    with open(MARKETS) as file:
+        exchange.set_markets(json.load(file))
+    exchange.urls['api'] = dict((api, url) for api in exchange.urls['api'])
+    return exchange
+
+
+def test_profiler():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:' + str(server.server_address[1])
+    try:
+        # without a profiler nothing is recorded
+        exchange = binance(ccxt, url)
+        assert exchange.profiler is None
+        exchange.fetch_ticker('BTC/USDT')
+        profiler = Profiler()
+        exchange.set_profiler(profiler)
+        ticker = exchange.fetch_ticker('BTC/USDT')
+        assert ticker['last'] == 50000.0
+        stats = profiler.endpoints['publicGetTicker24hr']
+        assert stats['calls'] == 1 and stats['failures'] == 0
+        assert stats['bytesIn'] == len(TICKER) and stats['bytesOut'] == 0
+        assert all(stats[stage] >= 0 for stage in STAGES)
+        assert stats['network'] > 0 and stats['sign'] > 0 and stats['parse'] > 0
+        assert profiler.methods['fetchTicker']['calls'] == 1
+        # the camelcase aliases, and the unified methods called by another one are part of it
+        exchange.fetchTicker('BTC/USDT')
+        assert profiler.endpoints['publicGetTicker24hr']['calls'] == 2
+        assert profiler.methods['fetchTicker']['calls'] == 2
+        exchange.create_order('BTC/USDT', 'limit', 'buy', 0.001, 50000)
+        stats = profiler.endpoints['privatePostOrder']
+        assert stats['calls'] == 1 and stats['bytesOut'] > 0 and stats['bytesIn'] == len(ORDER)
+        assert list(profiler.methods.keys()) == ['fetchTicker', 'createOrder']
+        # the retries are part of the request
+        assert 'fetch2' in exchange.__dict__
+        failures = [0]
+        fetch = exchange.fetch
+
+        def failing_fetch(*args):
+            if failures[0] < 1:
+                failures[0] += 1
+                raise ccxt.NetworkError('failed')
+            return fetch(*args)
+
+        exchange.fetch = failing_fetch
+        exchange.fetch_ticker('BTC/USDT', {'maxRetriesOnFailure': 1})
+        del exchange.fetch
+        assert profiler.endpoints['publicGetTicker24hr']['calls'] == 3 and profiler.endpoints['publicGetTicker24hr']['failures'] == 0
+        # the requests that fail
+        try:
+            exchange.cancel_order('1', 'BTC/USDT')
+            assert False
+        except ccxt.OrderNotFound:
+            pass
+        stats = profiler.endpoints['privateDeleteOrder']
+        assert stats['calls'] == 1 and stats['failures'] == 1 and stats['errors'] > 0
+        # the orders of a template
+        template = exchange.order_template('BTC/USDT', 'limit', 'buy')
+        exchange.create_order_from_template(template, 0.001, 50000)
+        assert profiler.endpoints['privatePostOrder']['calls'] == 2
+        # stopped
+        exchange.set_profiler(None)
+        assert 'fetch_ticker' not in exchange.__dict__ and 'fetchTicker' not in exchange.__dict__
+        assert 'fetch2' not in exchange.__dict__ and 'sign' not in exchange.__dict__
+        exchange.fetch_ticker('BTC/USDT')
+        assert profiler.endpoints['publicGetTicker24hr']['calls'] == 3
+        profiler.reset()
+        assert profiler.endpoints == {} and profiler.methods == {}
+        # a profiler of the config
+        exchange = binance(ccxt, url, {'profiler': profiler})
+        exchange.fetch_ticker('BTC/USDT')
+        assert profiler.endpoints['publicGetTicker24hr']['calls'] == 1
+
+        async def run():
+            async_profiler = Profiler()
+            async_exchange = binance(ccxt.async_support, url, {'profiler': async_profiler})
+            try:
+                await asyncio.gather(*[async_exchange.fetch_ticker('BTC/USDT') for i in range(0, 3)])
+                await async_exchange.create_order('BTC/USDT', 'limit', 'buy', 0.001, 50000)
+            finally:
+                await async_exchange.close()
+            stats = async_profiler.endpoints['publicGetTicker24hr']
+            assert stats['calls'] == 3 and stats['bytesIn'] == 3 * len(TICKER)
+            assert async_profiler.methods['fetchTicker']['calls'] == 3
+            assert async_profiler.endpoints['privatePostOrder']['calls'] == 1
+
+        asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.rate_limiter import RateLimiter, RateLimitBackend, MemoryRateLimitBackend, SqliteRateLimitBackend  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def test_rate_limiter():
+    limiter = RateLimiter({
+        'weight': {'limit': 100, 'interval': 1000, 'apis': ['public', 'private'], 'scale': 5, 'header': 'X-Used-Weight'},
+        'sapi': {'limit': 1000, 'interval': 1000, 'apis': ['sapi'], 'scale': 10},
+        'orders': {'limit': 2, 'interval': 1000, 'paths': ['order'], 'methods': ['POST']},
+        'daily': {'limit': 10, 'interval': 86400000},
+    })
+    # the cost is scaled into every matching bucket
+    debits = limiter.debits('public', 'depth', 'GET', 2)
+    assert [(bucket.name, amount) for bucket, amount in debits] == [('weight', 10), ('daily', 2)]
+    debits = limiter.debits('sapi', 'asset/transfer', 'GET', 0.1)
+    assert [(bucket.name, amount) for bucket, amount in debits] == [('sapi', 1.0), ('daily', 0.1)]
+    debits = limiter.debits('private', 'order', 'POST', 0.2, {'cost': 0.2, 'buckets': {'daily': 1}})
+    assert [(bucket.name, amount) for bucket, amount in debits] == [('weight', 1.0), ('orders', 0.2), ('daily', 0.2), ('daily', 1)]
+    # a request goes when every bucket has its tokens
+    now = 0
+    order = limiter.debits('private', 'order', 'POST', 1)
+    assert limiter.delay(order, now) == 0
+    limiter.consume(order)
+    assert limiter.delay(order, now) == 0
+    limiter.consume(order)
+    # the orders bucket is empty, one order per 500 ms
+    assert limiter.delay(order, now) == 500
+    assert limiter.delay(order, now + 250) == 250
+    assert limiter.delay(order, now + 500) == 0
+    # the other buckets are not affected
+    assert limiter.delay(limiter.debits('public', 'depth', 'GET', 1), now + 500) == 0
+    # the usage reported by the exchange lowers the tokens
+    weight = limiter.buckets['weight']
+    limiter.update({'Content-Type': 'application/json', 'X-USED-WEIGHT': '95'}, now + 500)
+    assert weight.tokens == 5
+    assert limiter.delay(limiter.debits('public', 'depth', 'GET', 2), now + 500) == 50
+    # but never raises them within the same window
+    limiter.update({'x-used-weight': '96'}, now + 500)
+    assert weight.tokens == 4
+    weight.tokens = 1
+    limiter.update({'x-used-weight': '97'}, now + 500)
+    assert weight.tokens == 1
+    # until a new window starts
+    limiter.update({'x-used-weight': '10'}, now + 500)
+    assert weight.tokens == 90
+    assert limiter.stats()['weight'] == {'tokens': 90, 'capacity': 100, 'used': 10}
+    # the buckets replace the rateLimit of the synchronous throttle
+    exchange = ccxt.Exchange({
+        'rateLimit': 60000,
+        'rateLimitBuckets': {'requests': {'limit': 2, 'interval': 100}},
+    })
+    debits = exchange.rate_limit_debits('public', 'time', 'GET', 1)
+    start = time.time()
+    for _ in range(0, 4):
+        exchange.throttle(1, debits)
+    elapsed = time.time() - start
+    assert elapsed > 0.09 and elapsed < 5
+    assert ccxt.Exchange().rate_limit_debits('public', 'time', 'GET', 1) is None
+    # the requests without a named bucket are still debited from the rateLimit
+    exchange = ccxt.Exchange({
+        'rateLimit': 100,
+        'rateLimitBuckets': {'orders': {'limit': 2, 'interval': 100, 'apis': ['private']}},
+    })
+    debits = exchange.rate_limit_debits('public', 'time', 'GET', 2)
+    assert [(bucket.name, amount) for bucket, amount in debits] == [('default', 2)]
+    assert exchange.rateLimiter.acquire(debits) == 0
+    assert exchange.rateLimiter.acquire(debits) > 100
+    assert [bucket.name for bucket, amount in exchange.rate_limit_debits('private', 'order', 'POST', 1)] == ['orders']
+    assert exchange.rateLimiter.stats()['default']['capacity'] == 1
+    # the buckets of binance, the sapi and futures endpoints have their own weights
+    binance = ccxt.binance()
+    assert [(bucket.name, amount) for bucket, amount in binance.rate_limit_debits('public', 'depth', 'GET', 1)] == [('weight', 5)]
+    assert [(bucket.name, amount) for bucket, amount in binance.rate_limit_debits('private', 'order', 'POST', 0.2)] == [('weight', 1), ('orders', 1)]
+    assert [bucket.name for bucket, amount in binance.rate_limit_debits('sapi', 'capital/config/getall', 'GET', 1)] == ['sapi']
+    assert [bucket.name for bucket, amount in binance.rate_limit_debits('fapiPublic', 'depth', 'GET', 2)] == ['fapi']
+    for api, name in [['dapiPrivate', 'dapi'], ['eapiPublic', 'eapi'], ['papi', 'papi'], ['fapiData', 'default']]:
+        assert [bucket.name for bucket, amount in binance.rate_limit_debits(api, 'depth', 'GET', 1)] == [name]
+    # a small burst, not a minute of requests at once
+    stats = binance.rateLimiter.stats()
+    assert stats['weight']['capacity'] == 100 and stats['fapi']['capacity'] == 40 and stats['orders']['capacity'] == 10
+    debits = binance.rate_limit_debits('public', 'depth', 'GET', 1)
+    assert sum(1 for i in range(0, 100) if binance.rateLimiter.acquire(debits) == 0) < 30
+    # the usage reported by binance corrects the buckets of the api of the request only
+    binance.rate_limit_debits('fapiPublic', 'depth', 'GET', 1)
+    binance.rateLimiter.update({'X-MBX-USED-WEIGHT-1M': '2390'})
+    stats = binance.rateLimiter.stats()
+    assert stats['fapi']['used'] == 2390 and stats['fapi']['tokens'] <= 10
+    assert stats['weight']['used'] is None and stats['dapi']['used'] is None and stats['papi']['used'] is None
+    binance.rate_limit_debits('sapi', 'capital/config/getall', 'GET', 1)
+    binance.rateLimiter.update({'x-sapi-used-ip-weight-1m': '12000', 'x-mbx-used-weight-1m': '5'})
+    assert binance.rateLimiter.stats()['sapi']['tokens'] == 0 and binance.rateLimiter.stats()['weight']['used'] is None
+    assert ccxt.binanceus().rateLimiter is None
+
+
+def draw_from_sqlite(path, count):
+    backend = SqliteRateLimitBackend(path)
+    exchange = ccxt.Exchange({'id': 'shared', 'apiKey': 'key', 'rateLimit': 10, 'rateLimitBackend': backend})
+    for _ in range(0, count):
+        exchange.throttle(1, exchange.rate_limit_debits('public', 'time', 'GET', 1))
+
+
+def test_rate_limit_backends():
+    # two instances with the same key share one budget, 100 requests per second
+    backend = MemoryRateLimitBackend()
+    first = ccxt.Exchange({'id': 'shared', 'apiKey': 'key', 'rateLimit': 10, 'rateLimitBackend': backend})
+    second = ccxt.Exchange({'id': 'shared', 'apiKey': 'key', 'rateLimit': 10, 'rateLimitBackend': backend})
+    other = ccxt.Exchange({'id': 'shared', 'apiKey': 'other', 'rateLimit': 10, 'rateLimitBackend': backend})
+    debits = first.rate_limit_debits('public', 'time', 'GET', 1)
+    assert first.rate_limit_key() == second.rate_limit_key()
+    assert first.rate_limit_key() != other.rate_limit_key()
+    assert 'key' not in first.rate_limit_key()
+    # hashed once per api key
+    assert first.rate_limit_key() is first.rate_limit_key()
+    other.apiKey = 'key'
+    assert other.rate_limit_key() == first.rate_limit_key()
+    other.apiKey = 'other'
+    assert first.rateLimiter.acquire(debits) == 0
+    second.rate_limit_debits('public', 'time', 'GET', 1)
+    delay = second.rateLimiter.acquire(debits)
+    assert delay > 5 and delay <= 10
+    other.rate_limit_debits('public', 'time', 'GET', 1)
+    assert other.rateLimiter.acquire(debits) == 0
+    # several buckets are taken at once or not at all
+    backend.buckets.clear()
+    requests = [['a', 1, 1, 0.001, 1], ['b', 1, 1, 0.001, 1]]
+    assert backend.acquire(requests) == 0
+    assert backend.acquire([['a', 1, 0, 0.001, 1]]) == 0
+    assert backend.acquire(requests) > 0
+    assert backend.buckets['b'][0] == 0
+    # corrections from response headers
+    backend.correct('c', 0.5, False, 0.001, 1)
+    assert backend.buckets['c'][0] == 0.5
+    backend.correct('c', 1, True, 0.001, 1)
+    assert backend.buckets['c'][0] == 1
+    # processes on the same machine through sqlite, 4 x 5 requests at 100 per second take at least 190 ms
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'rate-limits.sqlite')
+        start = time.time()
+        processes = [multiprocessing.Process(target=draw_from_sqlite, args=(path, 5)) for _ in range(0, 4)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert all(process.exitcode == 0 for process in processes)
+        assert time.time() - start >= 0.19
+        keys = SqliteRateLimitBackend(path).connection().execute('SELECT key FROM buckets').fetchall()
+        assert keys == [(first.rate_limit_key() + 'default',)]
+        # a database locked by another process is not waited for
+        backend = SqliteRateLimitBackend(path)
+        locking = SqliteRateLimitBackend(path).connection()
+        locking.execute('BEGIN IMMEDIATE')
+        start = time.time()
+        assert backend.acquire([['a', 1, 1, 0.001, 1]]) == backend.retry
+        backend.correct('a', 0, True, 0.001, 1)
+        assert time.time() - start < 0.1
+        locking.execute('COMMIT')
+        assert backend.acquire([['a', 1, 1, 0.001, 1]]) == 0
+    # the backends implement both methods
+    try:
+        RateLimitBackend()
+        assert False
+    except TypeError:
+        pass
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+MARKETS = [
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT:USDT', 'base': 'BTC', 'quote': 'USDT', 'settle': 'USDT', 'type': 'swap', 'spot': False, 'swap': True, 'linear': True, 'inverse': False, 'precision': {'amount': 0.001, 'price': 0.1}, 'info': {'filters': [{'tickSize': '0.1'}]}},
+    {'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'swap': False, 'linear': None, 'inverse': None, 'precision': {'amount': 0.0001, 'price': 0.01}, 'info': {'filters': [{'tickSize': '0.01'}]}},
+    {'id': 'ETHUSDT', 'symbol': 'ETH/USDT', 'base': 'ETH', 'quote': 'USDT', 'type': 'spot', 'spot': True, 'swap': False, 'linear': None, 'inverse': None, 'precision': {'amount': 0.001, 'price': 0.01}, 'info': {'filters': []}},
+]
+
+
+def test_set_markets():
+    exchange = ccxt.Exchange()
+    exchange.set_markets(copy.deepcopy(MARKETS))
+    assert exchange.symbols == ['BTC/USDT', 'BTC/USDT:USDT', 'ETH/USDT']
+    assert exchange.ids == ['BTCUSDT', 'ETHUSDT']
+    assert exchange.codes == ['BTC', 'ETH', 'USDT']
+    # spot markets first among the ones sharing an id
+    assert [market['symbol'] for market in exchange.markets_by_id['BTCUSDT']] == ['BTC/USDT', 'BTC/USDT:USDT']
+    assert exchange.markets['BTC/USDT:USDT']['subType'] == 'linear'
+    assert exchange.markets['BTC/USDT']['subType'] is None
+    # the market structure is filled in, the nested dicts are copies
+    market = exchange.markets['ETH/USDT']
+    assert market['limits']['amount'] == {'min': None, 'max': None}
+    assert market['info'] == MARKETS[2]['info'] and market['info'] is not MARKETS[2]['info']
+    # lookup tables
+    assert [market['symbol'] for market in exchange.markets_by_lowercase_id['btcusdt']] == ['BTC/USDT', 'BTC/USDT:USDT']
+    assert [market['symbol'] for market in exchange.markets_by_type['spot']] == ['BTC/USDT', 'ETH/USDT']
+    assert [market['symbol'] for market in exchange.markets_by_base_quote[('BTC', 'USDT')]] == ['BTC/USDT', 'BTC/USDT:USDT']
+    # a reload reuses the structures of the markets that did not change
+    previous = exchange.markets
+    changed = copy.deepcopy(MARKETS)
+    changed[2]['precision']['amount'] = 0.01
+    exchange.set_markets(changed)
+    assert exchange.markets['BTC/USDT'] is previous['BTC/USDT']
+    assert exchange.markets['BTC/USDT:USDT'] is previous['BTC/USDT:USDT']
+    assert exchange.markets['ETH/USDT'] is not previous['ETH/USDT']
+    assert exchange.markets['ETH/USDT']['precision']['amount'] == 0.01
+    assert previous['ETH/USDT']['precision']['amount'] == 0.001
+    exchange.set_markets(changed[0:2])
+    assert exchange.symbols == ['BTC/USDT', 'BTC/USDT:USDT'] and 'ETH/USDT' not in exchange.markets
+    # but not when the defaults of the structure changed
+    exchange.precision = {'amount': 1}
+    exchange.set_markets(changed[0:2])
+    assert exchange.markets['BTC/USDT'] is not previous['BTC/USDT']
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import hashlib
+import hmac
+import os
+import sys
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base import signers  # noqa: E402
+from cryptography.hazmat.primitives import hashes, serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ed25519, padding, rsa  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def pem(key):
+    return key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()).decode()
+
+
+def test_signers():
+    exchange = ccxt.Exchange
+    signers.clear()
+    # hmac, the same digest as a new hmac for every message
+    for algorithm in [hashlib.sha256, hashlib.sha384, hashlib.sha512, hashlib.md5, 'sha256']:
+        for secret in [b'secret', b'another secret', bytes(range(0, 200))]:
+            for message in [b'', b'timestamp=1&symbol=BTCUSDT', b'x' * 1000]:
+                expected = hmac.new(secret, message, algorithm).digest()
+                assert exchange.hmac(message, secret, algorithm, 'binary') == expected
+                assert exchange.hmac(message, secret, algorithm, 'hex') == expected.hex()
+                assert exchange.hmac(message, secret, algorithm, 'base64') == base64.b64encode(expected).decode()
+    assert signers.hmac_template(b'secret', hashlib.sha256) is signers.hmac_template(b'secret', hashlib.sha256)
+    assert signers.hmac_template(b'secret', hashlib.sha256) is not signers.hmac_template(b'other', hashlib.sha256)
+    # the secrets that are not bytes are not cached
+    assert exchange.hmac(b'message', bytearray(b'secret'), hashlib.sha256, 'binary') == hmac.new(b'secret', b'message', hashlib.sha256).digest()
+    # rsa, pkcs1 v1.5 signatures are deterministic
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    secret = pem(key)
+    for alg, algorithm in [['sha256', hashes.SHA256()], ['sha512', hashes.SHA512()]]:
+        expected = base64.b64encode(key.sign(b'message', padding.PKCS1v15(), algorithm)).decode()
+        assert exchange.rsa('message', secret, alg) == expected
+        assert exchange.rsa('message', secret.encode(), alg) == expected
+    assert signers.rsa_key(secret) is signers.rsa_key(secret)
+    # a changed secret signs with its own key
+    other = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    assert exchange.rsa('message', pem(other)) == base64.b64encode(other.sign(b'message', padding.PKCS1v15(), hashes.SHA256())).decode()
+    # eddsa, raw 32 bytes or pem
+    key = ed25519.Ed25519PrivateKey.generate()
+    raw = key.private_bytes(serialization.Encoding.Raw, serialization.PrivateFormat.Raw, serialization.NoEncryption())
+    expected = base64.b64encode(key.sign(b'message')).decode()
+    for secret in [raw, pem(key), pem(key).encode()]:
+        assert exchange.eddsa(b'message', secret) == expected
+        assert signers.eddsa_key(secret) is signers.eddsa_key(secret)
+    # jwt signs with the cached keys too
+    token = exchange.jwt({'a': 1}, b'secret', 'sha256')
+    header_and_data, signature = token.rsplit('.', 1)
+    assert signature == exchange.urlencode_base64(hmac.new(b'secret', header_and_data.encode(), hashlib.sha256).digest())
+    signers.clear()
+    assert not signers.hmac_templates and not signers.rsa_keys and not signers.eddsa_keys
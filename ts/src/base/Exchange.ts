@@ -144,6 +144,7 @@ import { Precise } from './Precise.js'
 import WsClient from './ws/WsClient.js';
 import { Future } from './ws/Future.js';
 import { OrderBook as WsOrderBook, IndexedOrderBook, CountedOrderBook } from './ws/OrderBook.js';
+import { OrderBookChecksum } from './ws/OrderBookChecksum.js';
 
 // ----------------------------------------------------------------------------
 //
@@ -677,10 +678,16 @@ export default class Exchange {
         this.throttler = new Throttler (this.tokenBucket);
     }
 
-    throttle (cost = undefined) {
+    throttle (cost = undefined, debits = undefined) {
+        // the debits of the named rate limit buckets are only used by the python version for now
         return this.throttler.throttle (cost)
     }
 
+    rateLimitDebits (api, path, method, cost, config = {}) {
+        // what a request takes from the named rate limit buckets, undefined without them
+        return undefined;
+    }
+
     defineRestApiEndpoint (methodName, uppercaseMethod, lowercaseMethod, camelcaseMethod, path, paths, config = {}) {
         const splitPath = path.split (/[^a-zA-Z0-9]/)
         const camelcaseSuffix  = splitPath.map (this.capitalize).join ('')
@@ -1156,6 +1163,16 @@ export default class Exchange {
         return new CountedOrderBook (snapshot, depth);
     }
 
+    orderBookChecksum (orderbook, depth = 25) {
+        // the checksum helper of a stored order book, verifying every message unless configured otherwise
+        if (orderbook.checksum === undefined) {
+            const every = this.handleOption ('watchOrderBook', 'checksumEvery', 1);
+            const interval = this.handleOption ('watchOrderBook', 'checksumInterval'); // milliseconds
+            orderbook.checksum = new OrderBookChecksum (depth, every, interval);
+        }
+        return orderbook.checksum;
+    }
+
     handleMessage (client, message) {} // stub to override
 
     // ping (client: Client) {} // stub to override
@@ -1499,6 +1516,58 @@ export default class Exchange {
         return {};
     }
 
+    resolveOption (methodName: string, optionName: string) {
+        // [ defaultOptionName, value ] of an option, from the options of the method or the exchange-wide ones
+        const defaultOptionName = 'default' + this.capitalize (optionName);
+        let value = undefined;
+        // check if exchange has properties for this method
+        const exchangeWideMethodOptions = this.safeValue (this.options, methodName);
+        if (exchangeWideMethodOptions !== undefined) {
+            // check if the option is defined inside this method's props
+            value = this.safeValue2 (exchangeWideMethodOptions, optionName, defaultOptionName);
+        }
+        if (value === undefined) {
+            // if it's still undefined, check if global exchange-wide option exists
+            value = this.safeValue2 (this.options, optionName, defaultOptionName);
+        }
+        return [ defaultOptionName, value ];
+    }
+
+    indexMarkets (markets) {
+        // sets markets, markets_by_id, symbols and ids, returns the market structures for setMarkets ()
+        const values = [];
+        this.markets_by_id = {};
+        // handle marketId conflicts
+        // we insert spot markets first
+        const marketValues = this.sortBy (this.toArray (markets), 'spot', true, true);
+        for (let i = 0; i < marketValues.length; i++) {
+            const value = marketValues[i];
+            if (value['id'] in this.markets_by_id) {
+                (this.markets_by_id[value['id']] as any).push (value);
+            } else {
+                this.markets_by_id[value['id']] = [ value ] as any;
+            }
+            const market = this.deepExtend (this.safeMarketStructure (), {
+                'precision': this.precision,
+                'limits': this.limits,
+            }, this.fees['trading'], value);
+            if (market['linear']) {
+                market['subType'] = 'linear';
+            } else if (market['inverse']) {
+                market['subType'] = 'inverse';
+            } else {
+                market['subType'] = undefined;
+            }
+            values.push (market);
+        }
+        this.markets = this.indexBy (values, 'symbol') as any;
+        const marketsSortedBySymbol = this.keysort (this.markets);
+        const marketsSortedById = this.keysort (this.markets_by_id);
+        this.symbols = Object.keys (marketsSortedBySymbol);
+        this.ids = Object.keys (marketsSortedById);
+        return values;
+    }
+
     randomBytes (length: number) {
         const rng = new SecureRandom();
         const x:number[] = [];
@@ -2783,45 +2852,17 @@ export default class Exchange {
     }
 
     setMarkets (markets, currencies = undefined) {
-        const values = [];
-        this.markets_by_id = {};
-        // handle marketId conflicts
-        // we insert spot markets first
-        const marketValues = this.sortBy (this.toArray (markets), 'spot', true, true);
-        for (let i = 0; i < marketValues.length; i++) {
-            const value = marketValues[i];
-            if (value['id'] in this.markets_by_id) {
-                (this.markets_by_id[value['id']] as any).push (value);
-            } else {
-                this.markets_by_id[value['id']] = [ value ] as any;
-            }
-            const market = this.deepExtend (this.safeMarketStructure (), {
-                'precision': this.precision,
-                'limits': this.limits,
-            }, this.fees['trading'], value);
-            if (market['linear']) {
-                market['subType'] = 'linear';
-            } else if (market['inverse']) {
-                market['subType'] = 'inverse';
-            } else {
-                market['subType'] = undefined;
-            }
-            values.push (market);
-        }
-        this.markets = this.indexBy (values, 'symbol') as any;
-        const marketsSortedBySymbol = this.keysort (this.markets);
-        const marketsSortedById = this.keysort (this.markets_by_id);
-        this.symbols = Object.keys (marketsSortedBySymbol);
-        this.ids = Object.keys (marketsSortedById);
+        // the markets and the indexes of the markets are built by indexMarkets ()
+        const values = this.indexMarkets (markets);
         if (currencies !== undefined) {
             // currencies is always undefined when called in constructor but not when called from loadMarkets
             this.currencies = this.deepExtend (this.currencies, currencies);
         } else {
             let baseCurrencies = [];
             let quoteCurrencies = [];
+            const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
             for (let i = 0; i < values.length; i++) {
                 const market = values[i];
-                const defaultCurrencyPrecision = (this.precisionMode === DECIMAL_PLACES) ? 8 : this.parseNumber ('1e-8');
                 const marketPrecision = this.safeDict (market, 'precision', {});
                 if ('base' in market) {
                     const currency = this.safeCurrencyStructure ({
@@ -4242,7 +4283,7 @@ export default class Exchange {
     async fetch2 (path, api: any = 'public', method = 'GET', params = {}, headers: any = undefined, body: any = undefined, config = {}) {
         if (this.enableRateLimit) {
             const cost = this.calculateRateLimiterCost (api, method, path, params, config);
-            await this.throttle (cost);
+            await this.throttle (cost, this.rateLimitDebits (api, path, method, cost, config));
         }
         this.lastRestRequestTimestamp = this.milliseconds ();
         const request = this.sign (path, api, method, params, headers, body);
@@ -4645,27 +4686,27 @@ export default class Exchange {
 
     handleOptionAndParams (params: object, methodName: string, optionName: string, defaultValue = undefined) {
         // This method can be used to obtain method specific properties, i.e: this.handleOptionAndParams (params, 'fetchPosition', 'marginMode', 'isolated')
-        const defaultOptionName = 'default' + this.capitalize (optionName); // we also need to check the 'defaultXyzWhatever'
-        // check if params contain the key
-        let value = this.safeValue2 (params, optionName, defaultOptionName);
-        if (value !== undefined) {
-            params = this.omit (params, [ optionName, defaultOptionName ]);
+        // the options are looked up by resolveOption (), we also need to check the 'defaultXyzWhatever'
+        let defaultOptionName = undefined;
+        let value = undefined;
+        [ defaultOptionName, value ] = this.resolveOption (methodName, optionName);
+        if (this.isEmpty (params)) {
+            params = {};
         } else {
-            // handle routed methods like "watchTrades > watchTradesForSymbols" (or "watchTicker > watchTickers")
-            [ methodName, params ] = this.handleParamString (params, 'callerMethodName', methodName);
-            // check if exchange has properties for this method
-            const exchangeWideMethodOptions = this.safeValue (this.options, methodName);
-            if (exchangeWideMethodOptions !== undefined) {
-                // check if the option is defined inside this method's props
-                value = this.safeValue2 (exchangeWideMethodOptions, optionName, defaultOptionName);
+            // check if params contain the key
+            const paramsValue = this.safeValue2 (params, optionName, defaultOptionName);
+            if (paramsValue !== undefined) {
+                return [ paramsValue, this.omit (params, [ optionName, defaultOptionName ]) ];
             }
-            if (value === undefined) {
-                // if it's still undefined, check if global exchange-wide option exists
-                value = this.safeValue2 (this.options, optionName, defaultOptionName);
+            // handle routed methods like "watchTrades > watchTradesForSymbols" (or "watchTicker > watchTickers")
+            let callerMethodName = undefined;
+            [ callerMethodName, params ] = this.handleParamString (params, 'callerMethodName', methodName);
+            if (callerMethodName !== methodName) {
+                [ defaultOptionName, value ] = this.resolveOption (callerMethodName, optionName);
             }
-            // if it's still undefined, use the default value
-            value = (value !== undefined) ? value : defaultValue;
         }
+        // if it's still undefined, use the default value
+        value = (value !== undefined) ? value : defaultValue;
         return [ value, params ];
     }
 
@@ -17,6 +17,7 @@ import {
     // IncrementalIndexedAsks,
     // IncrementalIndexedBids, // check this
 } from './OrderBookSide.js';
+import { OrderBookChecksum } from './OrderBookChecksum.js';
 import { Int, Str } from '../types.js';
 
 // ----------------------------------------------------------------------------
@@ -24,12 +25,15 @@ import { Int, Str } from '../types.js';
 
 interface CustomOrderBookProp  {
     cache: any[];
+    checksum: OrderBookChecksum;
 }
 
 class OrderBook implements CustomOrderBookProp {
 
     cache = [] // make prop visible so we use typed OrderBooks
 
+    checksum: OrderBookChecksum = undefined // see Exchange.orderBookChecksum ()
+
     asks: IOrderBookSide<any>;
 
     bids: IOrderBookSide<any>;
@@ -51,6 +55,13 @@ class OrderBook implements CustomOrderBookProp {
             enumerable: false,
         })
 
+        Object.defineProperty (this, 'checksum', {
+            __proto__: null, // make it invisible
+            value: undefined,
+            writable: true,
+            enumerable: false,
+        })
+
         depth = depth || Number.MAX_SAFE_INTEGER
 
         const defaults = {
@@ -118,6 +129,10 @@ class OrderBook implements CustomOrderBookProp {
         this.timestamp = snapshot.timestamp
         this.datetime = iso8601 (this.timestamp)
         this.symbol = snapshot.symbol
+        if (this.checksum !== undefined) {
+            // the strings of the previous levels
+            this.checksum.clear ()
+        }
         return this
     }
 }
@@ -30,6 +30,7 @@ const SEED = new Float64Array (new Array (SIZE).fill (Number.MAX_VALUE))
 interface IOrderBookSide<T> extends Array<T> {
     store(price: any, size: any);
     storeArray(array: any[]);
+    storeMany(deltas: any[]);
     limit();
 }
 
@@ -47,6 +48,12 @@ class OrderBookSide extends Array implements IOrderBookSide<any> {
             value: depth || Number.MAX_SAFE_INTEGER,
             writable: true,
         })
+        // set when a level is stored or dropped, cleared by OrderBookChecksum.reuse ()
+        Object.defineProperty (this, 'dirty', {
+            __proto__: null, // make it invisible
+            value: true,
+            writable: true,
+        })
         // sort upon initiation
         this.length = 0
         for (let i = 0; i < deltas.length; i++) {
@@ -55,6 +62,7 @@ class OrderBookSide extends Array implements IOrderBookSide<any> {
     }
 
     storeArray (delta) {
+        this.dirty = true
         const price = delta[0]
         const size = delta[1]
         const index_price = this.side ? -price : price
@@ -89,9 +97,17 @@ class OrderBookSide extends Array implements IOrderBookSide<any> {
         this.storeArray ([ price, size ])
     }
 
+    // apply a batch of deltas, e.g. the parsed levels of one message
+    storeMany (deltas) {
+        for (let i = 0; i < deltas.length; i++) {
+            this.storeArray (deltas[i])
+        }
+    }
+
     // replace stored orders with new values
     limit () {
         if (this.length > this.depth) {
+            this.dirty = true
             for (let i = this.depth; i < this.length; i++) {
                 this.index[i] = Number.MAX_VALUE
             }
@@ -112,6 +128,7 @@ class CountedOrderBookSide extends OrderBookSide {
     }
 
     storeArray (delta) {
+        this.dirty = true
         const price = delta[0]
         const size = delta[1]
         const count = delta[2]
@@ -167,6 +184,12 @@ class IndexedOrderBookSide extends Array implements IOrderBookSide<any> {
             value: depth || Number.MAX_SAFE_INTEGER,
             writable: true,
         })
+        // set when a level is stored or dropped, cleared by OrderBookChecksum.reuse ()
+        Object.defineProperty (this, 'dirty', {
+            __proto__: null, // make it invisible
+            value: true,
+            writable: true,
+        })
         // sort upon initiation
         for (let i = 0; i < deltas.length; i++) {
             this.length = i
@@ -179,6 +202,7 @@ class IndexedOrderBookSide extends Array implements IOrderBookSide<any> {
     }
 
     storeArray (delta) {
+        this.dirty = true
         const price = delta[0]
         const size = delta[1]
         const id = delta[2]
@@ -251,9 +275,17 @@ class IndexedOrderBookSide extends Array implements IOrderBookSide<any> {
         }
     }
 
+    // apply a batch of deltas, e.g. the parsed levels of one message
+    storeMany (deltas) {
+        for (let i = 0; i < deltas.length; i++) {
+            this.storeArray (deltas[i])
+        }
+    }
+
     // replace stored orders with new values
     limit () {
         if (this.length > this.depth) {
+            this.dirty = true
             for (let i = this.depth; i < this.length; i++) {
                 // diff
                 this.hashmap.delete (this.index[i])
@@ -13,6 +13,8 @@ export default class binanceus extends binance {
             'countries': [ 'US' ], // US
             'hostname': 'binance.us',
             'rateLimit': 50, // 1200 req per min
+            // the weights of binance.us differ from the ones of binance, its requests are debited from the rateLimit
+            'rateLimitBuckets': undefined,
             'certified': false,
             'pro': true,
             'urls': {
@@ -3462,7 +3462,7 @@ export default class bitmart extends Exchange {
             network = this.safeString (networks, network, network); // handle ERC20>ETH alias
             if (network !== undefined) {
                 request['currency'] += '-' + network; // when network the currency need to be changed to currency + '-' + network https://developer-pro.bitmart.com/en/account/withdraw_apply.html on the end of page
-                currency['code'] = request['currency']; // update currency code to filter
+                currency = this.extend (currency, { 'code': request['currency'] }); // update currency code to filter, on a copy of the shared currency
                 params = this.omit (params, 'network');
             }
         }
@@ -540,7 +540,8 @@ export default class coinbaseinternational extends Exchange {
         //        ....
         //    ]
         //
-        currency['networks'] = this.parseNetworks (rawNetworks);
+        // the currency is replaced, not changed in place, the currencies can be shared with other instances
+        this.currencies[code] = this.extend (currency, { 'networks': this.parseNetworks (rawNetworks) });
     }
 
     parseNetworks (networks, params = {}) {
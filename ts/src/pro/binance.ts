@@ -785,9 +785,13 @@ export default class binance extends binanceRest {
     }
 
     handleDeltas (bookside, deltas) {
+        // parse the whole side first and apply it in one batch
+        const bidAsks = [];
         for (let i = 0; i < deltas.length; i++) {
-            this.handleDelta (bookside, deltas[i]);
+            const delta = deltas[i];
+            bidAsks.push ([ this.safeFloat (delta, 0), this.safeFloat (delta, 1) ]);
         }
+        bookside.storeMany (bidAsks);
     }
 
     handleOrderBookMessage (client: Client, message, orderbook) {
@@ -207,23 +207,38 @@ export default class independentreserve extends independentreserveRest {
             orderbook['datetime'] = this.iso8601 (timestamp);
         }
         const checksum = this.handleOption ('watchOrderBook', 'checksum', true);
-        if (checksum && receivedSnapshot) {
+        const checksumHelper = this.orderBookChecksum (orderbook, 10);
+        if (checksum && receivedSnapshot && checksumHelper.due ()) {
             const storedAsks = orderbook['asks'];
             const storedBids = orderbook['bids'];
-            const asksLength = storedAsks.length;
-            const bidsLength = storedBids.length;
-            let payload = '';
-            for (let i = 0; i < 10; i++) {
-                if (i < bidsLength) {
-                    payload = payload + this.valueToChecksum (storedBids[i][0]) + this.valueToChecksum (storedBids[i][1]);
+            // the top levels did not change since the last verified message
+            let calculatedChecksum = checksumHelper.reuse (storedBids, storedAsks, true);
+            if (calculatedChecksum === undefined) {
+                const asksLength = storedAsks.length;
+                const bidsLength = storedBids.length;
+                let payload = '';
+                for (let i = 0; i < 10; i++) {
+                    if (i < bidsLength) {
+                        const bid = storedBids[i];
+                        let bidStrings = checksumHelper.cached ('bids', bid[0], bid[1]);
+                        if (bidStrings === undefined) {
+                            bidStrings = checksumHelper.store ('bids', bid[0], bid[1], this.valueToChecksum (bid[0]), this.valueToChecksum (bid[1]));
+                        }
+                        payload = payload + bidStrings[0] + bidStrings[1];
+                    }
                 }
-            }
-            for (let i = 0; i < 10; i++) {
-                if (i < asksLength) {
-                    payload = payload + this.valueToChecksum (storedAsks[i][0]) + this.valueToChecksum (storedAsks[i][1]);
+                for (let i = 0; i < 10; i++) {
+                    if (i < asksLength) {
+                        const ask = storedAsks[i];
+                        let askStrings = checksumHelper.cached ('asks', ask[0], ask[1]);
+                        if (askStrings === undefined) {
+                            askStrings = checksumHelper.store ('asks', ask[0], ask[1], this.valueToChecksum (ask[0]), this.valueToChecksum (ask[1]));
+                        }
+                        payload = payload + askStrings[0] + askStrings[1];
+                    }
                 }
+                calculatedChecksum = checksumHelper.crc32 (payload, true);
             }
-            const calculatedChecksum = this.crc32 (payload, true);
             const responseChecksum = this.safeInteger (orderBook, 'Crc32');
             if (calculatedChecksum !== responseChecksum) {
                 const error = new ChecksumError (this.id + ' ' + this.orderbookChecksumMessage (symbol));
@@ -771,26 +771,41 @@ export default class kraken extends krakenRest {
             // don't remove this line or I will poop on your face
             orderbook.limit ();
             const checksum = this.handleOption ('watchOrderBook', 'checksum', true);
-            if (checksum) {
+            const checksumHelper = this.orderBookChecksum (orderbook, 10);
+            if (checksum && checksumHelper.due ()) {
                 const priceString = this.safeString (example, 0);
                 const amountString = this.safeString (example, 1);
                 const priceParts = priceString.split ('.');
                 const amountParts = amountString.split ('.');
                 const priceLength = priceParts[1].length - 0;
                 const amountLength = amountParts[1].length - 0;
-                const payloadArray = [];
-                if (c !== undefined) {
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedAsks[i][0], priceLength) + this.formatNumber (storedAsks[i][1], amountLength);
-                        payloadArray.push (formatted);
-                    }
-                    for (let i = 0; i < 10; i++) {
-                        const formatted = this.formatNumber (storedBids[i][0], priceLength) + this.formatNumber (storedBids[i][1], amountLength);
-                        payloadArray.push (formatted);
+                // the formatted levels are cached until the number of decimals changes
+                checksumHelper.track (this.numberToString (priceLength) + ':' + this.numberToString (amountLength));
+                // the top levels did not change since the last verified message
+                let localChecksum = checksumHelper.reuse (storedBids, storedAsks, false);
+                if (localChecksum === undefined) {
+                    const payloadArray = [];
+                    if (c !== undefined) {
+                        for (let i = 0; i < 10; i++) {
+                            const ask = storedAsks[i];
+                            let askStrings = checksumHelper.cached ('asks', ask[0], ask[1]);
+                            if (askStrings === undefined) {
+                                askStrings = checksumHelper.store ('asks', ask[0], ask[1], this.formatNumber (ask[0], priceLength), this.formatNumber (ask[1], amountLength));
+                            }
+                            payloadArray.push (askStrings[0] + askStrings[1]);
+                        }
+                        for (let i = 0; i < 10; i++) {
+                            const bid = storedBids[i];
+                            let bidStrings = checksumHelper.cached ('bids', bid[0], bid[1]);
+                            if (bidStrings === undefined) {
+                                bidStrings = checksumHelper.store ('bids', bid[0], bid[1], this.formatNumber (bid[0], priceLength), this.formatNumber (bid[1], amountLength));
+                            }
+                            payloadArray.push (bidStrings[0] + bidStrings[1]);
+                        }
                     }
+                    const payload = payloadArray.join ('');
+                    localChecksum = checksumHelper.crc32 (payload, false);
                 }
-                const payload = payloadArray.join ('');
-                const localChecksum = this.crc32 (payload, false);
                 if (localChecksum !== c) {
                     const error = new ChecksumError (this.id + ' ' + this.orderbookChecksumMessage (symbol));
                     delete client.subscriptions[messageHash];